@@ -37,6 +37,8 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "channels",
+    "games",
 ]
 
 MIDDLEWARE = [
@@ -68,6 +70,33 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = "app.wsgi.application"
+ASGI_APPLICATION = "app.asgi.application"
+
+CHANNEL_LAYERS = {
+    "default": {
+        "BACKEND": "channels_redis.core.RedisChannelLayer",
+        "CONFIG": {
+            "hosts": [
+                (
+                    os.environ.get("REDIS_HOST", "redis"),
+                    int(os.environ.get("REDIS_PORT", 6379)),
+                )
+            ]
+        },
+    }
+}
+
+GAME_STORE_URL = os.environ.get("GAME_STORE_URL")
+
+TABLEBASE_PATH = os.environ.get("TABLEBASE_PATH")
+OPENING_BOOK_PATH = os.environ.get("OPENING_BOOK_PATH")
+ANALYSIS_CACHE_SIZE = int(os.environ.get("ANALYSIS_CACHE_SIZE", 4096))
+ANALYSIS_CACHE_TTL = float(os.environ.get("ANALYSIS_CACHE_TTL", 300))
+
+CHECKERS_METRICS = os.environ.get("CHECKERS_METRICS") == "1"
+CHECKERS_METRICS_LOG_INTERVAL = float(
+    os.environ.get("CHECKERS_METRICS_LOG_INTERVAL", 0)
+)
 
 
 # Database
@@ -13,7 +13,14 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+
 from django.contrib import admin
 from django.urls import path
 
-urlpatterns = [path("admin/", admin.site.urls)]
+from games import views
+
+urlpatterns = [
+    path("admin/", admin.site.urls),
+    path("api/analyze", views.analyze, name="analyze"),
+    path("metrics", views.metrics, name="metrics"),
+]
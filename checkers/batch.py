@@ -0,0 +1,163 @@
+from typing import Iterable, Union
+
+import numpy as np
+
+from .bitboard import (
+    BLACK_MAN_DIRS,
+    WHITE_MAN_DIRS,
+    BitboardCheckersBoard,
+    _dark_squares,
+    _geometry,
+    _row_mask,
+)
+from .board import Board
+from .codec import NIBBLES, playable_squares, position_size
+from .engine import ADVANCEMENT_VALUE, KING_VALUE, MAN_VALUE, MOBILITY_VALUE
+from .piece import BLACK
+
+WHITE_COLUMN, BLACK_COLUMN, KINGS_COLUMN, TURN_COLUMN = range(4)
+FEATURES = ("material", "kings", "advancement", "mobility")
+WEIGHTS = np.array(
+    [MAN_VALUE, KING_VALUE, ADVANCEMENT_VALUE, MOBILITY_VALUE], dtype=np.int64
+)
+
+
+def _check_dim(dim: int):
+    if dim > 8:
+        raise ValueError("Batch positions hold at most 64 squares")
+
+
+def _popcount(bb: np.ndarray) -> np.ndarray:
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(bb).astype(np.int64)
+    bits = np.unpackbits(bb.view(np.uint8).reshape(-1, 8), axis=1)
+    return bits.sum(axis=1, dtype=np.int64)
+
+
+def _step(bb: np.ndarray, shift_mask) -> np.ndarray:
+    shift, mask = shift_mask
+    bb = bb & np.uint64(mask)
+    if shift > 0:
+        return bb << np.uint64(shift)
+    return bb >> np.uint64(-shift)
+
+
+def encode_boards(boards: Iterable[Board]) -> np.ndarray:
+    rows = []
+    for board in boards:
+        _check_dim(board.dim)
+        bitboards = board
+        if not isinstance(board, BitboardCheckersBoard):
+            bitboards = BitboardCheckersBoard.from_ascii(str(board), dim=board.dim)
+        rows.append(
+            (bitboards.white, bitboards.black, bitboards.kings, board.turn is BLACK)
+        )
+    return np.array(rows, dtype=np.uint64).reshape(-1, 4)
+
+
+def decode_positions(data: Union[bytes, np.ndarray], dim: int = 8) -> np.ndarray:
+    _check_dim(dim)
+    size = position_size(dim)
+    raw = np.frombuffer(data, dtype=np.uint8) if isinstance(data, bytes) else data
+    raw = np.asarray(raw, dtype=np.uint8).reshape(-1, size)
+    squares = raw[:, : size - 1]
+    codes = np.concatenate([squares >> 4, squares & 0x0F], axis=1)
+    if (codes >= len(NIBBLES)).any():
+        raise ValueError("Invalid square code")
+    if (raw[:, size - 1] > 1).any():
+        raise ValueError("Invalid side to move")
+    positions = np.zeros((len(raw), 4), dtype=np.uint64)
+    for i, (x, y) in enumerate(playable_squares(dim)):
+        byte = raw[:, i // 2]
+        codes = byte >> 4 if i % 2 == 0 else byte & 0x0F
+        bit = np.uint64(1 << (x * dim + y))
+        for code, char in enumerate(NIBBLES):
+            on = np.where(codes == code, bit, np.uint64(0))
+            if char in "xX":
+                positions[:, WHITE_COLUMN] |= on
+            elif char in "oO":
+                positions[:, BLACK_COLUMN] |= on
+            if char in "XO":
+                positions[:, KINGS_COLUMN] |= on
+    positions[:, TURN_COLUMN] = raw[:, size - 1]
+    return positions
+
+
+def _mobility(men, kings, empty, dim: int, dirs) -> np.ndarray:
+    geometry = _geometry(dim)
+    count = np.zeros(len(men), dtype=np.int64)
+    for direction in dirs:
+        count += _popcount(_step(men, geometry[direction]) & empty)
+    for direction in geometry:
+        sliding = _step(kings, geometry[direction]) & empty
+        while sliding.any():
+            count += _popcount(sliding)
+            sliding = _step(sliding, geometry[direction]) & empty
+    return count
+
+
+def features(positions: np.ndarray, dim: int = 8) -> np.ndarray:
+    _check_dim(dim)
+    positions = np.asarray(positions, dtype=np.uint64).reshape(-1, 4)
+    white = positions[:, WHITE_COLUMN]
+    black = positions[:, BLACK_COLUMN]
+    kings = positions[:, KINGS_COLUMN]
+    empty = np.uint64(_dark_squares(dim)) & ~(white | black)
+    white_men, black_men = white & ~kings, black & ~kings
+    white_kings, black_kings = white & kings, black & kings
+
+    result = np.empty((len(positions), len(FEATURES)), dtype=np.int64)
+    result[:, 0] = _popcount(white_men) - _popcount(black_men)
+    result[:, 1] = _popcount(white_kings) - _popcount(black_kings)
+    advancement = np.zeros(len(positions), dtype=np.int64)
+    for x in range(dim):
+        row = np.uint64(_row_mask(dim, x))
+        advancement += (dim - 1 - x) * _popcount(white_men & row)
+        advancement -= x * _popcount(black_men & row)
+    result[:, 2] = advancement
+    result[:, 3] = _mobility(
+        white_men, white_kings, empty, dim, WHITE_MAN_DIRS
+    ) - _mobility(black_men, black_kings, empty, dim, BLACK_MAN_DIRS)
+    return result
+
+
+def evaluate(positions: np.ndarray, dim: int = 8) -> np.ndarray:
+    positions = np.asarray(positions, dtype=np.uint64).reshape(-1, 4)
+    scores = features(positions, dim) @ WEIGHTS
+    return np.where(positions[:, TURN_COLUMN] == 0, scores, -scores)
+
+
+def _side_to_move(positions: np.ndarray, dim: int):
+    positions = np.asarray(positions, dtype=np.uint64).reshape(-1, 4)
+    white = positions[:, WHITE_COLUMN]
+    black = positions[:, BLACK_COLUMN]
+    kings = positions[:, KINGS_COLUMN]
+    black_to_move = positions[:, TURN_COLUMN] != 0
+    own = np.where(black_to_move, black, white)
+    opponents = np.where(black_to_move, white, black)
+    empty = np.uint64(_dark_squares(dim)) & ~(white | black)
+    return own & ~kings, own & kings, opponents, empty, black_to_move
+
+
+def capture_flags(positions: np.ndarray, dim: int = 8) -> np.ndarray:
+    _check_dim(dim)
+    men, kings, opponents, empty, _ = _side_to_move(positions, dim)
+    landings = np.zeros(len(men), dtype=np.uint64)
+    for shift_mask in _geometry(dim).values():
+        landings |= _step(_step(men, shift_mask) & opponents, shift_mask) & empty
+        ray = _step(kings, shift_mask)
+        while ray.any():
+            landings |= _step(ray & opponents, shift_mask) & empty
+            ray = _step(ray & empty, shift_mask)
+    return landings != 0
+
+
+def simple_move_counts(positions: np.ndarray, dim: int = 8) -> np.ndarray:
+    _check_dim(dim)
+    men, kings, _, empty, black_to_move = _side_to_move(positions, dim)
+    none = np.zeros_like(men)
+    white_men = np.where(black_to_move, none, men)
+    black_men = np.where(black_to_move, men, none)
+    return _mobility(white_men, kings, empty, dim, WHITE_MAN_DIRS) + _mobility(
+        black_men, none, empty, dim, BLACK_MAN_DIRS
+    )
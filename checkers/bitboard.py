@@ -0,0 +1,371 @@
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .board import Board, CheckersBoard, Move, MoveDelta, UndoRecord, select_move
+from .zobrist import zobrist_keys, PIECE_CHARS
+from .piece import (
+    char_to_piece,
+    color_to_char,
+    Color,
+    White,
+    InaccessibleField,
+    Piece,
+    FlyingKing,
+    WHITE,
+    BLACK,
+)
+
+DIRS = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+WHITE_MAN_DIRS = ((-1, 1), (-1, -1))
+BLACK_MAN_DIRS = ((1, 1), (1, -1))
+
+
+@lru_cache(maxsize=None)
+def _geometry(dim: int) -> Dict[Tuple[int, int], Tuple[int, int]]:
+    # Square (x, y) lives in bit x * dim + y, so a diagonal step is a shift by
+    # dx * dim + dy applied to the squares that stay on the board after it.
+    geometry = {}
+    for dx, dy in DIRS:
+        mask = 0
+        for x in range(dim):
+            for y in range(dim):
+                if 0 <= x + dx < dim and 0 <= y + dy < dim:
+                    mask |= 1 << (x * dim + y)
+        geometry[dx, dy] = (dx * dim + dy, mask)
+    return geometry
+
+
+@lru_cache(maxsize=None)
+def _dark_squares(dim: int) -> int:
+    return sum(
+        1 << (x * dim + y) for x in range(dim) for y in range(dim) if (x + y) % 2
+    )
+
+
+@lru_cache(maxsize=None)
+def _row_mask(dim: int, x: int) -> int:
+    return ((1 << dim) - 1) << (x * dim)
+
+
+def _step(bb: int, shift_mask: Tuple[int, int]) -> int:
+    shift, mask = shift_mask
+    bb &= mask
+    return bb << shift if shift > 0 else bb >> -shift
+
+
+def _squares(bb: int) -> Iterator[int]:
+    while bb:
+        lowest = bb & -bb
+        yield lowest.bit_length() - 1
+        bb ^= lowest
+
+
+class BitboardCheckersBoard(Board):
+    def __init__(self, board: List[List], dim=8):
+        white = black = kings = empty = 0
+        for x, row in enumerate(board):
+            for y, field in enumerate(row):
+                bit = 1 << (x * dim + y)
+                if isinstance(field, Piece):
+                    if isinstance(field.color, White):
+                        white |= bit
+                    else:
+                        black |= bit
+                    if isinstance(field, FlyingKing):
+                        kings |= bit
+                elif not isinstance(field, InaccessibleField):
+                    empty |= bit
+        self._set_position(white, black, kings, empty, dim)
+
+    @classmethod
+    def from_bitboards(
+        cls, white: int, black: int, kings: int, dim: int = 8
+    ) -> "BitboardCheckersBoard":
+        board = cls.__new__(cls)
+        empty = _dark_squares(dim) & ~(white | black)
+        board._set_position(white, black, kings, empty, dim)
+        return board
+
+    def _set_position(self, white: int, black: int, kings: int, empty: int, dim: int):
+        self.white = white
+        self.black = black
+        self.kings = kings
+        self.empty = empty
+        self.dim = dim
+        self._geometry = _geometry(dim)
+        self._legal_moves: Dict[str, Tuple[Tuple[int, int, int], List[Move]]] = {}
+        self._zobrist = zobrist_keys(dim)
+        self._turn = WHITE
+        self.zobrist_hash = self._zobrist.hash(
+            ((square, self._char_at(square)) for square in _squares(white | black)),
+            black_to_move=False,
+        )
+
+    @property
+    def white_men(self) -> int:
+        return self.white & ~self.kings
+
+    @property
+    def black_men(self) -> int:
+        return self.black & ~self.kings
+
+    def _square(self, key: Tuple[int, str]) -> int:
+        row, col = key
+        if len(col) != 1 or not (0 < row <= self.dim):
+            raise ValueError
+        x, y = self._cord2idx(row, col)
+        if not (0 <= y < self.dim):
+            raise ValueError
+        return x * self.dim + y
+
+    def _coord(self, square: int) -> Tuple[int, int]:
+        return divmod(square, self.dim)
+
+    def _char_at(self, square: int) -> str:
+        bit = 1 << square
+        if bit & self.white:
+            return "X" if bit & self.kings else "x"
+        if bit & self.black:
+            return "O" if bit & self.kings else "o"
+        if bit & self.empty:
+            return " "
+        return "-"
+
+    def __getitem__(self, key):
+        return char_to_piece[self._char_at(self._square(key))]
+
+    def __setitem__(self, key, val):
+        bit = 1 << self._square(key)
+        self._put_char(bit, str(val))
+
+    def _put_char(self, bit: int, char: str):
+        square = bit.bit_length() - 1
+        old_char = self._char_at(square)
+        if old_char in PIECE_CHARS:
+            self.zobrist_hash ^= self._zobrist.pieces[old_char][square]
+        if char in PIECE_CHARS:
+            self.zobrist_hash ^= self._zobrist.pieces[char][square]
+        self.white &= ~bit
+        self.black &= ~bit
+        self.kings &= ~bit
+        self.empty &= ~bit
+        if char in "xX":
+            self.white |= bit
+        elif char in "oO":
+            self.black |= bit
+        elif char == " ":
+            self.empty |= bit
+        if char in "XO":
+            self.kings |= bit
+
+    def __str__(self):
+        rows = [
+            "".join(self._char_at(x * self.dim + y) for y in range(self.dim))
+            for x in range(self.dim)
+        ]
+        return "\n" + "\n".join(rows) + "\n"
+
+    def __iter__(self):
+        return iter(
+            char_to_piece[self._char_at(square)]
+            for square in _squares(self.white | self.black)
+        )
+
+    def any_pieces_left(self, color: Color) -> bool:
+        return bool(self._pieces(color))
+
+    def _pieces(self, color: Color) -> int:
+        return self.white if isinstance(color, White) else self.black
+
+    def _opponent_pieces(self, color: Color) -> int:
+        return self.black if isinstance(color, White) else self.white
+
+    def move(self, move: Move) -> MoveDelta:
+        return MoveDelta.from_record(self, self.make_move(move))
+
+    def make_move(self, move: Move) -> UndoRecord:
+        start = self._square(move.start)
+        end = self._square(move.end)
+        start_bit = 1 << start
+        if not start_bit & (self.white | self.black):
+            raise TypeError("One can move only pieces")
+        if end != start and not (1 << end) & self.empty:
+            raise TypeError("The field is not accessable")
+        color = WHITE if start_bit & self.white else BLACK
+        legal_moves = self.legal_moves(color)
+        if move not in legal_moves:
+            if move in self._moves_from(start, color):
+                raise ValueError("Other move has higher precedence")
+            raise ValueError("Invalid move")
+        return self._apply(select_move(legal_moves, move, self.dim))
+
+    def unmake_move(self, record: UndoRecord):
+        self._put_char(1 << self._square(record.move.end), " ")
+        self._put_char(1 << self._square(record.move.start), str(record.piece))
+        for (x, y), piece in record.captured:
+            self._put_char(1 << (x * self.dim + y), str(piece))
+        self.turn = record.turn
+
+    def _apply(self, move: Move) -> UndoRecord:
+        start, end = self._square(move.start), self._square(move.end)
+        start_bit, end_bit = 1 << start, 1 << end
+        is_white = bool(start_bit & self.white)
+        is_king = bool(start_bit & self.kings)
+        char = self._char_at(start)
+        piece = char_to_piece[char]
+        keys = self._zobrist.pieces
+        captured = []
+        captured_bits = 0
+        for x, y in move.captured:
+            square = x * self.dim + y
+            captured_char = self._char_at(square)
+            captured.append(((x, y), char_to_piece[captured_char]))
+            captured_bits |= 1 << square
+            self.zobrist_hash ^= keys[captured_char][square]
+        if is_white:
+            self.white = (self.white & ~start_bit) | end_bit
+            self.black &= ~captured_bits
+        else:
+            self.black = (self.black & ~start_bit) | end_bit
+            self.white &= ~captured_bits
+        self.kings &= ~(start_bit | captured_bits)
+        promotion_row = _row_mask(self.dim, 0 if is_white else self.dim - 1)
+        promoted = not is_king and bool(end_bit & promotion_row)
+        if is_king or promoted:
+            self.kings |= end_bit
+        self.empty = (self.empty | start_bit | captured_bits) & ~end_bit
+        end_char = char.upper() if promoted else char
+        self.zobrist_hash ^= keys[char][start] ^ keys[end_char][end]
+        turn = self.turn
+        self.turn = BLACK if is_white else WHITE
+        return UndoRecord(move, piece, captured, turn, promoted)
+
+    def legal_moves(self, color: Color) -> List[Move]:
+        position = (self.white, self.black, self.kings)
+        cached = self._legal_moves.get(color.char)
+        if cached is None or cached[0] != position:
+            cached = (position, self._generate_legal_moves(color))
+            self._legal_moves[color.char] = cached
+        return cached[1]
+
+    def _generate_legal_moves(self, color: Color) -> List[Move]:
+        captures = []
+        for square in _squares(self._pieces(color)):
+            captures.extend(self._captures_from(square, color))
+        if captures:
+            best = max(len(m.captured) for m in captures)
+            return [m for m in captures if len(m.captured) == best]
+        return self._simple_moves(color)
+
+    def _moves_from(self, square: int, color: Color) -> List[Move]:
+        captures = self._captures_from(square, color)
+        if captures:
+            return captures
+        return self._simple_moves(color, sources=1 << square)
+
+    def _simple_moves(self, color: Color, sources: Optional[int] = None) -> List[Move]:
+        own = self._pieces(color) if sources is None else sources
+        men = own & ~self.kings
+        kings = own & self.kings
+        moves = []
+        for direction in WHITE_MAN_DIRS if isinstance(color, White) else BLACK_MAN_DIRS:
+            shift_mask = self._geometry[direction]
+            targets = _step(men, shift_mask) & self.empty
+            for target in _squares(targets):
+                moves.append(self._make_move(target - shift_mask[0], target))
+        for king in _squares(kings):
+            for direction in DIRS:
+                shift_mask = self._geometry[direction]
+                bit = _step(1 << king, shift_mask)
+                while bit & self.empty:
+                    moves.append(self._make_move(king, bit.bit_length() - 1))
+                    bit = _step(bit, shift_mask)
+        return moves
+
+    def _captures_from(self, square: int, color: Color) -> List[Move]:
+        start_bit = 1 << square
+        sequences = self._capture_sequences(
+            square,
+            opponents=self._opponent_pieces(color),
+            empty=self.empty | start_bit,
+            is_king=bool(start_bit & self.kings),
+            captured=0,
+            path=(),
+        )
+        if not sequences:
+            return []
+        best = max(len(path) for path, _ in sequences)
+        return [
+            self._make_move(square, end, [self._coord(c) for c in path])
+            for path, end in sequences
+            if len(path) == best
+        ]
+
+    def _capture_sequences(
+        self,
+        square: int,
+        opponents: int,
+        empty: int,
+        is_king: bool,
+        captured: int,
+        path: Tuple[int, ...],
+    ) -> List[Tuple[Tuple[int, ...], int]]:
+        sequences = []
+        for direction in DIRS:
+            shift_mask = self._geometry[direction]
+            bit = _step(1 << square, shift_mask)
+            if is_king:
+                while bit & empty:
+                    bit = _step(bit, shift_mask)
+            if not bit & opponents & ~captured:
+                continue
+            over = bit
+            landing = _step(over, shift_mask) & empty
+            while landing:
+                further = self._capture_sequences(
+                    landing.bit_length() - 1,
+                    opponents,
+                    empty,
+                    is_king,
+                    captured | over,
+                    path + (over.bit_length() - 1,),
+                )
+                sequences.extend(further)
+                if not is_king:
+                    break
+                landing = _step(landing, shift_mask) & empty
+        if not sequences and path:
+            return [(path, square)]
+        return sequences
+
+    def _make_move(
+        self, start: int, end: int, captured: Optional[List[Tuple[int, int]]] = None
+    ) -> Move:
+        return Move(
+            start=self._ind2cord(self._coord(start)),
+            end=self._ind2cord(self._coord(end)),
+            captured=captured,
+        )
+
+    def to_checkers_notation(self) -> Dict[int, Optional[str]]:
+        checkers_notation = {}
+        for i in range(1, 33):
+            x, y = CheckersBoard._checkers_notation_to_coord(i)
+            bit = 1 << (x * self.dim + y)
+            if bit & self.white:
+                checkers_notation[i] = WHITE.name
+            elif bit & self.black:
+                checkers_notation[i] = BLACK.name
+            else:
+                checkers_notation[i] = None
+        return checkers_notation
+
+    @classmethod
+    def from_checkers_notation(
+        cls, checkers_notation: Dict[int, Optional[str]]
+    ) -> "BitboardCheckersBoard":
+        board = cls.from_ascii()
+        for idx, piece in checkers_notation.items():
+            x, y = CheckersBoard._checkers_notation_to_coord(idx)
+            board._put_char(1 << (x * board.dim + y), color_to_char[piece])
+        return board
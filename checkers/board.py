@@ -1,13 +1,16 @@
 from .piece import (
     char_to_piece,
     Piece,
-    AccessibleField,
     Man,
     FlyingKing,
     Color,
-    White,
     color_to_char,
+    ACCESSIBLE_FIELD,
+    WHITE,
+    BLACK,
 )
+from .diagonals import diagonal_tables
+from .zobrist import zobrist_keys
 from typing import Tuple, Iterable, List, Optional, Dict
 
 init_board = """
@@ -28,21 +31,105 @@ class Move:
         start: Tuple[int, str],
         end: Tuple[int, str],
         captured: Optional[List[Tuple]] = None,
+        path: Optional[List[Tuple[int, str]]] = None,
     ):
         self.start = start
         self.end = end
         self.captured = captured or []
+        self.path = path
 
     def __eq__(self, other):
         return self.start == other.start and self.end == other.end
 
 
+def _follows_path(move: Move, path: List[Tuple[int, str]], dim: int) -> bool:
+    if len(move.captured) != len(path) - 1:
+        return False
+    landings = [(dim - row, ord(col) - ord("A")) for row, col in path]
+    for (x, y), (x0, y0), (x1, y1) in zip(move.captured, landings, landings[1:]):
+        if abs(x - x0) != abs(y - y0):
+            return False
+        if not (min(x0, x1) < x < max(x0, x1) and min(y0, y1) < y < max(y0, y1)):
+            return False
+    return True
+
+
+def select_move(moves: List[Move], move: Move, dim: int = 8) -> Move:
+    matching = [m for m in moves if m == move]
+    for m in matching:
+        if sorted(m.captured) == sorted(move.captured):
+            return m
+    if move.path:
+        for m in matching:
+            if _follows_path(m, move.path, dim):
+                return m
+    return matching[0]
+
+
 class Capture:
     def __init__(self, opponent_position, end_position):
         self.opponent_position = opponent_position
         self.end_position = end_position
 
 
+class UndoRecord:
+    def __init__(
+        self,
+        move: Move,
+        piece: Piece,
+        captured: List[Tuple[Tuple[int, int], Piece]],
+        turn: Color,
+        promoted: bool = False,
+    ):
+        self.move = move
+        self.piece = piece
+        self.captured = captured
+        self.turn = turn
+        self.promoted = promoted
+
+
+class MoveDelta:
+    def __init__(
+        self,
+        start: int,
+        end: int,
+        color: str,
+        captured: Optional[List[int]] = None,
+        promoted: bool = False,
+    ):
+        self.start = start
+        self.end = end
+        self.color = color
+        self.captured = captured or []
+        self.promoted = promoted
+
+    @classmethod
+    def from_record(cls, board: "Board", record: UndoRecord) -> "MoveDelta":
+        to_square = CheckersBoard._coord_to_checkers_notation
+        return cls(
+            to_square(*board._cord2idx(*record.move.start)),
+            to_square(*board._cord2idx(*record.move.end)),
+            record.piece.color.name,
+            [to_square(x, y) for (x, y), _ in record.captured],
+            record.promoted,
+        )
+
+    def to_dict(self) -> Dict:
+        return {
+            "from": self.start,
+            "to": self.end,
+            "color": self.color,
+            "captured": self.captured,
+            "promoted": self.promoted,
+        }
+
+    def apply(self, checkers_notation: Dict[int, Optional[str]]):
+        checkers_notation[self.start] = None
+        for square in self.captured:
+            checkers_notation[square] = None
+        checkers_notation[self.end] = self.color
+
+
 class Board:
     def _cord2idx(self, row: int, col: str) -> Tuple[int, int]:
         x = self.dim - row
@@ -63,7 +150,7 @@ class Board:
         for i, row in enumerate(rows):
             board_row = []
             for j, c in enumerate(row):
-                field = char_to_piece[c]()
+                field = char_to_piece[c]
                 board_row.append(field)
             if len(board_row) != dim:
                 raise ValueError
@@ -72,9 +159,42 @@ class Board:
             raise ValueError
         return cls(board, dim=dim)
 
+    @classmethod
+    def from_bytes(cls, data: bytes, dim: int = 8):
+        from .codec import decode_position
+
+        return decode_position(data, dim=dim, cls=cls)
+
+    def to_bytes(self) -> bytes:
+        from .codec import encode_position
+
+        return encode_position(self)
+
     def __init__(self, board: List[List], dim=8):
         self._board = board
         self.dim = dim
+        self._tables = diagonal_tables(dim)
+        self._zobrist = zobrist_keys(dim)
+        self._turn: Color = WHITE
+        self.zobrist_hash = self._zobrist.hash(
+            (
+                (x * dim + y, str(piece))
+                for x, row in enumerate(board)
+                for y, piece in enumerate(row)
+                if isinstance(piece, Piece)
+            ),
+            black_to_move=False,
+        )
+
+    @property
+    def turn(self) -> Color:
+        return self._turn
+
+    @turn.setter
+    def turn(self, color: Color):
+        if color != self._turn:
+            self.zobrist_hash ^= self._zobrist.black_to_move
+        self._turn = color
 
     def __getitem__(self, key):
         row, col = key
@@ -88,6 +208,14 @@ class Board:
         if len(col) != 1 or not (0 < row <= self.dim):
             raise ValueError
         x, y = self._cord2idx(row, col)
+        self._put(x, y, val)
+
+    def _put(self, x: int, y: int, val):
+        square = x * self.dim + y
+        if isinstance(self._board[x][y], Piece):
+            self.zobrist_hash ^= self._zobrist.pieces[str(self._board[x][y])][square]
+        if isinstance(val, Piece):
+            self.zobrist_hash ^= self._zobrist.pieces[str(val)][square]
         self._board[x][y] = val
 
     def __str__(self):
@@ -104,57 +232,99 @@ class Board:
         return iter(only_pieces)
 
     def any_pieces_left(self, color: Color) -> bool:
-        return any(piece.color == color for piece in self)
+        return any(piece.color is color for piece in self)
+
+    def apply_many(
+        self,
+        moves: Iterable[Move],
+        validate: bool = True,
+        records: Optional[List[UndoRecord]] = None,
+    ) -> Optional[int]:
+        for index, move in enumerate(moves):
+            if validate:
+                legal_moves = self.legal_moves(self.turn)
+                if move not in legal_moves:
+                    return index
+                move = select_move(legal_moves, move, self.dim)
+            record = self._apply(move)
+            if records is not None:
+                records.append(record)
+        return None
 
 
 class CheckersBoard(Board):
-    def move(self, move: Move):
+    def __init__(self, board: List[List], dim=8):
+        super().__init__(board, dim=dim)
+        self._legal_moves: Dict[str, List[Move]] = {}
+
+    def _put(self, x: int, y: int, val):
+        super()._put(x, y, val)
+        self._legal_moves.clear()
+
+    def legal_moves(self, color: Color) -> List[Move]:
+        if color.char not in self._legal_moves:
+            self._legal_moves[color.char] = self._generate_legal_moves(color)
+        return self._legal_moves[color.char]
+
+    def _generate_legal_moves(self, color: Color) -> List[Move]:
+        all_moves = []
+        for x, row in enumerate(self._board):
+            for y, piece in enumerate(row):
+                if not isinstance(piece, Piece) or piece.color is not color:
+                    continue
+                self._board[x][y] = ACCESSIBLE_FIELD
+                all_moves.extend(self._possible_moves(self._ind2cord((x, y)), piece))
+                self._board[x][y] = piece
+        max_capture = max((len(m.captured) for m in all_moves), default=0)
+        return [m for m in all_moves if len(m.captured) == max_capture]
+
+    def move(self, move: Move) -> MoveDelta:
+        return MoveDelta.from_record(self, self.make_move(move))
+
+    def make_move(self, move: Move) -> UndoRecord:
         moving_piece = self[move.start]
         if not isinstance(moving_piece, Piece):
             raise TypeError("One can move only pieces")
-        forced_move = self._move_with_highest_precedence(moving_piece)
-        self[move.start] = AccessibleField()
-        if self[move.end] != AccessibleField():
+        if move.end != move.start and self[move.end] is not ACCESSIBLE_FIELD:
             raise TypeError("The field is not accessable")
-        possible_moves = self._possible_moves(move.start, moving_piece)
-        if move not in possible_moves:
+        legal_moves = self.legal_moves(moving_piece.color)
+        if move not in legal_moves:
+            self[move.start] = ACCESSIBLE_FIELD
+            possible_moves = self._possible_moves(move.start, moving_piece)
             self[move.start] = moving_piece
-            raise ValueError("Invalid move")
-        for m in possible_moves:
-            if m != move:
-                continue
-            if forced_move and len(m.captured) < len(forced_move.captured):
-                self[move.start] = moving_piece
+            if move in possible_moves:
                 raise ValueError("Other move has higher precedence")
-            self[m.end] = moving_piece
-            for captured in m.captured:
-                x, y = captured
-                self._board[x][y] = AccessibleField()
-            self._try_convert_to_flying_king(m.end)
-
-    def _move_with_highest_precedence(self, moving_piece) -> Optional[Move]:
-        all_moves = []
-        for x, row in enumerate(self._board):
-            for y, piece in enumerate(row):
-                if piece is moving_piece:
-                    continue
-                if not isinstance(piece, Piece):
-                    continue
-                if piece.color != moving_piece.color:
-                    continue
-                moves = self._possible_moves(self._ind2cord((x, y)), piece)
-                moves = [m for m in moves if m.captured is not None]
-                all_moves.extend(moves)
-        return (
-            max(all_moves, key=lambda move: len(move.captured)) if all_moves else None
-        )
+            raise ValueError("Invalid move")
+        return self._apply(select_move(legal_moves, move, self.dim))
 
-    def _try_convert_to_flying_king(self, end_position: Tuple[int, str]):
+    def _apply(self, move: Move) -> UndoRecord:
+        moving_piece = self[move.start]
+        turn = self.turn
+        self[move.start] = ACCESSIBLE_FIELD
+        self[move.end] = moving_piece
+        captured = []
+        for x, y in move.captured:
+            captured.append(((x, y), self._board[x][y]))
+            self._put(x, y, ACCESSIBLE_FIELD)
+        promoted = self._try_convert_to_flying_king(move.end)
+        self.turn = BLACK if moving_piece.color is WHITE else WHITE
+        return UndoRecord(move, moving_piece, captured, turn, promoted)
+
+    def unmake_move(self, record: UndoRecord):
+        self[record.move.end] = ACCESSIBLE_FIELD
+        self[record.move.start] = record.piece
+        for (x, y), piece in record.captured:
+            self._put(x, y, piece)
+        self.turn = record.turn
+
+    def _try_convert_to_flying_king(self, end_position: Tuple[int, str]) -> bool:
         if not isinstance(self[end_position], Man):
-            return
-        end_of_board = self.dim if self[end_position].color == White() else 1
-        if end_position[0] == end_of_board:
-            self[end_position] = FlyingKing(color=self[end_position].color)
+            return False
+        end_of_board = self.dim if self[end_position].color is WHITE else 1
+        if end_position[0] != end_of_board:
+            return False
+        self[end_position] = FlyingKing(color=self[end_position].color)
+        return True
 
     def _possible_moves(self, start: Tuple[int, str], piece) -> Iterable[Move]:
         x, y = self._cord2idx(*start)
@@ -205,24 +375,17 @@ class CheckersBoard(Board):
     def _can_capture_as_flying_king_from(
         self, x: int, y: int, color: Optional[Color] = None
     ) -> Iterable[Capture]:
-        dirs = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
         capture_end_position_pairs = []
-        for dx, dy in dirs:
-            for i in range(1, self.dim):
-                new_x, new_y = x + i * dx, y + i * dy
-                if not (0 <= new_x < self.dim and 0 <= new_y < self.dim):
-                    break
+        for segments in self._tables.king_segments[x][y]:
+            for (new_x, new_y), landings in segments:
                 if not isinstance(self._board[new_x][new_y], Piece):
                     continue
-                if self._board[new_x][new_y].color == color:
+                if self._board[new_x][new_y].color is color:
                     break
-                for j in range(i + 1, self.dim):
-                    end_x, end_y = x + j * dx, y + j * dy
-                    if not (0 <= end_x < self.dim and 0 <= end_y < self.dim):
-                        break
+                for end_x, end_y in landings:
                     if isinstance(self._board[end_x][end_y], Piece):
                         break
-                    if self._board[end_x][end_y] == AccessibleField():
+                    if self._board[end_x][end_y] is ACCESSIBLE_FIELD:
                         capture_end_position_pairs.append(
                             Capture(
                                 opponent_position=(new_x, new_y),
@@ -237,68 +400,102 @@ class CheckersBoard(Board):
     ) -> Iterable[Capture]:
         color = color or self._board[x][y].color
         can_capture = []
-        dirs = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
-        for dx, dy in dirs:
-            opponent_x, opponent_y = x + dx, y + dy
-            after_jump_x, after_jump_y = x + 2 * dx, y + 2 * dy
-            if not (0 <= after_jump_x < self.dim and 0 <= after_jump_y < self.dim):
-                continue
+        for opponent, after_jump in self._tables.jumps[x][y]:
+            opponent_x, opponent_y = opponent
+            after_jump_x, after_jump_y = after_jump
             if not isinstance(self._board[opponent_x][opponent_y], Piece):
                 continue
-            if self._board[opponent_x][opponent_y].color == color:
+            if self._board[opponent_x][opponent_y].color is color:
                 continue
-            if self._board[after_jump_x][after_jump_y] == AccessibleField():
+            if self._board[after_jump_x][after_jump_y] is ACCESSIBLE_FIELD:
                 can_capture.append(
-                    Capture(
-                        opponent_position=(opponent_x, opponent_y),
-                        end_position=(after_jump_x, after_jump_y),
-                    )
+                    Capture(opponent_position=opponent, end_position=after_jump)
                 )
         return can_capture
 
     def _get_diagonal_moves(self, x: int, y: int, piece) -> Iterable[Tuple[int, int]]:
-        potential_moves = piece.get_diagonal_moves(x, y, self.dim)
-        potential_moves = [
-            (x, y)
-            for x, y in potential_moves
-            if 0 <= x < self.dim and 0 <= y < self.dim
-        ]
-        potential_moves = [
-            (x, y) for x, y in potential_moves if self._board[x][y] == AccessibleField()
-        ]
+        if type(piece) == Man:
+            return [
+                (x, y)
+                for x, y in self._tables.man_steps[piece.color.char][x][y]
+                if self._board[x][y] is ACCESSIBLE_FIELD
+            ]
+        potential_moves = []
+        for ray in self._tables.rays[x][y]:
+            for new_x, new_y in ray:
+                if self._board[new_x][new_y] is not ACCESSIBLE_FIELD:
+                    break
+                potential_moves.append((new_x, new_y))
         return potential_moves
 
     def _get_moves_with_max_capture(
-        self, x: int, y: int, color: Color, captured=None, mode: str = "man",
+        self,
+        x: int,
+        y: int,
+        color: Color,
+        captured=None,
+        mode: str = "man",
     ) -> List[Tuple[List[Tuple[int, int]], Tuple[int, int]]]:
         captured = captured or []
+        captured_bits = 0
+        for captured_x, captured_y in captured:
+            captured_bits |= 1 << (captured_x * self.dim + captured_y)
+        opponents = 0
+        for opponent_x, row in enumerate(self._board):
+            for opponent_y, piece in enumerate(row):
+                if isinstance(piece, Piece) and piece.color is not color:
+                    opponents |= 1 << (opponent_x * self.dim + opponent_y)
+        suffixes = self._max_capture_suffixes(
+            x, y, color, mode, captured_bits, opponents & ~captured_bits, {}
+        )
+        return [(captured + list(path), end) for path, end in suffixes]
+
+    def _max_capture_suffixes(
+        self,
+        x: int,
+        y: int,
+        color: Color,
+        mode: str,
+        captured: int,
+        capturable: int,
+        memo: Dict[Tuple[int, int, int], List[Tuple[Tuple, Tuple[int, int]]]],
+    ) -> List[Tuple[Tuple, Tuple[int, int]]]:
+        key = (x, y, captured)
+        if key in memo:
+            return memo[key]
         possible_captures = (
             self._can_capture_from(x, y, color=color)
             if mode == "man"
             else self._can_capture_as_flying_king_from(x, y, color=color)
         )
-        possible_captures = [
-            capture
-            for capture in possible_captures
-            if capture.opponent_position not in captured
-        ]
-
-        if not possible_captures:
-            return [(captured, (x, y))]
-
-        new_captures = []
+        best_length = 0
+        best = [((), (x, y))]
         for capture in possible_captures:
-            new_capture = capture.opponent_position
+            opponent_x, opponent_y = capture.opponent_position
+            bit = 1 << (opponent_x * self.dim + opponent_y)
+            if not capturable & bit:
+                continue
+            remaining = capturable & ~bit
+            if 1 + bin(remaining).count("1") < best_length:
+                continue
             new_x, new_y = capture.end_position
-            max_captured = self._get_moves_with_max_capture(
-                new_x, new_y, captured=captured + [new_capture], color=color, mode=mode
+            suffixes = self._max_capture_suffixes(
+                new_x, new_y, color, mode, captured | bit, remaining, memo
             )
-            new_captures.extend(max_captured)
-        max_capture = max([len(c[0]) for c in new_captures])
-        equivalent_max_captures = [
-            cap for cap in new_captures if len(cap[0]) == max_capture
-        ]
-        return equivalent_max_captures
+            length = 1 + len(suffixes[0][0])
+            if length < best_length:
+                continue
+            if length > best_length:
+                best_length, best = length, []
+            best.extend(
+                ((capture.opponent_position,) + path, end) for path, end in suffixes
+            )
+        memo[key] = best
+        return best
+
+    @staticmethod
+    def _coord_to_checkers_notation(x: int, y: int) -> int:
+        return x * 4 + y // 2 + 1
 
     @staticmethod
     def _checkers_notation_to_coord(i: int) -> Tuple[int, int]:
@@ -324,5 +521,5 @@ class CheckersBoard(Board):
 
         for idx, piece in checkers_notation.items():
             x, y = cls._checkers_notation_to_coord(idx)
-            board._board[x][y] = char_to_piece[color_to_char[piece]]()
+            board._put(x, y, char_to_piece[color_to_char[piece]])
         return board
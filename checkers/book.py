@@ -0,0 +1,131 @@
+import argparse
+import random
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .board import Board, Move
+from .codec import _square_indexes, _to_coord, _to_notation, playable_squares
+from .mmaptable import MmapTable
+from .pdn import PDNGame, read_games
+
+MAGIC = b"CKOB"
+VALUE_FORMAT = "BBII"
+MAX_PLIES = 24
+
+
+class BookMove:
+    __slots__ = ("move", "games", "wins")
+
+    def __init__(self, move: Move, games: int, wins: int):
+        self.move = move
+        self.games = games
+        self.wins = wins
+
+
+def _winner(result: str) -> Optional[str]:
+    return {"1-0": "x", "2-0": "x", "0-1": "o", "0-2": "o"}.get(result)
+
+
+def collect(
+    games: Iterable[PDNGame], max_plies: int = MAX_PLIES, dim: int = 8
+) -> Dict[Tuple[int, int, int], List[int]]:
+    stats: Dict[Tuple[int, int, int], List[int]] = {}
+    for game in games:
+        board = game.board()
+        if board.dim != dim:
+            raise ValueError(
+                f"Expected a {dim}x{dim} game, got {board.dim}x{board.dim}"
+            )
+        indexes = _square_indexes(board.dim)
+        winner = _winner(game.result)
+        for move in game.moves[:max_plies]:
+            legal_moves = board.legal_moves(board.turn)
+            if move not in legal_moves:
+                break
+            key = (
+                board.zobrist_hash,
+                indexes[_to_coord(board.dim, move.start)],
+                indexes[_to_coord(board.dim, move.end)],
+            )
+            entry = stats.setdefault(key, [0, 0])
+            entry[0] += 1
+            entry[1] += board.turn.char == winner
+            board.make_move(move)
+    return stats
+
+
+def build(
+    path: str,
+    games: Iterable[PDNGame],
+    max_plies: int = MAX_PLIES,
+    min_games: int = 1,
+    dim: int = 8,
+) -> int:
+    stats = collect(games, max_plies=max_plies, dim=dim)
+    return MmapTable.write(
+        path,
+        MAGIC,
+        VALUE_FORMAT,
+        (
+            (key, start, end, games, wins)
+            for (key, start, end), (games, wins) in stats.items()
+            if games >= min_games
+        ),
+        meta=dim,
+    )
+
+
+class OpeningBook:
+    def __init__(self, path: str):
+        self._table = MmapTable(path, MAGIC, VALUE_FORMAT)
+        self.dim = self._table.meta
+
+    def __len__(self):
+        return len(self._table)
+
+    def close(self):
+        self._table.close()
+
+    def moves(self, board: Board) -> List[BookMove]:
+        if board.dim != self.dim:
+            return []
+        squares = playable_squares(self.dim)
+        moves = [
+            BookMove(
+                Move(
+                    _to_notation(self.dim, squares[start]),
+                    _to_notation(self.dim, squares[end]),
+                ),
+                games,
+                wins,
+            )
+            for start, end, games, wins in self._table.get_all(board.zobrist_hash)
+        ]
+        return sorted(moves, key=lambda m: (m.games, m.wins), reverse=True)
+
+    def choose(
+        self, board: Board, rng: Optional[random.Random] = None
+    ) -> Optional[Move]:
+        legal_moves = board.legal_moves(board.turn)
+        candidates = [m for m in self.moves(board) if m.move in legal_moves]
+        if not candidates:
+            return None
+        if rng is None:
+            return candidates[0].move
+        weights = [m.games for m in candidates]
+        return rng.choices(candidates, weights=weights)[0].move
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Build an opening book from PDN.")
+    parser.add_argument("path")
+    parser.add_argument("pdn", nargs="+")
+    parser.add_argument("--plies", type=int, default=MAX_PLIES)
+    parser.add_argument("--min-games", type=int, default=1)
+    args = parser.parse_args(argv)
+    games = (game for pdn in args.pdn for game in read_games(pdn))
+    count = build(args.path, games, max_plies=args.plies, min_games=args.min_games)
+    print(f"wrote {count} book moves to {args.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+import struct
+from time import monotonic
+from typing import Callable, Dict, Sequence
+
+STATE = struct.Struct("<ddddd?")
+
+
+class Clock:
+    def __init__(
+        self,
+        sides: Sequence[str],
+        initial_time: float,
+        increment: float = 0.0,
+        delay: float = 0.0,
+        timer: Callable[[], float] = monotonic,
+    ):
+        self.increment = increment
+        self.delay = delay
+        self._timer = timer
+        self._remaining: Dict[str, float] = {side: initial_time for side in sides}
+        self.running: str = sides[0]
+        self._started_at = timer()
+
+    def _charge(self, elapsed: float) -> float:
+        return max(0.0, elapsed - self.delay)
+
+    def remaining(self, side: str) -> float:
+        remaining = self._remaining[side]
+        if side == self.running:
+            remaining -= self._charge(self._timer() - self._started_at)
+        return remaining
+
+    def is_flagged(self) -> bool:
+        return self.remaining(self.running) < 0
+
+    def press(self, add_increment: bool = True) -> float:
+        now = self._timer()
+        remaining = self._remaining[self.running] - self._charge(now - self._started_at)
+        if add_increment and remaining >= 0:
+            remaining += self.increment
+        self._remaining[self.running] = remaining
+        self.running = next(side for side in self._remaining if side != self.running)
+        self._started_at = now
+        return remaining
+
+    def to_bytes(self) -> bytes:
+        first, second = self._remaining
+        return STATE.pack(
+            self._remaining[first],
+            self._remaining[second],
+            self._started_at,
+            self.increment,
+            self.delay,
+            self.running == second,
+        )
+
+    @classmethod
+    def from_bytes(
+        cls, data: bytes, sides: Sequence[str], timer: Callable[[], float] = monotonic
+    ) -> "Clock":
+        first, second, started_at, increment, delay, second_running = STATE.unpack(data)
+        clock = cls(sides, 0.0, increment=increment, delay=delay, timer=timer)
+        clock._remaining = {sides[0]: first, sides[1]: second}
+        clock.running = sides[1] if second_running else sides[0]
+        clock._started_at = started_at
+        return clock
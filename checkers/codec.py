@@ -0,0 +1,161 @@
+from functools import lru_cache
+from typing import IO, Iterable, Iterator, List, Tuple
+
+from .board import Board, CheckersBoard, Move
+from .piece import BLACK
+
+NIBBLES = " xXoO"
+CHAR_TO_NIBBLE = {char: nibble for nibble, char in enumerate(NIBBLES)}
+
+
+@lru_cache(maxsize=None)
+def playable_squares(dim: int) -> Tuple[Tuple[int, int], ...]:
+    return tuple((x, y) for x in range(dim) for y in range(dim) if (x + y) % 2)
+
+
+@lru_cache(maxsize=None)
+def _square_indexes(dim: int):
+    return {coord: index for index, coord in enumerate(playable_squares(dim))}
+
+
+def position_size(dim: int) -> int:
+    return (len(playable_squares(dim)) + 1) // 2 + 1
+
+
+def encode_position(board: Board) -> bytes:
+    rows = str(board).strip("\n").split("\n")
+    nibbles = [CHAR_TO_NIBBLE[rows[x][y]] for x, y in playable_squares(board.dim)]
+    nibbles.append(0)
+    packed = bytes(
+        nibbles[i] << 4 | nibbles[i + 1] for i in range(0, len(nibbles) - 1, 2)
+    )
+    return packed + bytes([board.turn is BLACK])
+
+
+def decode_position(data: bytes, dim: int = 8, cls=CheckersBoard) -> Board:
+    if len(data) != position_size(dim):
+        raise ValueError("Invalid position size")
+    rows = [["-"] * dim for _ in range(dim)]
+    for i, (x, y) in enumerate(playable_squares(dim)):
+        nibble = data[i // 2] >> 4 if i % 2 == 0 else data[i // 2] & 0x0F
+        if nibble >= len(NIBBLES):
+            raise ValueError("Invalid square code")
+        rows[x][y] = NIBBLES[nibble]
+    board = cls.from_ascii("\n".join("".join(row) for row in rows), dim=dim)
+    if data[-1] > 1:
+        raise ValueError("Invalid side to move")
+    if data[-1]:
+        board.turn = BLACK
+    return board
+
+
+def write_varint(value: int, out: bytearray):
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    value = shift = 0
+    while True:
+        if offset >= len(data):
+            raise ValueError("Truncated varint")
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, offset
+        shift += 7
+
+
+def _to_coord(dim: int, notation: Tuple[int, str]) -> Tuple[int, int]:
+    row, col = notation
+    return dim - row, ord(col) - ord("A")
+
+
+def _to_notation(dim: int, coord: Tuple[int, int]) -> Tuple[int, str]:
+    x, y = coord
+    return dim - x, chr(y + ord("A"))
+
+
+def encode_moves(moves: Iterable[Move], dim: int = 8) -> bytes:
+    indexes = _square_indexes(dim)
+    out = bytearray()
+    moves = list(moves)
+    write_varint(len(moves), out)
+    for move in moves:
+        write_varint(indexes[_to_coord(dim, move.start)], out)
+        write_varint(indexes[_to_coord(dim, move.end)], out)
+        write_varint(len(move.captured), out)
+        for coord in move.captured:
+            write_varint(indexes[tuple(coord)], out)
+    return bytes(out)
+
+
+def decode_moves(data: bytes, dim: int = 8, offset: int = 0) -> Tuple[List[Move], int]:
+    squares = playable_squares(dim)
+
+    def square(offset: int) -> Tuple[Tuple[int, int], int]:
+        index, offset = read_varint(data, offset)
+        if index >= len(squares):
+            raise ValueError("Invalid square index")
+        return squares[index], offset
+
+    count, offset = read_varint(data, offset)
+    moves = []
+    for _ in range(count):
+        start, offset = square(offset)
+        end, offset = square(offset)
+        captured_count, offset = read_varint(data, offset)
+        captured = []
+        for _ in range(captured_count):
+            coord, offset = square(offset)
+            captured.append(coord)
+        moves.append(
+            Move(_to_notation(dim, start), _to_notation(dim, end), captured=captured)
+        )
+    return moves, offset
+
+
+def encode_game(board: Board, moves: Iterable[Move]) -> bytes:
+    return (
+        bytes([board.dim]) + encode_position(board) + encode_moves(moves, dim=board.dim)
+    )
+
+
+def decode_game(data: bytes, cls=CheckersBoard) -> Tuple[Board, List[Move]]:
+    if not data:
+        raise ValueError("Empty game record")
+    dim = data[0]
+    end = 1 + position_size(dim)
+    board = decode_position(data[1:end], dim=dim, cls=cls)
+    moves, offset = decode_moves(data, dim=dim, offset=end)
+    if offset != len(data):
+        raise ValueError("Trailing data in game record")
+    return board, moves
+
+
+def write_record(stream: IO[bytes], data: bytes):
+    header = bytearray()
+    write_varint(len(data), header)
+    stream.write(bytes(header) + data)
+
+
+def read_records(stream: IO[bytes]) -> Iterator[bytes]:
+    while True:
+        length = shift = 0
+        while True:
+            byte = stream.read(1)
+            if not byte:
+                if shift:
+                    raise ValueError("Truncated record length")
+                return
+            length |= (byte[0] & 0x7F) << shift
+            if not byte[0] & 0x80:
+                break
+            shift += 7
+        data = stream.read(length)
+        if len(data) != length:
+            raise ValueError("Truncated record")
+        yield data
@@ -0,0 +1,58 @@
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+Coord = Tuple[int, int]
+Ray = Tuple[Coord, ...]
+
+DIRS = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+MAN_DIRS = {"x": ((-1, -1), (-1, 1)), "o": ((1, -1), (1, 1))}
+
+
+class DiagonalTables:
+    def __init__(self, dim: int):
+        self.dim = dim
+        self.rays: List[List[Tuple[Ray, ...]]] = [
+            [tuple(self._ray(x, y, dx, dy) for dx, dy in DIRS) for y in range(dim)]
+            for x in range(dim)
+        ]
+        self.jumps: List[List[Tuple[Tuple[Coord, Coord], ...]]] = [
+            [tuple((ray[0], ray[1]) for ray in rays if len(ray) > 1) for rays in row]
+            for row in self.rays
+        ]
+        self.king_segments: List[List[Tuple[Tuple[Tuple[Coord, Ray], ...], ...]]] = [
+            [
+                tuple(
+                    tuple((ray[i], ray[i + 1 :]) for i in range(len(ray)))
+                    for ray in rays
+                )
+                for rays in row
+            ]
+            for row in self.rays
+        ]
+        self.man_steps: Dict[str, List[List[Ray]]] = {
+            char: [
+                [
+                    tuple(
+                        (x + dx, y + dy)
+                        for dx, dy in dirs
+                        if 0 <= x + dx < dim and 0 <= y + dy < dim
+                    )
+                    for y in range(dim)
+                ]
+                for x in range(dim)
+            ]
+            for char, dirs in MAN_DIRS.items()
+        }
+
+    def _ray(self, x: int, y: int, dx: int, dy: int) -> Ray:
+        ray = []
+        x, y = x + dx, y + dy
+        while 0 <= x < self.dim and 0 <= y < self.dim:
+            ray.append((x, y))
+            x, y = x + dx, y + dy
+        return tuple(ray)
+
+
+@lru_cache(maxsize=None)
+def diagonal_tables(dim: int) -> DiagonalTables:
+    return DiagonalTables(dim)
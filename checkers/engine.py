@@ -0,0 +1,283 @@
+from time import monotonic
+from typing import Dict, List, Optional, Set, Tuple
+
+from .bitboard import BitboardCheckersBoard, _geometry, _row_mask, _step, DIRS
+from .board import Board, Move
+from .piece import White
+from .tablebase import LOSS, WIN as TABLEBASE_WIN, Tablebase
+
+MAN_VALUE = 100
+KING_VALUE = 300
+ADVANCEMENT_VALUE = 2
+MOBILITY_VALUE = 1
+
+WIN = 1_000_000
+MAX_PLY = 1_000
+INFINITY = WIN + 1
+
+EXACT, LOWER_BOUND, UPPER_BOUND = 0, 1, 2
+
+
+def _popcount(bb: int) -> int:
+    return bin(bb).count("1")
+
+
+def _mobility(board: BitboardCheckersBoard, men: int, kings: int, dirs) -> int:
+    geometry = _geometry(board.dim)
+    count = 0
+    for direction in dirs:
+        count += _popcount(_step(men, geometry[direction]) & board.empty)
+    for direction in DIRS:
+        sliding = _step(kings, geometry[direction]) & board.empty
+        while sliding:
+            count += _popcount(sliding)
+            sliding = _step(sliding, geometry[direction]) & board.empty
+    return count
+
+
+def evaluate(board: BitboardCheckersBoard) -> int:
+    dim = board.dim
+    white_men, black_men = board.white_men, board.black_men
+    white_kings, black_kings = board.white & board.kings, board.black & board.kings
+    material = _popcount(white_men) - _popcount(black_men)
+    kings = _popcount(white_kings) - _popcount(black_kings)
+    advancement = 0
+    for x in range(dim):
+        row = _row_mask(dim, x)
+        advancement += (dim - 1 - x) * _popcount(white_men & row)
+        advancement -= x * _popcount(black_men & row)
+    mobility = _mobility(board, white_men, white_kings, ((-1, 1), (-1, -1)))
+    mobility -= _mobility(board, black_men, black_kings, ((1, 1), (1, -1)))
+    score = (
+        MAN_VALUE * material
+        + KING_VALUE * kings
+        + ADVANCEMENT_VALUE * advancement
+        + MOBILITY_VALUE * mobility
+    )
+    return score if isinstance(board.turn, White) else -score
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+class SearchResult:
+    def __init__(self, move: Optional[Move], score: int, depth: int, nodes: int):
+        self.move = move
+        self.score = score
+        self.depth = depth
+        self.nodes = nodes
+
+
+class TranspositionTable:
+    def __init__(self, size: int = 1 << 16):
+        size = 1 << max(size - 1, 0).bit_length()
+        self._mask = size - 1
+        self._entries: List[Optional[Tuple]] = [None] * size
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: int) -> Optional[Tuple[int, int, int, Optional[Move]]]:
+        entry = self._entries[key & self._mask]
+        if entry is None or entry[0] != key:
+            return None
+        return entry[1:]
+
+    def put(self, key: int, depth: int, score: int, flag: int, move: Optional[Move]):
+        index = key & self._mask
+        entry = self._entries[index]
+        if entry is None or entry[0] != key or entry[1] <= depth:
+            self._entries[index] = (key, depth, score, flag, move)
+
+    def clear(self):
+        self._entries = [None] * len(self._entries)
+
+
+def _to_table(score: int, ply: int) -> int:
+    if score >= WIN - MAX_PLY:
+        return score + ply
+    if score <= -WIN + MAX_PLY:
+        return score - ply
+    return score
+
+
+def _from_table(score: int, ply: int) -> int:
+    if score >= WIN - MAX_PLY:
+        return score - ply
+    if score <= -WIN + MAX_PLY:
+        return score + ply
+    return score
+
+
+class SearchEngine:
+    def __init__(
+        self,
+        table_size: int = 1 << 16,
+        max_depth: int = 64,
+        check_every: int = 512,
+        tablebase: Optional[Tablebase] = None,
+    ):
+        self.table = TranspositionTable(table_size)
+        self.tablebase = tablebase
+        self.max_depth = max_depth
+        self.check_every = check_every
+        self.nodes = 0
+        self._repetitions = 0
+        self._deadline = 0.0
+        self._killers: Dict[int, List[Tuple]] = {}
+        self._history: Dict[Tuple, int] = {}
+
+    def search(
+        self, board: Board, time_budget: float, max_depth: Optional[int] = None
+    ) -> SearchResult:
+        position = BitboardCheckersBoard.from_ascii(str(board), dim=board.dim)
+        position.turn = board.turn
+        moves = position.legal_moves(position.turn)
+        if not moves:
+            return SearchResult(None, -WIN, 0, 0)
+        self.nodes = 0
+        self._deadline = monotonic() + time_budget
+        self._killers = {}
+        self._history = {}
+        result = SearchResult(moves[0], 0, 0, 0)
+        for depth in range(1, (max_depth or self.max_depth) + 1):
+            try:
+                score, move = self._search_root(position, depth)
+            except SearchTimeout:
+                break
+            result = SearchResult(move, score, depth, self.nodes)
+            if len(moves) == 1 or abs(score) >= WIN - MAX_PLY:
+                break
+        return result
+
+    def _search_root(self, board: BitboardCheckersBoard, depth: int):
+        alpha, beta = -INFINITY, INFINITY
+        best_move = None
+        path = {board.zobrist_hash}
+        entry = self.table.get(board.zobrist_hash)
+        tt_move = entry[3] if entry else None
+        repetitions = self._repetitions
+        for move in self._order(board.legal_moves(board.turn), tt_move, 0):
+            record = board.make_move(move)
+            try:
+                score = -self._negamax(board, depth - 1, -beta, -alpha, 1, path)
+            finally:
+                board.unmake_move(record)
+            if best_move is None or score > alpha:
+                alpha, best_move = score, move
+        if self._repetitions == repetitions:
+            self.table.put(board.zobrist_hash, depth, alpha, EXACT, best_move)
+        return alpha, best_move
+
+    def _negamax(
+        self,
+        board: BitboardCheckersBoard,
+        depth: int,
+        alpha: int,
+        beta: int,
+        ply: int,
+        path: Set[int],
+    ) -> int:
+        self.nodes += 1
+        if self.nodes % self.check_every == 0 and monotonic() > self._deadline:
+            raise SearchTimeout
+        key = board.zobrist_hash
+        if key in path:
+            self._repetitions += 1
+            return 0
+        if self.tablebase is not None:
+            score = self._probe(board, ply)
+            if score is not None:
+                return score
+        moves = board.legal_moves(board.turn)
+        if not moves:
+            return -WIN + ply
+        if depth <= 0 and not moves[0].captured:
+            return evaluate(board)
+
+        original_alpha = alpha
+        entry = self.table.get(key)
+        tt_move = None
+        if entry is not None:
+            entry_depth, entry_score, flag, tt_move = entry
+            entry_score = _from_table(entry_score, ply)
+            if entry_depth >= depth:
+                if flag == EXACT:
+                    return entry_score
+                if flag == LOWER_BOUND:
+                    alpha = max(alpha, entry_score)
+                elif flag == UPPER_BOUND:
+                    beta = min(beta, entry_score)
+                if alpha >= beta:
+                    return entry_score
+
+        best_score, best_move = -INFINITY, None
+        repetitions = self._repetitions
+        path.add(key)
+        try:
+            for move in self._order(moves, tt_move, ply):
+                record = board.make_move(move)
+                try:
+                    score = -self._negamax(
+                        board, depth - 1, -beta, -alpha, ply + 1, path
+                    )
+                finally:
+                    board.unmake_move(record)
+                if score > best_score:
+                    best_score, best_move = score, move
+                alpha = max(alpha, score)
+                if alpha >= beta:
+                    if not move.captured:
+                        self._remember_cutoff(move, depth, ply)
+                    break
+        finally:
+            path.discard(key)
+
+        if best_score <= original_alpha:
+            flag = UPPER_BOUND
+        elif best_score >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        if self._repetitions == repetitions:
+            self.table.put(key, depth, _to_table(best_score, ply), flag, best_move)
+        return best_score
+
+    def _probe(self, board: BitboardCheckersBoard, ply: int) -> Optional[int]:
+        tablebase = self.tablebase
+        if (
+            board.dim != tablebase.dim
+            or _popcount(board.white | board.black) > tablebase.max_pieces
+        ):
+            return None
+        entry = tablebase.probe_hash(board.zobrist_hash)
+        if entry is None:
+            return None
+        if entry.result == TABLEBASE_WIN:
+            return WIN - ply - entry.distance
+        if entry.result == LOSS:
+            return -WIN + ply + entry.distance
+        return 0
+
+    def _order(self, moves: List[Move], tt_move: Optional[Move], ply: int):
+        killers = self._killers.get(ply, [])
+
+        def priority(move: Move):
+            key = (move.start, move.end)
+            return (
+                tt_move is not None and move == tt_move,
+                len(move.captured),
+                key in killers,
+                self._history.get(key, 0),
+            )
+
+        return sorted(moves, key=priority, reverse=True)
+
+    def _remember_cutoff(self, move: Move, depth: int, ply: int):
+        key = (move.start, move.end)
+        killers = self._killers.setdefault(ply, [])
+        if key not in killers:
+            killers.insert(0, key)
+            del killers[2:]
+        self._history[key] = self._history.get(key, 0) + depth * depth
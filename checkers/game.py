@@ -1,26 +1,51 @@
-from time import time
-from typing import Optional
-from .board import CheckersBoard, Move
-from .player import Player, Winner
-from .piece import Black, White
+from time import monotonic
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from .board import CheckersBoard, Move, MoveDelta
+from .clock import Clock, STATE as CLOCK_STATE
+from .codec import (
+    decode_game,
+    decode_position,
+    encode_game,
+    encode_position,
+    position_size,
+    read_varint,
+    write_varint,
+)
+from .player import Player, ComputerPlayer, Winner
+from .piece import Black, Color, Piece, White
 
 SECS = 60
 
 
 class Game:
     def __init__(
-        self, white: Player, black: Player, playing_time: float = 10, board=None
+        self,
+        white: Player,
+        black: Player,
+        playing_time: float = 10,
+        board=None,
+        increment: float = 0,
+        delay: float = 0,
+        timer: Callable[[], float] = monotonic,
     ):
         self._init_state = str(board) if board is not None else None
         self._board = board or CheckersBoard.from_ascii()
         white.color = White()
         black.color = Black()
+        self._players = (white, black)
         self._turn: Player = white
         self._wait: Player = black
         self._moves = []
+        self._undo_records = []
         self._turn.remaining_time = playing_time * SECS
         self._wait.remaining_time = playing_time * SECS
-        self._timestamps = [time()]
+        self._clock = Clock(
+            (white.color.char, black.color.char),
+            playing_time * SECS,
+            increment=increment,
+            delay=delay,
+            timer=timer,
+        )
         self._winner: Optional[Winner] = None
         self._game_over = False
 
@@ -34,10 +59,11 @@ class Game:
             raise ValueError("The other player must do the move.")
 
         try:
-            self._board.move(move)
+            record = self._board.make_move(move)
         except Exception as e:
             raise e
-        self._moves.append(move)
+        self._moves.append(record.move)
+        self._undo_records.append(record)
 
         if self._player_has_won():
             self._winner = self._turn
@@ -46,16 +72,96 @@ class Game:
         self._update_time()
         self._switch_turns()
 
+    def replay(self, moves: Iterable[Move], validate: bool = True) -> Optional[int]:
+        if self._winner:
+            raise ValueError("Can't replay moves after game has ended")
+        moves = list(moves)
+        records = []
+        first_illegal = self._board.apply_many(
+            moves, validate=validate, records=records
+        )
+        self._moves.extend(record.move for record in records)
+        self._undo_records.extend(records)
+        if len(records) % 2:
+            self._update_time(add_increment=False)
+            self._switch_turns()
+        if records and not self._board.any_pieces_left(self._turn.color):
+            self._winner = self._wait
+        return first_illegal
+
+    def to_bytes(self) -> bytes:
+        initial = CheckersBoard.from_ascii(self._init_state, dim=self._board.dim)
+        return encode_game(initial, self._moves)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, white: Player, black: Player, **kwargs) -> "Game":
+        board, moves = decode_game(data)
+        game = cls(white, black, board=board, **kwargs)
+        if game.replay(moves) is not None:
+            raise ValueError("Game record contains an illegal move")
+        return game
+
+    def to_state(self) -> bytes:
+        out = bytearray()
+        for player in self._players:
+            name = str(player.name).encode()
+            write_varint(len(name), out)
+            out += name
+        winner = self._players.index(self._winner) + 1 if self._winner else 0
+        out.append(winner)
+        out.append(self._players.index(self._turn))
+        out += self._clock.to_bytes()
+        out.append(self._board.dim)
+        out += encode_position(self._board)
+        return bytes(out) + self.to_bytes()
+
+    @classmethod
+    def from_state(cls, data: bytes, timer: Callable[[], float] = monotonic) -> "Game":
+        names = []
+        offset = 0
+        for _ in range(2):
+            length, offset = read_varint(data, offset)
+            names.append(data[offset : offset + length].decode())
+            offset += length
+        winner, turn = data[offset], data[offset + 1]
+        offset += 2
+        clock_state = data[offset : offset + CLOCK_STATE.size]
+        offset += CLOCK_STATE.size
+        dim = data[offset]
+        end = offset + 1 + position_size(dim)
+        board = decode_position(data[offset + 1 : end], dim=dim)
+        initial, moves = decode_game(data[end:])
+        game = cls(Player(names[0]), Player(names[1]), board=board, timer=timer)
+        game._init_state = str(initial)
+        game._moves = moves
+        if turn:
+            game._switch_turns()
+        if winner:
+            game._winner = game._players[winner - 1]
+        sides = tuple(player.color.char for player in game._players)
+        game._clock = Clock.from_bytes(clock_state, sides, timer=timer)
+        for player in game._players:
+            player.remaining_time = game._clock.remaining(player.color.char)
+        return game
+
+    def play_computer_move(self) -> Optional[Winner]:
+        if not isinstance(self._turn, ComputerPlayer):
+            raise ValueError("It is not a computer player's turn.")
+        move = self._turn.choose_move(self._board)
+        if move is None:
+            self._winner = self._wait
+            return Winner(self._winner)
+        return self.move(move)
+
     def _time_is_over(self) -> bool:
-        tmp = self._timestamps + [time()]
-        all_moves_duration = sum(i - j for i, j in zip(tmp[::-2], tmp[-2::-2]))
-        return all_moves_duration > self._turn.remaining_time
+        return self._clock.is_flagged()
 
     def _is_correct_turn(self, move: Move) -> bool:
-        return self._board[move.start].color == self._turn.color
+        piece = self._board[move.start]
+        return not isinstance(piece, Piece) or piece.color == self._turn.color
 
-    def _update_time(self):
-        self._timestamps.append(time())
+    def _update_time(self, add_increment: bool = True):
+        self._turn.remaining_time = self._clock.press(add_increment=add_increment)
 
     def _player_has_won(self):
         opponent_color = self._wait.color
@@ -67,11 +173,11 @@ class Game:
     def undo(self):
         if self._winner:
             raise ValueError("Can't undo move after game has ended")
-        self._board = CheckersBoard.from_ascii(self._init_state, dim=self._board.dim)
+        if not self._undo_records:
+            raise ValueError("No move to undo")
+        self._board.unmake_move(self._undo_records.pop())
         self._moves.pop()
-        for move in self._moves:
-            self._board.move(move)
-        self._update_time()
+        self._update_time(add_increment=False)
         self._switch_turns()
 
     def _switch_turns(self):
@@ -79,3 +185,27 @@ class Game:
 
     def board(self):
         return str(self._board)
+
+    @property
+    def turn(self) -> Color:
+        return self._turn.color
+
+    @property
+    def players(self) -> Tuple[Player, Player]:
+        return self._players
+
+    @property
+    def moves(self) -> List[Move]:
+        return list(self._moves)
+
+    @property
+    def winner(self) -> Optional[Player]:
+        return self._winner
+
+    def last_move_delta(self) -> Optional[MoveDelta]:
+        if not self._undo_records:
+            return None
+        return MoveDelta.from_record(self._board, self._undo_records[-1])
+
+    def to_checkers_notation(self) -> Dict[int, Optional[str]]:
+        return self._board.to_checkers_notation()
@@ -0,0 +1,150 @@
+import functools
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+from .board import CheckersBoard
+from .game import Game
+
+logger = logging.getLogger(__name__)
+
+PREFIX = "checkers"
+
+TIMED = [
+    (Game, "move"),
+    (CheckersBoard, "make_move"),
+    (CheckersBoard, "_generate_legal_moves"),
+    (CheckersBoard, "_possible_moves"),
+    (CheckersBoard, "_get_moves_with_max_capture"),
+]
+
+
+class Metrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.calls: Dict[str, int] = {}
+        self.seconds: Dict[str, float] = {}
+        self.capture_nodes = 0
+        self.capture_max_depth = 0
+
+    def record(self, name: str, elapsed: float):
+        with self._lock:
+            self.calls[name] = self.calls.get(name, 0) + 1
+            self.seconds[name] = self.seconds.get(name, 0.0) + elapsed
+
+    def enter_capture(self):
+        depth = getattr(self._local, "depth", 0) + 1
+        self._local.depth = depth
+        with self._lock:
+            self.capture_nodes += 1
+            if depth > self.capture_max_depth:
+                self.capture_max_depth = depth
+
+    def exit_capture(self):
+        self._local.depth -= 1
+
+    def reset(self):
+        with self._lock:
+            self.calls.clear()
+            self.seconds.clear()
+            self.capture_nodes = 0
+            self.capture_max_depth = 0
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                "calls": dict(self.calls),
+                "seconds": dict(self.seconds),
+                "capture_nodes": self.capture_nodes,
+                "capture_max_depth": self.capture_max_depth,
+            }
+
+    def to_prometheus(self) -> str:
+        snapshot = self.snapshot()
+        lines = [f"# TYPE {PREFIX}_calls_total counter"]
+        lines.extend(
+            f'{PREFIX}_calls_total{{function="{name}"}} {calls}'
+            for name, calls in sorted(snapshot["calls"].items())
+        )
+        lines.append(f"# TYPE {PREFIX}_seconds_total counter")
+        lines.extend(
+            f'{PREFIX}_seconds_total{{function="{name}"}} {seconds:.9f}'
+            for name, seconds in sorted(snapshot["seconds"].items())
+        )
+        lines.append(f"# TYPE {PREFIX}_capture_nodes_total counter")
+        lines.append(f"{PREFIX}_capture_nodes_total {snapshot['capture_nodes']}")
+        lines.append(f"# TYPE {PREFIX}_capture_max_depth gauge")
+        lines.append(f"{PREFIX}_capture_max_depth {snapshot['capture_max_depth']}")
+        return "\n".join(lines) + "\n"
+
+
+def _timed(metrics: Metrics, name: str, method):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            metrics.record(name, time.perf_counter() - start)
+
+    return wrapper
+
+
+def _counted(metrics: Metrics, method):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        metrics.enter_capture()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            metrics.exit_capture()
+
+    return wrapper
+
+
+_metrics: Optional[Metrics] = None
+_originals: Dict[tuple, object] = {}
+
+
+def enable(metrics: Optional[Metrics] = None) -> Metrics:
+    global _metrics
+    if _metrics is not None:
+        return _metrics
+    _metrics = metrics or Metrics()
+    for cls, attr in TIMED:
+        _originals[cls, attr] = cls.__dict__[attr]
+        name = f"{cls.__name__}.{attr}"
+        setattr(cls, attr, _timed(_metrics, name, cls.__dict__[attr]))
+    method = CheckersBoard.__dict__["_max_capture_suffixes"]
+    _originals[CheckersBoard, "_max_capture_suffixes"] = method
+    CheckersBoard._max_capture_suffixes = _counted(_metrics, method)
+    return _metrics
+
+
+def disable():
+    global _metrics
+    for (cls, attr), method in _originals.items():
+        setattr(cls, attr, method)
+    _originals.clear()
+    _metrics = None
+
+
+def get_metrics() -> Optional[Metrics]:
+    return _metrics
+
+
+def log_periodically(
+    metrics: Metrics, interval: float = 60.0, reset: bool = False
+) -> threading.Event:
+    stop = threading.Event()
+
+    def run():
+        while not stop.wait(interval):
+            logger.info("rules engine metrics: %s", metrics.snapshot())
+            if reset:
+                metrics.reset()
+
+    threading.Thread(target=run, daemon=True).start()
+    return stop
@@ -0,0 +1,134 @@
+import heapq
+import mmap
+import os
+import struct
+from itertools import islice
+from typing import Iterable, Iterator, Optional, Tuple
+
+HEADER = struct.Struct("<4sIQ")
+KEY = struct.Struct("<Q")
+
+
+class MmapTable:
+    """Fixed-width records sorted by a 64-bit key in a memory-mapped file."""
+
+    def __init__(self, path: str, magic: bytes, value_format: str):
+        self._record = struct.Struct("<Q" + value_format)
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        if size < HEADER.size:
+            self._file.close()
+            raise ValueError(f"{path} is not a table file")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        file_magic, self.meta, self._count = HEADER.unpack_from(self._map)
+        if file_magic != magic or size != HEADER.size + self._count * self._record.size:
+            self.close()
+            raise ValueError(f"{path} is not a valid {magic!r} table")
+
+    @classmethod
+    def write(
+        cls,
+        path: str,
+        magic: bytes,
+        value_format: str,
+        records: Iterable[Tuple],
+        meta: int = 0,
+        presorted: bool = False,
+    ) -> int:
+        record = struct.Struct("<Q" + value_format)
+        if not presorted:
+            records = sorted(records, key=lambda r: r[0])
+        tmp_path = f"{path}.tmp"
+        count = 0
+        with open(tmp_path, "wb") as f:
+            f.write(HEADER.pack(magic, meta, 0))
+            for values in records:
+                f.write(record.pack(*values))
+                count += 1
+            f.seek(0)
+            f.write(HEADER.pack(magic, meta, count))
+        os.replace(tmp_path, path)
+        return count
+
+    @classmethod
+    def write_external(
+        cls,
+        path: str,
+        magic: bytes,
+        value_format: str,
+        records: Iterable[Tuple],
+        meta: int = 0,
+        chunk_size: int = 1 << 20,
+    ) -> int:
+        records = iter(records)
+        chunk_paths = []
+        try:
+            while True:
+                chunk = list(islice(records, chunk_size))
+                if not chunk:
+                    break
+                chunk_paths.append(f"{path}.{len(chunk_paths)}.chunk")
+                cls.write(chunk_paths[-1], magic, value_format, chunk)
+            chunks = [
+                cls(chunk_path, magic, value_format) for chunk_path in chunk_paths
+            ]
+            try:
+                merged = heapq.merge(*chunks, key=lambda r: r[0])
+                return cls.write(
+                    path, magic, value_format, merged, meta=meta, presorted=True
+                )
+            finally:
+                for chunk in chunks:
+                    chunk.close()
+        finally:
+            for chunk_path in chunk_paths:
+                os.remove(chunk_path)
+
+    def __len__(self):
+        return self._count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def _key_at(self, index: int) -> int:
+        return KEY.unpack_from(self._map, HEADER.size + index * self._record.size)[0]
+
+    def _lower_bound(self, key: int) -> int:
+        low, high = 0, self._count
+        while low < high:
+            mid = (low + high) // 2
+            if self._key_at(mid) < key:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def _values_at(self, index: int) -> Tuple:
+        return self._record.unpack_from(
+            self._map, HEADER.size + index * self._record.size
+        )[1:]
+
+    def get(self, key: int) -> Optional[Tuple]:
+        index = self._lower_bound(key)
+        if index < self._count and self._key_at(index) == key:
+            return self._values_at(index)
+        return None
+
+    def get_all(self, key: int) -> Iterator[Tuple]:
+        index = self._lower_bound(key)
+        while index < self._count and self._key_at(index) == key:
+            yield self._values_at(index)
+            index += 1
+
+    def __iter__(self) -> Iterator[Tuple]:
+        for index in range(self._count):
+            yield self._record.unpack_from(
+                self._map, HEADER.size + index * self._record.size
+            )
@@ -0,0 +1,249 @@
+import logging
+import re
+from itertools import islice
+from multiprocessing import Pool
+from typing import TYPE_CHECKING, Dict, IO, Iterable, Iterator, List, Optional, Tuple
+
+from .board import CheckersBoard, Move, init_board
+from .piece import BLACK, WHITE, FlyingKing, Piece, char_to_piece
+
+if TYPE_CHECKING:
+    from .game import Game
+
+logger = logging.getLogger(__name__)
+
+RESULTS = ("1-0", "0-1", "1/2-1/2", "2-0", "0-2", "1-1", "*")
+LINE_WIDTH = 79
+INVALID_SETUP = -1
+
+_TAG = re.compile(r'\[(\w+)\s+"((?:[^"\\]|\\.)*)"\]')
+_MOVE = re.compile(r"^(\d+)((?:[-x]\d+)+)$")
+_MOVE_NUMBER = re.compile(r"^\d+\.+")
+_FEN_SQUARE = re.compile(r"^(K?)(\d+)$")
+_TOKEN = re.compile(r'\{|\}|\(|\)|"[^"]*"|[^\s{}()]+')
+
+
+class PDNGame:
+    def __init__(
+        self,
+        tags: Optional[Dict[str, str]] = None,
+        moves: Optional[List[Move]] = None,
+        result: str = "*",
+    ):
+        self.tags = tags or {}
+        self.moves = moves or []
+        self.result = result
+
+    @classmethod
+    def from_game(cls, game: "Game", tags: Optional[Dict[str, str]] = None):
+        tags = dict(tags or {})
+        if game._init_state is not None:
+            tags["FEN"] = board_to_fen(CheckersBoard.from_ascii(game._init_state))
+        result = "*"
+        if game._winner is not None:
+            result = "1-0" if game._winner.color is WHITE else "0-1"
+        return cls(tags, list(game._moves), result)
+
+    def board(self) -> CheckersBoard:
+        if "FEN" in self.tags:
+            return board_from_fen(self.tags["FEN"])
+        return CheckersBoard.from_ascii()
+
+
+def square_number(x: int, y: int) -> int:
+    return CheckersBoard._coord_to_checkers_notation(x, y)
+
+
+def _number_to_notation(number: int) -> Tuple[int, str]:
+    if not 1 <= number <= 32:
+        raise ValueError(f"Invalid square number {number}")
+    x, y = CheckersBoard._checkers_notation_to_coord(number)
+    return 8 - x, chr(y + ord("A"))
+
+
+def _notation_to_number(notation: Tuple[int, str]) -> int:
+    row, col = notation
+    return square_number(8 - row, ord(col) - ord("A"))
+
+
+def _landings(move: Move) -> List[Tuple[int, int]]:
+    x, y = 8 - move.start[0], ord(move.start[1]) - ord("A")
+    landings = []
+    for (cx, cy), (nx, ny) in zip(move.captured, move.captured[1:]):
+        dx, dy = (cx > x) - (cx < x), (cy > y) - (cy < y)
+        x, y = cx + dx, cy + dy
+        while abs(nx - x) != abs(ny - y):
+            x, y = x + dx, y + dy
+        landings.append((x, y))
+    return landings
+
+
+def format_move(move: Move) -> str:
+    if not move.captured:
+        return f"{_notation_to_number(move.start)}-{_notation_to_number(move.end)}"
+    squares = [_notation_to_number(move.start)]
+    squares.extend(square_number(x, y) for x, y in _landings(move))
+    squares.append(_notation_to_number(move.end))
+    return "x".join(str(square) for square in squares)
+
+
+def parse_move(token: str) -> Move:
+    match = _MOVE.match(token)
+    if not match:
+        raise ValueError(f"Invalid move {token!r}")
+    path = [_number_to_notation(int(square)) for square in re.split("[-x]", token)]
+    return Move(path[0], path[-1], path=path if "x" in token else None)
+
+
+def board_to_fen(board: CheckersBoard) -> str:
+    squares = {WHITE: [], BLACK: []}
+    for number in range(1, 33):
+        x, y = CheckersBoard._checkers_notation_to_coord(number)
+        piece = board._board[x][y]
+        if isinstance(piece, Piece):
+            prefix = "K" if isinstance(piece, FlyingKing) else ""
+            squares[piece.color].append(f"{prefix}{number}")
+    side = "B" if board.turn is BLACK else "W"
+    return f"{side}:W{','.join(squares[WHITE])}:B{','.join(squares[BLACK])}"
+
+
+def board_from_fen(fen: str) -> CheckersBoard:
+    side, *fields = fen.strip().rstrip(".").split(":")
+    if side not in ("W", "B") or len(fields) != 2:
+        raise ValueError(f"Invalid FEN {fen!r}")
+    board = CheckersBoard.from_ascii(re.sub("[xo]", " ", init_board))
+    for field in fields:
+        char = {"W": "x", "B": "o"}.get(field[:1])
+        if char is None:
+            raise ValueError(f"Invalid FEN {fen!r}")
+        for square in filter(None, field[1:].split(",")):
+            match = _FEN_SQUARE.match(square.strip())
+            if not match or not 1 <= int(match.group(2)) <= 32:
+                raise ValueError(f"Invalid FEN square {square!r}")
+            piece = char.upper() if match.group(1) else char
+            x, y = CheckersBoard._checkers_notation_to_coord(int(match.group(2)))
+            board._put(x, y, char_to_piece[piece])
+    board.turn = BLACK if side == "B" else WHITE
+    return board
+
+
+def format_game(game: PDNGame) -> str:
+    lines = [f'[{tag} "{value}"]' for tag, value in game.tags.items()]
+    lines.append("")
+    tokens = []
+    black_first = game.board().turn is BLACK
+    for ply, move in enumerate(game.moves, start=black_first):
+        if ply % 2 == 0:
+            tokens.append(f"{ply // 2 + 1}.")
+        elif not tokens:
+            tokens.append(f"{ply // 2 + 1}...")
+        tokens.append(format_move(move))
+    tokens.append(game.result)
+    line = ""
+    for token in tokens:
+        if line and len(line) + 1 + len(token) > LINE_WIDTH:
+            lines.append(line)
+            line = token
+        else:
+            line = f"{line} {token}" if line else token
+    lines.append(line)
+    return "\n".join(lines) + "\n"
+
+
+def write_games(games: Iterable[PDNGame], stream: IO[str]):
+    for index, game in enumerate(games):
+        if index:
+            stream.write("\n")
+        stream.write(format_game(game))
+
+
+def iter_games(stream: Iterable[str]) -> Iterator[PDNGame]:
+    game = PDNGame()
+    comment = variation = 0
+    in_movetext = skipping = False
+    for number, line in enumerate(stream, start=1):
+        stripped = line.strip()
+        if not comment and not variation and stripped.startswith("["):
+            if in_movetext:
+                if game.moves and not skipping:
+                    yield game
+                game = PDNGame()
+                in_movetext = skipping = False
+            tags = _TAG.findall(stripped)
+            if not tags or _TAG.sub("", stripped).strip():
+                logger.warning("Skipping game: invalid tag on line %d", number)
+                skipping = True
+            game.tags.update(tags)
+            if "FEN" in dict(tags):
+                try:
+                    board_from_fen(game.tags["FEN"])
+                except ValueError:
+                    logger.warning("Skipping game: invalid FEN on line %d", number)
+                    skipping = True
+            continue
+        for token in _TOKEN.findall(stripped):
+            if token == "{":
+                comment += 1
+            elif token == "}":
+                comment = max(comment - 1, 0)
+            elif comment:
+                continue
+            elif token == "(":
+                variation += 1
+            elif token == ")":
+                variation = max(variation - 1, 0)
+            elif variation or token.startswith('"'):
+                continue
+            elif token in RESULTS:
+                game.result = token
+                if not skipping:
+                    yield game
+                game = PDNGame()
+                in_movetext = skipping = False
+            else:
+                in_movetext = True
+                token = _MOVE_NUMBER.sub("", token)
+                if not token or skipping:
+                    continue
+                try:
+                    game.moves.append(parse_move(token))
+                except ValueError:
+                    logger.warning(
+                        "Skipping game: invalid move %r on line %d", token, number
+                    )
+                    skipping = True
+    if (game.moves or game.tags) and not skipping:
+        yield game
+
+
+def read_games(path: str) -> Iterator[PDNGame]:
+    with open(path) as stream:
+        yield from iter_games(stream)
+
+
+def validate_game(game: PDNGame) -> Optional[int]:
+    try:
+        board = game.board()
+    except ValueError:
+        return INVALID_SETUP
+    return board.apply_many(game.moves, validate=True)
+
+
+def validate_games(
+    games: Iterable[PDNGame],
+    processes: Optional[int] = None,
+    chunksize: int = 64,
+    batch: int = 4096,
+) -> Iterator[Tuple[PDNGame, Optional[int]]]:
+    games = iter(games)
+    if processes is None:
+        for game in games:
+            yield game, validate_game(game)
+        return
+    with Pool(processes) as pool:
+        while True:
+            pending = list(islice(games, batch))
+            if not pending:
+                return
+            results = pool.imap(validate_game, pending, chunksize)
+            yield from zip(pending, results)
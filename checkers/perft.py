@@ -0,0 +1,90 @@
+import argparse
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple
+
+from .bitboard import BitboardCheckersBoard
+from .board import Board, CheckersBoard
+
+BOARD_CLASSES = {"list": CheckersBoard, "bitboard": BitboardCheckersBoard}
+
+opening = None
+
+midgame = """
+-o- -o-o
+o-o- - -
+- -o-o-o
+o- - - -
+- -x-x-x
+x- - -x-
+-x-x- -x
+x- -x-x-
+"""
+
+king_heavy = """
+- - - -O
+ - - - -
+-X- - -o
+O- - - -
+- -x- -X
+ - - - -
+- - -X-x
+X- - - -
+"""
+
+POSITIONS = {"opening": opening, "midgame": midgame, "king_heavy": king_heavy}
+
+REFERENCE_NODE_COUNTS = {
+    "opening": [7, 49, 302, 1469, 7473, 37628],
+    "midgame": [11, 61, 307, 1512, 6379, 28329],
+    "king_heavy": [18, 43, 358, 1390, 12477, 74266],
+}
+
+
+def perft(board: Board, depth: int) -> int:
+    if depth == 0:
+        return 1
+    moves = board.legal_moves(board.turn)
+    if depth == 1:
+        return len(moves)
+    nodes = 0
+    for move in list(moves):
+        record = board.make_move(move)
+        nodes += perft(board, depth - 1)
+        board.unmake_move(record)
+    return nodes
+
+
+def divide(board: Board, depth: int) -> Dict[Tuple, int]:
+    counts = {}
+    for move in list(board.legal_moves(board.turn)):
+        record = board.make_move(move)
+        key = (move.start, move.end, tuple(move.captured))
+        counts[key] = perft(board, depth - 1)
+        board.unmake_move(record)
+    return counts
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Count move-generation nodes.")
+    parser.add_argument("depth", type=int)
+    parser.add_argument("--position", choices=POSITIONS, default="opening")
+    parser.add_argument("--board", choices=BOARD_CLASSES, default="bitboard")
+    parser.add_argument("--divide", action="store_true")
+    args = parser.parse_args(argv)
+
+    board = BOARD_CLASSES[args.board].from_ascii(POSITIONS[args.position])
+    if args.divide:
+        for (start, end, captured), nodes in divide(board, args.depth).items():
+            print(f"{start[1]}{start[0]}-{end[1]}{end[0]} x{len(captured)}: {nodes}")
+    for depth in range(1, args.depth + 1):
+        started = perf_counter()
+        nodes = perft(board, depth)
+        elapsed = perf_counter() - started
+        print(
+            f"depth {depth}: {nodes} nodes in {elapsed:.3f}s "
+            f"({nodes / max(elapsed, 1e-9):.0f} nodes/s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
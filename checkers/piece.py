@@ -1,86 +1,112 @@
-from functools import partial
-from typing import Iterable, Tuple
+from typing import Dict, Iterable, Tuple
+from .diagonals import diagonal_tables
 
 
-class Field:
+class Interned:
+    __slots__ = ()
+
+    def __new__(cls):
+        instance = cls.__dict__.get("_instance")
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._instance = instance
+        return instance
+
+    def __reduce__(self):
+        return type(self), ()
+
+
+class Field(Interned):
+    __slots__ = ()
     char = "?"
 
     def __str__(self):
         return self.char
 
-    def __eq__(self, other):
-        return self.char == other.char
-
 
 class InaccessibleField(Field):
+    __slots__ = ()
     char = "-"
 
 
 class AccessibleField(Field):
+    __slots__ = ()
     char = " "
 
 
-class Color:
+class Color(Interned):
+    __slots__ = ()
     char = "?"
     name = "?"
 
     def __str__(self):
         return self.char
 
-    def __eq__(self, other):
-        return self.char == other.char
-
 
 class White(Color):
+    __slots__ = ()
     char = "x"
     name = "white"
 
 
 class Black(Color):
+    __slots__ = ()
     char = "o"
     name = "black"
 
 
 class Piece:
-    def __init__(self, color: Color):
-        self.color = color
-        self.char = color.char
+    __slots__ = ("color", "char")
+    _instances: Dict[Tuple[type, Color], "Piece"] = {}
+
+    def __new__(cls, color: Color):
+        instance = Piece._instances.get((cls, color))
+        if instance is None:
+            instance = super().__new__(cls)
+            object.__setattr__(instance, "color", color)
+            object.__setattr__(instance, "char", color.char)
+            Piece._instances[cls, color] = instance
+        return instance
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Pieces are immutable")
+
+    def __reduce__(self):
+        return type(self), (self.color,)
 
     def __str__(self):
         return str(self.color)
 
 
 class Man(Piece):
+    __slots__ = ()
+
     def get_diagonal_moves(self, x: int, y: int, dim: int) -> Iterable[Tuple[int, int]]:
-        if isinstance(self.color, White):
-            return [(x - 1, y - 1), (x - 1, y + 1)]
-        elif isinstance(self.color, Black):
-            return [(x + 1, y - 1), (x + 1, y + 1)]
+        return list(diagonal_tables(dim).man_steps[self.color.char][x][y])
 
 
 class FlyingKing(Piece):
+    __slots__ = ()
+
     def __str__(self):
         return str(self.color).capitalize()
 
     def get_diagonal_moves(self, x: int, y: int, dim: int) -> Iterable[Tuple[int, int]]:
-        dirs = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
-        moves = []
-        for dx, dy in dirs:
-            for i in range(1, dim):
-                new_x, new_y = x + i * dx, y + i * dy
-                if not (0 <= new_x < dim and 0 <= new_y < dim):
-                    break
-                moves.append((new_x, new_y))
-        return moves
+        return [move for ray in diagonal_tables(dim).rays[x][y] for move in ray]
+
 
+WHITE = White()
+BLACK = Black()
+ACCESSIBLE_FIELD = AccessibleField()
+INACCESSIBLE_FIELD = InaccessibleField()
 
 char_to_piece = {
-    "o": partial(Man, color=Black()),
-    "x": partial(Man, color=White()),
-    "O": partial(FlyingKing, color=Black()),
-    "X": partial(FlyingKing, color=White()),
-    " ": partial(AccessibleField),
-    "-": partial(InaccessibleField),
+    "o": Man(BLACK),
+    "x": Man(WHITE),
+    "O": FlyingKing(BLACK),
+    "X": FlyingKing(WHITE),
+    " ": ACCESSIBLE_FIELD,
+    "-": INACCESSIBLE_FIELD,
 }
 
 color_to_char = {
@@ -1,8 +1,46 @@
+from typing import Optional
+
+from .board import Board, Move
+from .book import OpeningBook
+from .engine import SearchEngine
+
+
 class Player:
     def __init__(self, name):
         self.name = name
 
 
+class ComputerPlayer(Player):
+    def __init__(
+        self,
+        name,
+        engine: Optional[SearchEngine] = None,
+        max_depth: Optional[int] = None,
+        max_move_time: float = 5.0,
+        moves_to_go: int = 30,
+        book: Optional[OpeningBook] = None,
+    ):
+        super().__init__(name)
+        self.engine = engine or SearchEngine()
+        self.max_depth = max_depth
+        self.max_move_time = max_move_time
+        self.moves_to_go = moves_to_go
+        self.book = book
+
+    def time_budget(self) -> float:
+        remaining_time = getattr(self, "remaining_time", None)
+        if remaining_time is None:
+            return self.max_move_time
+        return max(0.0, min(self.max_move_time, remaining_time / self.moves_to_go))
+
+    def choose_move(self, board: Board) -> Optional[Move]:
+        if self.book is not None:
+            move = self.book.choose(board)
+            if move is not None:
+                return move
+        return self.engine.search(board, self.time_budget(), self.max_depth).move
+
+
 class Winner:
     def __init__(self, player):
         self.player = player
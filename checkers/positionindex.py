@@ -0,0 +1,140 @@
+from collections import Counter
+from itertools import groupby
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .board import Board, Move
+from .codec import (
+    _square_indexes,
+    _to_coord,
+    _to_notation,
+    decode_game,
+    playable_squares,
+)
+from .mmaptable import MmapTable
+
+MAGIC = b"CKPI"
+OCCURRENCE_FORMAT = "IHBB"
+MOVES_MAGIC = b"CKPM"
+MOVES_FORMAT = "BBI"
+NO_MOVE = 0xFF
+
+
+class NextMove:
+    __slots__ = ("move", "games")
+
+    def __init__(self, move: Move, games: int):
+        self.move = move
+        self.games = games
+
+
+def occurrences(
+    games: Iterable[Tuple[int, bytes]], dim: int = 8
+) -> Iterator[Tuple[int, int, int, int, int]]:
+    for game_id, record in games:
+        board, moves = decode_game(record)
+        if board.dim != dim:
+            continue
+        indexes = _square_indexes(board.dim)
+        for ply, move in enumerate(moves):
+            key = board.zobrist_hash
+            yield (
+                key,
+                game_id,
+                ply,
+                indexes[_to_coord(board.dim, move.start)],
+                indexes[_to_coord(board.dim, move.end)],
+            )
+            board.move(move)
+        yield board.zobrist_hash, game_id, len(moves), NO_MOVE, NO_MOVE
+
+
+def _move_counts(
+    table: MmapTable,
+) -> Iterator[Tuple[int, int, int, int]]:
+    for key, group in groupby(table, key=lambda r: r[0]):
+        played = {
+            (start, end, game_id)
+            for _, game_id, _, start, end in group
+            if start != NO_MOVE
+        }
+        counts = Counter((start, end) for start, end, _ in played)
+        for (start, end), games in sorted(counts.items()):
+            yield key, start, end, games
+
+
+def build(
+    path: str,
+    games: Iterable[Tuple[int, bytes]],
+    dim: int = 8,
+    chunk_size: int = 1 << 20,
+) -> int:
+    count = MmapTable.write_external(
+        path,
+        MAGIC,
+        OCCURRENCE_FORMAT,
+        occurrences(games, dim),
+        meta=dim,
+        chunk_size=chunk_size,
+    )
+    with MmapTable(path, MAGIC, OCCURRENCE_FORMAT) as table:
+        MmapTable.write(
+            f"{path}.moves",
+            MOVES_MAGIC,
+            MOVES_FORMAT,
+            _move_counts(table),
+            meta=dim,
+            presorted=True,
+        )
+    return count
+
+
+class PositionIndex:
+    def __init__(self, path: str):
+        self._occurrences = MmapTable(path, MAGIC, OCCURRENCE_FORMAT)
+        self._moves = MmapTable(f"{path}.moves", MOVES_MAGIC, MOVES_FORMAT)
+        self.dim = self._occurrences.meta
+
+    def __len__(self):
+        return len(self._occurrences)
+
+    def close(self):
+        self._occurrences.close()
+        self._moves.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def games(self, board: Board, limit: Optional[int] = None) -> List[int]:
+        game_ids: Dict[int, None] = {}
+        if limit == 0:
+            return []
+        for game_id, _ in self.occurrences(board):
+            game_ids[game_id] = None
+            if len(game_ids) == limit:
+                break
+        return list(game_ids)
+
+    def occurrences(self, board: Board) -> Iterator[Tuple[int, int]]:
+        if board.dim != self.dim:
+            return
+        for game_id, ply, *_ in self._occurrences.get_all(board.zobrist_hash):
+            yield game_id, ply
+
+    def next_moves(self, board: Board) -> List[NextMove]:
+        if board.dim != self.dim:
+            return []
+        squares = playable_squares(self.dim)
+        moves = [
+            NextMove(
+                Move(
+                    _to_notation(board.dim, squares[start]),
+                    _to_notation(board.dim, squares[end]),
+                ),
+                games,
+            )
+            for start, end, games in self._moves.get_all(board.zobrist_hash)
+        ]
+        return sorted(moves, key=lambda m: m.games, reverse=True)
@@ -0,0 +1,60 @@
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Iterator, Optional, Tuple
+
+from .engine import SearchEngine
+from .game import Game
+from .piece import WHITE
+from .player import ComputerPlayer
+
+
+def _result(game: Game) -> str:
+    if game._winner is None:
+        return "1/2-1/2"
+    return "1-0" if game._winner.color is WHITE else "0-1"
+
+
+def play_game(
+    seed: int,
+    max_depth: int = 4,
+    move_time: float = 1.0,
+    max_plies: int = 200,
+    random_plies: int = 4,
+    table_size: int = 1 << 14,
+) -> Tuple[bytes, str]:
+    rng = random.Random(seed)
+    white, black = (
+        ComputerPlayer(
+            name,
+            engine=SearchEngine(table_size),
+            max_depth=max_depth,
+            max_move_time=move_time,
+        )
+        for name in ("white", "black")
+    )
+    game = Game(white, black, playing_time=math.inf)
+    board = game._board
+    for _ in range(random_plies):
+        legal_moves = board.legal_moves(board.turn)
+        if not legal_moves or game.move(rng.choice(legal_moves)):
+            break
+    while game._winner is None and len(game._moves) < max_plies:
+        game.play_computer_move()
+    return game.to_bytes(), _result(game)
+
+
+def run(
+    games: int,
+    workers: Optional[int] = None,
+    seed: int = 0,
+    chunksize: int = 1,
+    **options,
+) -> Iterator[Tuple[bytes, str]]:
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(
+            partial(play_game, **options),
+            range(seed, seed + games),
+            chunksize=chunksize,
+        )
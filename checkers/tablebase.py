@@ -0,0 +1,147 @@
+import argparse
+from collections import deque
+from itertools import combinations, product
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from .bitboard import BitboardCheckersBoard, _dark_squares, _squares
+from .board import Board
+from .mmaptable import MmapTable
+from .piece import BLACK, WHITE
+
+MAGIC = b"CKTB"
+VALUE_FORMAT = "BH"
+
+DRAW, WIN, LOSS = 0, 1, 2
+
+
+class TablebaseEntry:
+    __slots__ = ("result", "distance")
+
+    def __init__(self, result: int, distance: int):
+        self.result = result
+        self.distance = distance
+
+
+def _placements(dim: int, count: int) -> Iterator[Tuple[int, int, int]]:
+    squares = list(_squares(_dark_squares(dim)))
+    for chosen in combinations(squares, count):
+        for chars in product("xXoO", repeat=count):
+            white = black = kings = 0
+            for square, char in zip(chosen, chars):
+                x = square // dim
+                if char == "x" and x == 0 or char == "o" and x == dim - 1:
+                    break
+                bit = 1 << square
+                if char in "xX":
+                    white |= bit
+                else:
+                    black |= bit
+                if char in "XO":
+                    kings |= bit
+            else:
+                yield white, black, kings
+
+
+def positions(dim: int, max_pieces: int) -> Iterator[BitboardCheckersBoard]:
+    for count in range(1, max_pieces + 1):
+        for white, black, kings in _placements(dim, count):
+            for turn in (WHITE, BLACK):
+                waiting = black if turn is WHITE else white
+                if not waiting:
+                    continue
+                board = BitboardCheckersBoard.from_bitboards(white, black, kings, dim)
+                board.turn = turn
+                yield board
+
+
+def _successors(board: BitboardCheckersBoard) -> Set[int]:
+    successors = set()
+    for move in board.legal_moves(board.turn):
+        record = board._apply(move)
+        successors.add(board.zobrist_hash)
+        board.unmake_move(record)
+    return successors
+
+
+def solve(dim: int, max_pieces: int) -> Dict[int, Tuple[int, int]]:
+    keys: List[int] = []
+    index: Dict[int, int] = {}
+    successors: List[List[int]] = []
+    for board in positions(dim, max_pieces):
+        index[board.zobrist_hash] = len(keys)
+        keys.append(board.zobrist_hash)
+        successors.append(list(_successors(board)))
+
+    predecessors: List[List[int]] = [[] for _ in keys]
+    remaining = [0] * len(keys)
+    for i, children in enumerate(successors):
+        for child in children:
+            predecessors[index[child]].append(i)
+        remaining[i] = len(children)
+
+    results = [DRAW] * len(keys)
+    distances = [0] * len(keys)
+    queue = deque(i for i, count in enumerate(remaining) if count == 0)
+    for i in queue:
+        results[i] = LOSS
+    while queue:
+        i = queue.popleft()
+        for parent in predecessors[i]:
+            if results[parent] != DRAW:
+                continue
+            if results[i] == LOSS:
+                results[parent], distances[parent] = WIN, distances[i] + 1
+                queue.append(parent)
+            else:
+                remaining[parent] -= 1
+                if remaining[parent] == 0:
+                    results[parent], distances[parent] = LOSS, distances[i] + 1
+                    queue.append(parent)
+    return {key: (results[i], distances[i]) for i, key in enumerate(keys)}
+
+
+def build(path: str, dim: int = 8, max_pieces: int = 3) -> int:
+    solved = solve(dim, max_pieces)
+    return MmapTable.write(
+        path,
+        MAGIC,
+        VALUE_FORMAT,
+        ((key, result, distance) for key, (result, distance) in solved.items()),
+        meta=dim << 8 | max_pieces,
+    )
+
+
+class Tablebase:
+    def __init__(self, path: str):
+        self._table = MmapTable(path, MAGIC, VALUE_FORMAT)
+        self.dim = self._table.meta >> 8
+        self.max_pieces = self._table.meta & 0xFF
+
+    def __len__(self):
+        return len(self._table)
+
+    def close(self):
+        self._table.close()
+
+    def probe(self, board: Board) -> Optional[TablebaseEntry]:
+        if board.dim != self.dim or sum(1 for _ in board) > self.max_pieces:
+            return None
+        return self.probe_hash(board.zobrist_hash)
+
+    def probe_hash(self, key: int) -> Optional[TablebaseEntry]:
+        values = self._table.get(key)
+        return TablebaseEntry(*values) if values is not None else None
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Build an endgame tablebase.")
+    parser.add_argument("path")
+    parser.add_argument("--pieces", type=int, default=3)
+    parser.add_argument("--dim", type=int, default=8)
+    args = parser.parse_args(argv)
+    count = build(args.path, dim=args.dim, max_pieces=args.pieces)
+    print(f"wrote {count} positions to {args.path}")
+
+
+if __name__ == "__main__":
+    main()
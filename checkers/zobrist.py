@@ -0,0 +1,28 @@
+import random
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+SEED = 0x5EED
+PIECE_CHARS = "xXoO"
+
+
+class ZobristKeys:
+    def __init__(self, dim: int, seed: int = SEED):
+        rng = random.Random(seed * 1000 + dim)
+        self.dim = dim
+        self.pieces: Dict[str, List[int]] = {
+            char: [rng.getrandbits(64) for _ in range(dim * dim)]
+            for char in PIECE_CHARS
+        }
+        self.black_to_move = rng.getrandbits(64)
+
+    def hash(self, pieces: Iterable[Tuple[int, str]], black_to_move: bool) -> int:
+        value = self.black_to_move if black_to_move else 0
+        for square, char in pieces:
+            value ^= self.pieces[char][square]
+        return value
+
+
+@lru_cache(maxsize=None)
+def zobrist_keys(dim: int) -> ZobristKeys:
+    return ZobristKeys(dim)
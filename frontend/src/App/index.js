@@ -1,41 +1,98 @@
-import { useState } from "react";
+import { useEffect, useRef, useState } from "react";
 import Board from "../Board/index";
 
+const GAME_URL =
+  process.env.REACT_APP_GAME_URL || "ws://localhost:8000/ws/games/default/";
+
 function idx2piece(idx) {
   if (0 < idx && idx <= 12) return "black";
   if (12 < idx && idx <= 20) return null;
   if (20 < idx && idx <= 32) return "white";
 }
 
-function coordsToCheckersNotation(x, y) {
-  return x % 2 === 0 ? 4 * x + (y + 1) / 2 : 4 * x + y / 2 + 1;
+function initBoard() {
+  const board = {};
+  for (let i = 1; i <= 32; i++) board[i] = idx2piece(i);
+  return board;
 }
 
-function App() {
-  const initBoard = {};
-  for (let i = 1; i <= 32; i++) initBoard[i] = idx2piece(i);
-  const [piecePositions, setPiecePosition] = useState(initBoard);
-  const onChange = (from, to, color) => {
-    const piece = coordsToCheckersNotation(...to);
-    if (Number.isInteger(piece) && piecePositions[piece] === null) {
-      piecePositions[piece] = color;
-      const toNull = coordsToCheckersNotation(...from);
-      piecePositions[toNull] = null;
-      const copy = Object.assign({}, piecePositions);
-      setPiecePosition(copy);
-    }
+const PIECE_CODES = { white: "w", black: "b" };
+
+function checksum(positions) {
+  let a = 1;
+  let b = 0;
+  for (let i = 1; i <= 32; i++) {
+    a = (a + (PIECE_CODES[positions[i]] || ".").charCodeAt(0)) % 65521;
+    b = (b + a) % 65521;
+  }
+  return b * 65536 + a;
+}
+
+function applyDelta(positions, { from, to, color, captured }) {
+  const next = { ...positions, [from]: null };
+  captured.forEach((square) => (next[square] = null));
+  next[to] = color;
+  return next;
+}
+
+function coordsToField([x, y]) {
+  return [8 - x, String.fromCharCode(65 + y)];
+}
+
+function useGame(color) {
+  const [piecePositions, setPiecePositions] = useState(initBoard);
+  const socket = useRef(null);
+  const seq = useRef(0);
+  useEffect(() => {
+    const ws = new WebSocket(`${GAME_URL}?color=${color}`);
+    const resync = () => ws.send(JSON.stringify({ type: "sync" }));
+    ws.onmessage = (event) => {
+      const message = JSON.parse(event.data);
+      if (message.type === "state") {
+        seq.current = message.seq;
+        setPiecePositions(message.positions);
+      }
+      if (message.type === "delta") {
+        if (message.seq !== seq.current + 1 || !message.move) return resync();
+        seq.current = message.seq;
+        setPiecePositions((positions) => {
+          const next = applyDelta(positions, message.move);
+          if ("checksum" in message && checksum(next) !== message.checksum)
+            resync();
+          return next;
+        });
+      }
+    };
+    socket.current = ws;
+    return () => ws.close();
+  }, [color]);
+  const move = (from, to) => {
+    if (socket.current && socket.current.readyState === WebSocket.OPEN)
+      socket.current.send(
+        JSON.stringify({
+          type: "move",
+          start: coordsToField(from),
+          end: coordsToField(to),
+        })
+      );
   };
+  return [piecePositions, move];
+}
+
+function App() {
+  const [whitePositions, moveAsWhite] = useGame("white");
+  const [blackPositions, moveAsBlack] = useGame("black");
   return (
     <div>
       <Board
-        positions={piecePositions}
-        onChange={onChange}
+        positions={whitePositions}
+        onChange={moveAsWhite}
         perspective="white"
       />
       ----
       <Board
-        positions={piecePositions}
-        onChange={onChange}
+        positions={blackPositions}
+        onChange={moveAsBlack}
         perspective="black"
       />
     </div>
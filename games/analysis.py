@@ -0,0 +1,167 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Iterable, Optional
+
+from django.conf import settings
+
+from checkers.board import CheckersBoard, Move
+from checkers.book import OpeningBook
+from checkers.engine import SearchEngine
+from checkers.piece import BLACK, char_to_piece, color_to_char
+from checkers.tablebase import Tablebase
+
+CACHE_SIZE = 4096
+CACHE_TTL = 300.0
+MOVE_TIME = 0.5
+MAX_DEPTH = 8
+
+
+class TTLCache:
+    def __init__(
+        self,
+        maxsize: int = CACHE_SIZE,
+        ttl: float = CACHE_TTL,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key: Hashable):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires = entry
+            if expires <= self.timer():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value):
+        with self._lock:
+            self._data[key] = (value, self.timer() + self.ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+def board_from_request(
+    positions: Dict, turn: str = "white", kings: Iterable = ()
+) -> CheckersBoard:
+    if turn not in ("white", "black"):
+        raise ValueError(f"Unknown side to move: {turn}")
+    notation = {square: None for square in range(1, 33)}
+    for square, color in positions.items():
+        square = int(square)
+        if square not in notation or color not in color_to_char:
+            raise ValueError(f"Invalid square {square}: {color}")
+        notation[square] = color
+    board = CheckersBoard.from_checkers_notation(notation)
+    for square in kings:
+        color = notation.get(int(square))
+        if color is None:
+            raise ValueError(f"No piece to crown on square {square}")
+        x, y = CheckersBoard._checkers_notation_to_coord(int(square))
+        board._put(x, y, char_to_piece[color_to_char[color].upper()])
+    if turn == "black":
+        board.turn = BLACK
+    return board
+
+
+def _move_to_dict(board: CheckersBoard, move: Move) -> Dict:
+    to_square = CheckersBoard._coord_to_checkers_notation
+    return {
+        "from": to_square(*board._cord2idx(*move.start)),
+        "to": to_square(*board._cord2idx(*move.end)),
+        "captured": [to_square(x, y) for x, y in move.captured],
+    }
+
+
+class Analyzer:
+    def __init__(
+        self,
+        cache: Optional[TTLCache] = None,
+        engine: Optional[SearchEngine] = None,
+        book: Optional[OpeningBook] = None,
+        move_time: float = MOVE_TIME,
+        max_depth: int = MAX_DEPTH,
+    ):
+        self.cache = cache or TTLCache()
+        self.engine = engine or SearchEngine()
+        self.book = book
+        self.move_time = move_time
+        self.max_depth = max_depth
+        self._lock = threading.Lock()
+
+    def analyze(self, board: CheckersBoard) -> Dict:
+        analysis = self.cache.get(board.zobrist_hash)
+        if analysis is not None:
+            return {**analysis, "cached": True}
+        analysis = self._analyze(board)
+        self.cache.put(board.zobrist_hash, analysis)
+        return {**analysis, "cached": False}
+
+    def _analyze(self, board: CheckersBoard) -> Dict:
+        moves = board.legal_moves(board.turn)
+        analysis = {
+            "turn": board.turn.name,
+            "moves": [_move_to_dict(board, move) for move in moves],
+            "best_move": None,
+            "score": None,
+            "depth": 0,
+            "source": None,
+        }
+        if not moves:
+            return analysis
+        book_moves = self.book.moves(board) if self.book is not None else []
+        book_moves = [m for m in book_moves if m.move in moves]
+        if book_moves:
+            best = next(m for m in moves if m == book_moves[0].move)
+            analysis.update(best_move=_move_to_dict(board, best), source="book")
+            return analysis
+        with self._lock:
+            result = self.engine.search(board, self.move_time, self.max_depth)
+        best = next(m for m in moves if m == result.move)
+        analysis.update(
+            best_move=_move_to_dict(board, best),
+            score=result.score,
+            depth=result.depth,
+            source="search",
+        )
+        return analysis
+
+
+_analyzer: Optional[Analyzer] = None
+_analyzer_lock = threading.Lock()
+
+
+def get_analyzer() -> Analyzer:
+    global _analyzer
+    with _analyzer_lock:
+        if _analyzer is None:
+            tablebase = getattr(settings, "TABLEBASE_PATH", None)
+            book = getattr(settings, "OPENING_BOOK_PATH", None)
+            _analyzer = Analyzer(
+                cache=TTLCache(
+                    getattr(settings, "ANALYSIS_CACHE_SIZE", CACHE_SIZE),
+                    getattr(settings, "ANALYSIS_CACHE_TTL", CACHE_TTL),
+                ),
+                engine=SearchEngine(
+                    tablebase=Tablebase(tablebase) if tablebase else None
+                ),
+                book=OpeningBook(book) if book else None,
+                move_time=getattr(settings, "ANALYSIS_MOVE_TIME", MOVE_TIME),
+            )
+        return _analyzer
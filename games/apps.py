@@ -0,0 +1,16 @@
+from django.apps import AppConfig
+from django.conf import settings
+
+
+class GamesConfig(AppConfig):
+    name = "games"
+
+    def ready(self):
+        if not getattr(settings, "CHECKERS_METRICS", False):
+            return
+        from checkers import instrumentation
+
+        metrics = instrumentation.enable()
+        interval = getattr(settings, "CHECKERS_METRICS_LOG_INTERVAL", None)
+        if interval:
+            instrumentation.log_periodically(metrics, interval)
@@ -0,0 +1,48 @@
+from urllib.parse import parse_qs
+
+from channels.generic.websocket import AsyncJsonWebsocketConsumer
+
+from . import rooms
+from .store import ConflictError
+
+SEAT_TAKEN = 4003
+
+
+class GameConsumer(AsyncJsonWebsocketConsumer):
+    async def connect(self):
+        self.game_id = self.scope["url_route"]["kwargs"]["game_id"]
+        self.group_name = f"game_{self.game_id}"
+        query = parse_qs(self.scope.get("query_string", b"").decode())
+        self.seat = query.get("color", [None])[0]
+        self.room = await rooms.join(self.game_id)
+        if self.seat is not None and not self.room.claim(self.seat, self.channel_name):
+            self.seat = None
+            await self.close(code=SEAT_TAKEN)
+            return
+        await self.channel_layer.group_add(self.group_name, self.channel_name)
+        await self.accept()
+        await self.send_json({"type": "state", **(await self.room.snapshot())})
+
+    async def disconnect(self, code):
+        self.room.release(self.seat, self.channel_name)
+        await self.channel_layer.group_discard(self.group_name, self.channel_name)
+        rooms.leave(self.game_id)
+
+    async def receive_json(self, content, **kwargs):
+        if content.get("type") == "sync":
+            await self.send_json({"type": "state", **(await self.room.snapshot())})
+            return
+        if content.get("type") != "move":
+            await self.send_json({"type": "error", "message": "Unknown message"})
+            return
+        try:
+            update = await self.room.move(content["start"], content["end"], self.seat)
+        except (KeyError, IndexError, TypeError, ValueError, ConflictError) as e:
+            await self.send_json({"type": "error", "message": str(e)})
+            return
+        await self.channel_layer.group_send(
+            self.group_name, {"type": "board.delta", **update}
+        )
+
+    async def board_delta(self, event):
+        await self.send_json({**event, "type": "delta"})
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from checkers.positionindex import build
+
+from ...models import GameRecord
+
+
+class Command(BaseCommand):
+    help = "Index every stored game by the positions it reaches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("output", help="File to write the position index to.")
+        parser.add_argument("--chunk-size", type=int, default=1 << 20)
+
+    def handle(self, *args, **options):
+        games = GameRecord.objects.values_list("id", "record").iterator()
+        count = build(
+            options["output"],
+            ((game_id, bytes(record)) for game_id, record in games),
+            chunk_size=options["chunk_size"],
+        )
+        self.stdout.write(f"Indexed {count} positions")
@@ -0,0 +1,37 @@
+from collections import Counter
+
+from django.core.management.base import BaseCommand
+
+from checkers.codec import write_record
+from checkers.selfplay import run
+
+
+class Command(BaseCommand):
+    help = "Play engine-vs-engine games across worker processes."
+
+    def add_arguments(self, parser):
+        parser.add_argument("output", help="File to write game records to.")
+        parser.add_argument("--games", type=int, default=100)
+        parser.add_argument("--workers", type=int, default=None)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--depth", type=int, default=4)
+        parser.add_argument("--move-time", type=float, default=1.0)
+        parser.add_argument("--max-plies", type=int, default=200)
+        parser.add_argument("--random-plies", type=int, default=4)
+
+    def handle(self, *args, **options):
+        results = Counter()
+        with open(options["output"], "wb") as output:
+            for record, result in run(
+                options["games"],
+                workers=options["workers"],
+                seed=options["seed"],
+                max_depth=options["depth"],
+                move_time=options["move_time"],
+                max_plies=options["max_plies"],
+                random_plies=options["random_plies"],
+            ):
+                write_record(output, record)
+                results[result] += 1
+        summary = ", ".join(f"{result}: {n}" for result, n in sorted(results.items()))
+        self.stdout.write(f"Wrote {sum(results.values())} games ({summary})")
@@ -0,0 +1,84 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:28
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="GameRecord",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("white", models.CharField(max_length=150)),
+                ("black", models.CharField(max_length=150)),
+                (
+                    "result",
+                    models.CharField(
+                        choices=[
+                            ("1-0", "White won"),
+                            ("0-1", "Black won"),
+                            ("1/2-1/2", "Draw"),
+                        ],
+                        max_length=7,
+                    ),
+                ),
+                ("plies", models.PositiveIntegerField()),
+                ("record", models.BinaryField()),
+                (
+                    "finished_at",
+                    models.DateTimeField(
+                        db_index=True, default=django.utils.timezone.now
+                    ),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="MoveRecord",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("ply", models.PositiveIntegerField()),
+                ("start", models.PositiveSmallIntegerField()),
+                ("end", models.PositiveSmallIntegerField()),
+                ("captures", models.PositiveSmallIntegerField(default=0)),
+                (
+                    "game",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="moves",
+                        to="games.gamerecord",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["game", "ply"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("game", "ply"), name="unique_game_ply"
+                    )
+                ],
+            },
+        ),
+    ]
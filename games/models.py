@@ -0,0 +1,27 @@
+from django.db import models
+from django.utils import timezone
+
+
+class GameRecord(models.Model):
+    RESULTS = [("1-0", "White won"), ("0-1", "Black won"), ("1/2-1/2", "Draw")]
+
+    white = models.CharField(max_length=150)
+    black = models.CharField(max_length=150)
+    result = models.CharField(max_length=7, choices=RESULTS)
+    plies = models.PositiveIntegerField()
+    record = models.BinaryField()
+    finished_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+
+class MoveRecord(models.Model):
+    game = models.ForeignKey(GameRecord, related_name="moves", on_delete=models.CASCADE)
+    ply = models.PositiveIntegerField()
+    start = models.PositiveSmallIntegerField()
+    end = models.PositiveSmallIntegerField()
+    captures = models.PositiveSmallIntegerField(default=0)
+
+    class Meta:
+        ordering = ["game", "ply"]
+        constraints = [
+            models.UniqueConstraint(fields=["game", "ply"], name="unique_game_ply")
+        ]
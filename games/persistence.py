@@ -0,0 +1,158 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from django.db import close_old_connections, connection, transaction
+
+from checkers.board import CheckersBoard
+from checkers.game import Game
+from checkers.piece import WHITE
+
+from .models import GameRecord, MoveRecord
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 500
+FLUSH_INTERVAL = 1.0
+RETRIES = 3
+RETRY_DELAY = 1.0
+
+PendingGame = Tuple[str, str, str, bytes, List[Tuple[int, int, int]]]
+
+
+def result(game: Game) -> str:
+    if game.winner is None:
+        return "1/2-1/2"
+    return "1-0" if game.winner.color is WHITE else "0-1"
+
+
+def _square(row: int, col: str) -> int:
+    return CheckersBoard._coord_to_checkers_notation(8 - row, ord(col) - ord("A"))
+
+
+def pending_game(game: Game) -> PendingGame:
+    white, black = game.players
+    moves = [
+        (_square(*move.start), _square(*move.end), len(move.captured))
+        for move in game.moves
+    ]
+    return white.name, black.name, result(game), game.to_bytes(), moves
+
+
+class WriteBehindQueue:
+    def __init__(
+        self,
+        batch_size: int = BATCH_SIZE,
+        flush_interval: float = FLUSH_INTERVAL,
+        retries: int = RETRIES,
+        retry_delay: float = RETRY_DELAY,
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self._queue: "queue.Queue[Optional[PendingGame]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, game: Game):
+        self._queue.put(pending_game(game))
+
+    def flush(self):
+        self._queue.join()
+
+    def close(self):
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+    def _next_batch(
+        self, timeout: Optional[float] = None
+    ) -> Tuple[List[PendingGame], bool]:
+        batch: List[PendingGame] = []
+        try:
+            item = self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return batch, False
+        deadline = time.monotonic() + self.flush_interval
+        while item is not None:
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                return batch, False
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                return batch, False
+        self._queue.task_done()
+        return batch, True
+
+    def _try_write(self, batch: List[PendingGame]) -> bool:
+        try:
+            self._write(batch)
+        except Exception:
+            logger.exception("Failed to write %d games", len(batch))
+            return False
+        return True
+
+    def _run(self):
+        try:
+            closed = False
+            failed: List[PendingGame] = []
+            while not closed:
+                timeout = self.retry_delay if failed else None
+                batch, closed = self._next_batch(timeout)
+                pending, failed = failed + batch, []
+                if pending and not self._try_write(pending):
+                    failed = pending
+                for _ in batch:
+                    self._queue.task_done()
+            for _ in range(self.retries):
+                if not failed:
+                    break
+                time.sleep(self.retry_delay)
+                if self._try_write(failed):
+                    failed = []
+            if failed:
+                logger.error("Dropping %d unwritten games", len(failed))
+        finally:
+            connection.close()
+
+    def _write(self, batch: List[PendingGame]):
+        close_old_connections()
+        with transaction.atomic():
+            games = GameRecord.objects.bulk_create(
+                GameRecord(
+                    white=white,
+                    black=black,
+                    result=result,
+                    plies=len(moves),
+                    record=record,
+                )
+                for white, black, result, record, moves in batch
+            )
+            MoveRecord.objects.bulk_create(
+                (
+                    MoveRecord(
+                        game=game, ply=ply, start=start, end=end, captures=captures
+                    )
+                    for game, (*_, moves) in zip(games, batch)
+                    for ply, (start, end, captures) in enumerate(moves)
+                ),
+                batch_size=self.batch_size * 50,
+            )
+
+
+_recorder: Optional[WriteBehindQueue] = None
+_recorder_lock = threading.Lock()
+
+
+def get_recorder() -> WriteBehindQueue:
+    global _recorder
+    with _recorder_lock:
+        if _recorder is None:
+            _recorder = WriteBehindQueue()
+            atexit.register(_recorder.close)
+        return _recorder
@@ -0,0 +1,142 @@
+import asyncio
+import zlib
+from typing import Dict, List, Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from checkers.board import Move
+from checkers.game import Game
+
+from .persistence import get_recorder
+from .store import ConflictError, GameStore, redis_store
+
+CHECKSUM_INTERVAL = 10
+PIECE_CODES = {"white": "w", "black": "b", None: "."}
+SEATS = ("white", "black")
+
+
+def checksum(checkers_notation: Dict[int, Optional[str]]) -> int:
+    signature = "".join(
+        PIECE_CODES[checkers_notation[square]] for square in sorted(checkers_notation)
+    )
+    return zlib.adler32(signature.encode())
+
+
+def _winner(game: Game) -> Optional[str]:
+    winner = game.winner
+    return winner.color.name if winner is not None else None
+
+
+class GameRoom:
+    def __init__(
+        self,
+        game_id: str,
+        store: GameStore,
+        checksum_interval: int = CHECKSUM_INTERVAL,
+    ):
+        self.game_id = game_id
+        self.store = store
+        self.lock = asyncio.Lock()
+        self.connections = 0
+        self.checksum_interval = checksum_interval
+        self.opened: Optional[asyncio.Future] = None
+        self.seats: Dict[str, str] = {}
+
+    def open(self):
+        try:
+            self.store.create(self.game_id, "white", "black")
+        except ConflictError:
+            pass
+
+    def claim(self, seat: str, owner: str) -> bool:
+        if seat not in SEATS:
+            return False
+        return self.seats.setdefault(seat, owner) == owner
+
+    def release(self, seat: Optional[str], owner: str):
+        if seat is not None and self.seats.get(seat) == owner:
+            del self.seats[seat]
+
+    def state(self) -> dict:
+        game, version = self.store.load(self.game_id)
+        return {
+            "seq": version,
+            "positions": game.to_checkers_notation(),
+            "turn": game.turn.name,
+            "winner": _winner(game),
+        }
+
+    def apply(self, start: List, end: List, seat: Optional[str] = None) -> dict:
+        move = Move(start=(int(start[0]), start[1]), end=(int(end[0]), end[1]))
+
+        def play(game: Game):
+            if game.winner is not None:
+                raise ValueError("The game is over")
+            if seat != game.turn.name:
+                raise ValueError("Not your turn")
+            plies = len(game.moves)
+            game.move(move)
+            moved.append(len(game.moves) > plies)
+
+        moved: List[bool] = []
+        game, version = self.store.update(self.game_id, play)
+        delta = game.last_move_delta() if moved[-1] else None
+        update = {
+            "seq": version,
+            "move": delta.to_dict() if delta is not None else None,
+            "turn": game.turn.name,
+            "winner": _winner(game),
+        }
+        if version % self.checksum_interval == 0:
+            update["checksum"] = checksum(game.to_checkers_notation())
+        if game.winner is not None:
+            get_recorder().submit(game)
+        return update
+
+    async def snapshot(self) -> dict:
+        return await sync_to_async(self.state, thread_sensitive=False)()
+
+    async def move(self, start: List, end: List, seat: Optional[str] = None) -> dict:
+        async with self.lock:
+            return await sync_to_async(self.apply, thread_sensitive=False)(
+                start, end, seat
+            )
+
+
+_store: Optional[GameStore] = None
+rooms: Dict[str, GameRoom] = {}
+
+
+def get_store() -> GameStore:
+    global _store
+    if _store is None:
+        url = getattr(settings, "GAME_STORE_URL", None)
+        _store = redis_store(url) if url else GameStore()
+    return _store
+
+
+async def join(game_id: str) -> GameRoom:
+    room = rooms.get(game_id)
+    if room is None:
+        room = rooms[game_id] = GameRoom(game_id, get_store())
+        room.opened = asyncio.ensure_future(
+            sync_to_async(room.open, thread_sensitive=False)()
+        )
+    room.connections += 1
+    if room.opened is not None:
+        try:
+            await asyncio.shield(room.opened)
+        except Exception:
+            leave(game_id)
+            raise
+    return room
+
+
+def leave(game_id: str):
+    room = rooms.get(game_id)
+    if room is None:
+        return
+    room.connections -= 1
+    if room.connections <= 0:
+        del rooms[game_id]
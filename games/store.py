@@ -0,0 +1,126 @@
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+import redis
+
+from checkers.board import Move
+from checkers.game import Game
+from checkers.player import Player
+
+KEY_PREFIX = "game:"
+TTL = 24 * 60 * 60
+FINISHED_TTL = 60 * 60
+
+COMPARE_AND_SET = """
+local version = redis.call('HGET', KEYS[1], 'version')
+if (version or '0') ~= ARGV[1] then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'version', ARGV[2], 'state', ARGV[3])
+redis.call('PEXPIRE', KEYS[1], ARGV[4])
+return 1
+"""
+
+
+class ConflictError(Exception):
+    pass
+
+
+class InMemoryBackend:
+    def __init__(self, timer: Callable[[], float] = time.monotonic):
+        self._lock = threading.Lock()
+        self._data: Dict[str, Tuple[bytes, int, float]] = {}
+        self.timer = timer
+
+    def _current(self, key: str) -> Optional[Tuple[bytes, int, float]]:
+        current = self._data.get(key)
+        if current is not None and current[2] <= self.timer():
+            del self._data[key]
+            return None
+        return current
+
+    def get(self, key: str) -> Optional[Tuple[bytes, int]]:
+        with self._lock:
+            current = self._current(key)
+        return current[:2] if current else None
+
+    def compare_and_set(
+        self, key: str, state: bytes, version: int, ttl: float = TTL
+    ) -> bool:
+        with self._lock:
+            current = self._current(key)
+            if (current[1] if current else 0) != version:
+                return False
+            self._data[key] = (state, version + 1, self.timer() + ttl)
+            return True
+
+
+class RedisBackend:
+    def __init__(self, client):
+        self._client = client
+        self._compare_and_set = client.register_script(COMPARE_AND_SET)
+
+    def get(self, key: str) -> Optional[Tuple[bytes, int]]:
+        state, version = self._client.hmget(key, "state", "version")
+        if state is None:
+            return None
+        return state, int(version)
+
+    def compare_and_set(
+        self, key: str, state: bytes, version: int, ttl: float = TTL
+    ) -> bool:
+        return bool(
+            self._compare_and_set(
+                keys=[key], args=[version, version + 1, state, int(ttl * 1000)]
+            )
+        )
+
+
+class GameStore:
+    def __init__(
+        self,
+        backend=None,
+        retries: int = 5,
+        timer: Callable[[], float] = time.time,
+        ttl: float = TTL,
+        finished_ttl: float = FINISHED_TTL,
+    ):
+        self.backend = backend or InMemoryBackend()
+        self.retries = retries
+        self.timer = timer
+        self.ttl = ttl
+        self.finished_ttl = finished_ttl
+
+    def create(self, game_id: str, white: str, black: str, **options) -> Game:
+        game = Game(Player(white), Player(black), timer=self.timer, **options)
+        if not self.backend.compare_and_set(
+            KEY_PREFIX + game_id, game.to_state(), 0, self.ttl
+        ):
+            raise ConflictError(f"Game {game_id} already exists")
+        return game
+
+    def load(self, game_id: str) -> Tuple[Game, int]:
+        stored = self.backend.get(KEY_PREFIX + game_id)
+        if stored is None:
+            raise KeyError(game_id)
+        state, version = stored
+        return Game.from_state(state, timer=self.timer), version
+
+    def update(self, game_id: str, change: Callable[[Game], None]) -> Tuple[Game, int]:
+        for _ in range(self.retries):
+            game, version = self.load(game_id)
+            change(game)
+            ttl = self.ttl if game.winner is None else self.finished_ttl
+            if self.backend.compare_and_set(
+                KEY_PREFIX + game_id, game.to_state(), version, ttl
+            ):
+                return game, version + 1
+        raise ConflictError(f"Game {game_id} is being updated concurrently")
+
+    def move(self, game_id: str, move: Move) -> Tuple[Game, int]:
+        return self.update(game_id, lambda game: game.move(move))
+
+
+def redis_store(url: str, **options) -> GameStore:
+    return GameStore(RedisBackend(redis.Redis.from_url(url)), **options)
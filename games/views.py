@@ -0,0 +1,31 @@
+import json
+
+from django.http import Http404, HttpResponse, JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+
+from checkers import instrumentation
+
+from .analysis import board_from_request, get_analyzer
+
+
+@csrf_exempt
+@require_POST
+def analyze(request):
+    try:
+        body = json.loads(request.body)
+        board = board_from_request(
+            body["positions"], body.get("turn", "white"), body.get("kings", ())
+        )
+    except (KeyError, AttributeError, TypeError, ValueError) as e:
+        return JsonResponse({"error": str(e)}, status=400)
+    return JsonResponse(get_analyzer().analyze(board))
+
+
+def metrics(request):
+    collected = instrumentation.get_metrics()
+    if collected is None:
+        raise Http404("Instrumentation is disabled")
+    return HttpResponse(
+        collected.to_prometheus(), content_type="text/plain; version=0.0.4"
+    )
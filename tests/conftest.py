@@ -0,0 +1,64 @@
+import os
+import random
+import tempfile
+
+import pytest
+
+from checkers.board import CheckersBoard
+
+try:
+    import django
+    from django.conf import settings
+except ImportError:
+    django = None
+
+DATABASE = os.path.join(tempfile.gettempdir(), f"checkers-tests-{os.getpid()}.sqlite3")
+
+
+def pytest_configure(config):
+    if django is None or settings.configured:
+        return
+    settings.configure(
+        INSTALLED_APPS=["games"],
+        DATABASES={
+            "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": DATABASE}
+        },
+        CHANNEL_LAYERS={"default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}},
+        USE_TZ=True,
+    )
+    django.setup()
+
+
+def pytest_unconfigure(config):
+    if os.path.exists(DATABASE):
+        os.remove(DATABASE)
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def timer():
+    return FakeTimer()
+
+
+def playout(seed, plies, board=None):
+    rng = random.Random(seed)
+    board = board if board is not None else CheckersBoard.from_ascii()
+    for _ in range(plies):
+        legal = board.legal_moves(board.turn)
+        if not legal:
+            return
+        move = rng.choice(legal)
+        yield move
+        board.make_move(move)
+
+
+@pytest.fixture
+def random_playout():
+    return playout
@@ -0,0 +1,118 @@
+import json
+
+import pytest
+
+pytest.importorskip("django")
+
+from django.http import Http404  # noqa: E402
+from django.test import RequestFactory  # noqa: E402
+
+from checkers.board import CheckersBoard, Move  # noqa: E402
+from checkers.engine import SearchEngine  # noqa: E402
+from checkers.piece import BLACK  # noqa: E402
+from games import analysis, views  # noqa: E402
+from games.analysis import Analyzer, TTLCache, board_from_request  # noqa: E402
+
+
+class CountingEngine(SearchEngine):
+    searches = 0
+
+    def search(self, *args, **kwargs):
+        self.searches += 1
+        return super().search(*args, **kwargs)
+
+
+def test_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2)
+    cache.put(1, "a")
+    cache.put(2, "b")
+    assert cache.get(1) == "a"
+    cache.put(3, "c")
+    assert (cache.get(1), cache.get(2), cache.get(3)) == ("a", None, "c")
+
+
+def test_cache_expires_entries(timer):
+    cache = TTLCache(ttl=10, timer=timer)
+    cache.put(1, "a")
+    timer.now = 9.9
+    assert cache.get(1) == "a"
+    timer.now = 10
+    assert cache.get(1) is None
+    assert len(cache) == 0
+
+
+def test_board_from_request_matches_game_notation():
+    board = CheckersBoard.from_ascii()
+    board.move(Move((3, "C"), (4, "D")))
+    requested = board_from_request(board.to_checkers_notation(), "black")
+    assert str(requested) == str(board)
+    assert requested.zobrist_hash == board.zobrist_hash
+
+
+def test_board_from_request_crowns_kings():
+    board = board_from_request({"1": "white", "32": "black"}, "black", kings=[1])
+    assert str(board).strip("\n").split("\n")[0] == "-X- - - "
+    assert board.turn is BLACK
+
+
+@pytest.mark.parametrize(
+    "positions, turn, kings",
+    [({"33": "white"}, "white", []), ({"1": "red"}, "white", []), ({}, "x", [])],
+)
+def test_board_from_request_rejects_invalid_positions(positions, turn, kings):
+    with pytest.raises(ValueError):
+        board_from_request(positions, turn, kings)
+
+
+def test_analyzer_caches_by_position():
+    engine = CountingEngine()
+    analyzer = Analyzer(engine=engine, move_time=5.0, max_depth=2)
+    first = analyzer.analyze(CheckersBoard.from_ascii())
+    second = analyzer.analyze(CheckersBoard.from_ascii())
+    assert (first["cached"], second["cached"]) == (False, True)
+    assert engine.searches == 1
+    assert len(first["moves"]) == 7
+    assert first["best_move"] in first["moves"]
+    assert first["source"] == "search" and first["depth"] == 2
+
+
+def test_analyzer_reports_forced_captures():
+    board = board_from_request({"22": "white", "18": "black", "1": "black"})
+    result = Analyzer(move_time=5.0, max_depth=2).analyze(board)
+    assert result["moves"] == [{"from": 22, "to": 15, "captured": [18]}]
+    assert result["best_move"] == result["moves"][0]
+
+
+def test_analyzer_handles_finished_positions():
+    board = board_from_request({"1": "black"})
+    result = Analyzer().analyze(board)
+    assert result["moves"] == [] and result["best_move"] is None
+
+
+def test_analyze_view(monkeypatch):
+    monkeypatch.setattr(analysis, "_analyzer", Analyzer(move_time=5.0, max_depth=1))
+    factory = RequestFactory()
+    body = {"positions": CheckersBoard.from_ascii().to_checkers_notation()}
+    response = views.analyze(
+        factory.post("/api/analyze", json.dumps(body), "application/json")
+    )
+    assert response.status_code == 200
+    assert len(json.loads(response.content)["moves"]) == 7
+    bad = views.analyze(factory.post("/api/analyze", "{}", "application/json"))
+    assert bad.status_code == 400
+    assert views.analyze(factory.get("/api/analyze")).status_code == 405
+
+
+def test_metrics_view_requires_instrumentation():
+    from checkers import instrumentation
+
+    factory = RequestFactory()
+    with pytest.raises(Http404):
+        views.metrics(factory.get("/metrics"))
+    instrumentation.enable()
+    try:
+        CheckersBoard.from_ascii().legal_moves(BLACK)
+        response = views.metrics(factory.get("/metrics"))
+    finally:
+        instrumentation.disable()
+    assert b"checkers_calls_total" in response.content
@@ -0,0 +1,81 @@
+import itertools
+
+import pytest
+
+from checkers.bitboard import BitboardCheckersBoard
+from checkers.board import CheckersBoard
+from checkers.engine import evaluate as evaluate_one
+from checkers.perft import king_heavy, midgame
+
+np = pytest.importorskip("numpy")
+batch = pytest.importorskip("checkers.batch")
+
+
+@pytest.fixture
+def random_positions(random_playout):
+    def positions(seed, count=60):
+        boards = []
+        for game in itertools.count():
+            board = BitboardCheckersBoard.from_ascii()
+            for _ in random_playout(seed * 1000 + game, count, board):
+                if len(boards) == count:
+                    return boards
+                copy = BitboardCheckersBoard.from_ascii(str(board))
+                copy.turn = board.turn
+                boards.append(copy)
+
+    return positions
+
+
+def test_batch_scores_match_engine_evaluation(random_positions):
+    boards = random_positions(0)
+    boards += [BitboardCheckersBoard.from_ascii(p) for p in (midgame, king_heavy)]
+    scores = batch.evaluate(batch.encode_boards(boards))
+    assert scores.tolist() == [evaluate_one(board) for board in boards]
+
+
+def test_encoded_positions_decode_in_bulk(random_positions):
+    boards = random_positions(1, count=20)
+    data = b"".join(board.to_bytes() for board in boards)
+    decoded = batch.decode_positions(data)
+    assert decoded.dtype == np.uint64
+    assert (decoded == batch.encode_boards(boards)).all()
+
+
+def test_list_boards_are_converted():
+    board = CheckersBoard.from_ascii(king_heavy)
+    bitboard = BitboardCheckersBoard.from_ascii(king_heavy)
+    assert (batch.encode_boards([board]) == batch.encode_boards([bitboard])).all()
+
+
+def test_features_are_named_columns():
+    features = batch.features(batch.encode_boards([CheckersBoard.from_ascii()]))
+    assert features.shape == (1, len(batch.FEATURES))
+    assert features.tolist() == [[0, 0, 0, 0]]
+
+
+def test_invalid_encodings_are_rejected():
+    with pytest.raises(ValueError):
+        batch.decode_positions(b"\xff" * 16 + b"\x00")
+    with pytest.raises(ValueError):
+        batch.decode_positions(b"\x00" * 16 + b"\x02")
+
+
+def test_capture_flags_match_legal_moves(random_positions):
+    boards = random_positions(2, count=200)
+    boards += [BitboardCheckersBoard.from_ascii(p) for p in (midgame, king_heavy)]
+    flags = batch.capture_flags(batch.encode_boards(boards))
+    expected = [
+        bool(board.legal_moves(board.turn))
+        and bool(board.legal_moves(board.turn)[0].captured)
+        for board in boards
+    ]
+    assert flags.tolist() == expected
+    assert any(expected) and not all(expected)
+
+
+def test_simple_move_counts_match_move_generator(random_positions):
+    boards = random_positions(3, count=200)
+    boards += [BitboardCheckersBoard.from_ascii(p) for p in (midgame, king_heavy)]
+    counts = batch.simple_move_counts(batch.encode_boards(boards))
+    assert counts.tolist() == [len(b._simple_moves(b.turn)) for b in boards]
@@ -0,0 +1,77 @@
+import pytest
+
+from checkers.bitboard import BitboardCheckersBoard
+from checkers.board import CheckersBoard
+from checkers.perft import perft, POSITIONS
+from checkers.piece import White
+
+pytest.importorskip("pytest_benchmark")
+
+BOARD_CLASSES = [CheckersBoard, BitboardCheckersBoard]
+ROUNDS = 100
+
+
+def first_white_piece(board):
+    for x, row in enumerate(board._board):
+        for y, piece in enumerate(row):
+            if str(piece) in "xX":
+                return (x, y), piece
+
+
+@pytest.mark.benchmark(group="from_ascii")
+@pytest.mark.parametrize("board_cls", BOARD_CLASSES)
+@pytest.mark.parametrize("position", POSITIONS)
+def test_from_ascii(benchmark, board_cls, position):
+    benchmark.pedantic(board_cls.from_ascii, args=(POSITIONS[position],), rounds=ROUNDS)
+
+
+@pytest.mark.benchmark(group="to_checkers_notation")
+@pytest.mark.parametrize("board_cls", BOARD_CLASSES)
+@pytest.mark.parametrize("position", POSITIONS)
+def test_to_checkers_notation(benchmark, board_cls, position):
+    board = board_cls.from_ascii(POSITIONS[position])
+    benchmark.pedantic(board.to_checkers_notation, rounds=ROUNDS)
+
+
+@pytest.mark.benchmark(group="possible_moves")
+@pytest.mark.parametrize("position", POSITIONS)
+def test_possible_moves(benchmark, position):
+    board = CheckersBoard.from_ascii(POSITIONS[position])
+    coord, piece = first_white_piece(board)
+    benchmark.pedantic(
+        board._possible_moves, args=(board._ind2cord(coord), piece), rounds=ROUNDS
+    )
+
+
+@pytest.mark.benchmark(group="max_capture")
+@pytest.mark.parametrize("position", POSITIONS)
+def test_get_moves_with_max_capture(benchmark, position):
+    board = CheckersBoard.from_ascii(POSITIONS[position])
+    (x, y), piece = first_white_piece(board)
+    mode = "man" if str(piece) == "x" else "flying_king"
+    benchmark.pedantic(
+        board._get_moves_with_max_capture,
+        args=(x, y),
+        kwargs={"color": piece.color, "mode": mode},
+        rounds=ROUNDS,
+    )
+
+
+@pytest.mark.benchmark(group="move")
+@pytest.mark.parametrize("board_cls", BOARD_CLASSES)
+@pytest.mark.parametrize("position", POSITIONS)
+def test_move(benchmark, board_cls, position):
+    move = board_cls.from_ascii(POSITIONS[position]).legal_moves(White())[0]
+
+    def setup():
+        return (board_cls.from_ascii(POSITIONS[position]),), {}
+
+    benchmark.pedantic(lambda board: board.move(move), setup=setup, rounds=ROUNDS)
+
+
+@pytest.mark.benchmark(group="perft")
+@pytest.mark.parametrize("board_cls", BOARD_CLASSES)
+@pytest.mark.parametrize("position", POSITIONS)
+def test_perft(benchmark, board_cls, position):
+    board = board_cls.from_ascii(POSITIONS[position])
+    assert benchmark.pedantic(perft, args=(board, 3), rounds=5) == perft(board, 3)
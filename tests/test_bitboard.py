@@ -0,0 +1,155 @@
+import pytest
+
+from checkers.bitboard import BitboardCheckersBoard
+from checkers.board import CheckersBoard, Move
+from checkers.game import Game
+from checkers.piece import Man, AccessibleField, InaccessibleField, White
+from checkers.player import Player
+from test_board import (
+    init_state,
+    testdata,
+    jumpdata,
+    man_flying_king_cases,
+    flying_king_moves_all_over_the_board,
+    flying_king_captures_opponents,
+    invalid_moves,
+    any_left_data,
+    lower_precedence_data,
+    board_moved_to_4D,
+)
+
+
+def test_bitboard_parses_ascii_representation():
+    board = BitboardCheckersBoard.from_ascii(init_state)
+    assert str(board) == init_state
+
+
+def test_can_get_bitboard_element():
+    board = BitboardCheckersBoard.from_ascii(init_state)
+    assert type(board[8, "B"]) == Man
+    assert type(board[8, "A"]) == InaccessibleField
+    assert type(board[5, "A"]) == AccessibleField
+
+
+def test_bitboards_of_initial_position():
+    board = BitboardCheckersBoard.from_ascii(init_state)
+    assert bin(board.white).count("1") == 12
+    assert bin(board.black).count("1") == 12
+    assert board.kings == 0
+    assert bin(board.empty).count("1") == 8
+    assert str(BitboardCheckersBoard.from_bitboards(board.white, board.black, 0)) == (
+        init_state
+    )
+
+
+@pytest.mark.parametrize("initial_board,moves,expected_board", testdata)
+def test_man_can_move_diagonal(initial_board, moves, expected_board):
+    board = BitboardCheckersBoard.from_ascii(initial_board)
+    for move in moves:
+        board.move(move)
+    assert str(board) == str(CheckersBoard.from_ascii(expected_board))
+
+
+@pytest.mark.parametrize(
+    "given,move,then,dim",
+    jumpdata
+    + man_flying_king_cases
+    + flying_king_moves_all_over_the_board
+    + flying_king_captures_opponents,
+)
+def test_bitboard_applies_moves_like_checkers_board(given, move, then, dim):
+    board = BitboardCheckersBoard.from_ascii(given, dim=dim)
+    board.move(move)
+    assert str(board) == str(CheckersBoard.from_ascii(then, dim=dim))
+
+
+@pytest.mark.parametrize(
+    "given,move,dim",
+    invalid_moves + [(b, m, d) for b, d, m in lower_precedence_data],
+)
+def test_bitboard_raises_error_when_given_invalid_move(given, move, dim):
+    board = BitboardCheckersBoard.from_ascii(given, dim=dim)
+    with pytest.raises(ValueError):
+        board.move(move)
+    assert str(board) == str(CheckersBoard.from_ascii(given, dim=dim))
+
+
+def test_bitboard_raises_type_error_when_moving_empty_field():
+    board = BitboardCheckersBoard.from_ascii(init_state)
+    with pytest.raises(TypeError):
+        board.move(Move(start=(4, "B"), end=(5, "C")))
+
+
+@pytest.mark.parametrize("board,dim,color,expected_result", any_left_data)
+def test_if_any_pieces_of_given_color_left(board, dim, color, expected_result):
+    board = BitboardCheckersBoard.from_ascii(board, dim=dim)
+    assert board.any_pieces_left(color) is expected_result
+
+
+def test_converts_between_checkers_notation_and_bitboard():
+    board = CheckersBoard.from_ascii(init_state)
+    bitboard = BitboardCheckersBoard.from_ascii(init_state)
+    notation = board.to_checkers_notation()
+    assert bitboard.to_checkers_notation() == notation
+    assert str(BitboardCheckersBoard.from_checkers_notation(notation)) == init_state
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_games_match_checkers_board(seed, random_playout):
+    board = CheckersBoard.from_ascii()
+    bitboard = BitboardCheckersBoard.from_ascii()
+    for move in random_playout(seed, 120, BitboardCheckersBoard.from_ascii()):
+        board.move(move)
+        bitboard.move(move)
+        assert str(bitboard) == str(board)
+
+
+def test_game_can_be_played_and_undone_on_bitboard():
+    board = BitboardCheckersBoard.from_ascii()
+    game = Game(Player("Alice"), Player("Bob"), board=board)
+    game.move(Move(start=(3, "C"), end=(4, "D")))
+    game.move(Move(start=(6, "B"), end=(5, "A")))
+    game.undo()
+    assert game.board() == board_moved_to_4D
+
+
+@pytest.mark.parametrize(
+    "given,move,then,dim",
+    jumpdata + man_flying_king_cases + flying_king_captures_opponents,
+)
+def test_bitboard_unmake_move_restores_position(given, move, then, dim):
+    board = BitboardCheckersBoard.from_ascii(given, dim=dim)
+    record = board.make_move(move)
+    assert str(board) == str(CheckersBoard.from_ascii(then, dim=dim))
+    board.unmake_move(record)
+    assert str(board) == str(CheckersBoard.from_ascii(given, dim=dim))
+    expected = CheckersBoard.from_ascii(given, dim=dim).make_move(move)
+    assert record.promoted == expected.promoted
+    assert [c for c, _ in record.captured] == [c for c, _ in expected.captured]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_legal_moves_match_checkers_board(seed, random_playout):
+    board = CheckersBoard.from_ascii()
+    bitboard = BitboardCheckersBoard.from_ascii()
+
+    def assert_same_moves():
+        expected = board.legal_moves(board.turn)
+        moves = bitboard.legal_moves(bitboard.turn)
+        assert sorted((m.start, m.end, len(m.captured)) for m in moves) == sorted(
+            (m.start, m.end, len(m.captured)) for m in expected
+        )
+
+    for move in random_playout(seed, 120, BitboardCheckersBoard.from_ascii()):
+        assert_same_moves()
+        board.move(move)
+        bitboard.move(move)
+    assert_same_moves()
+
+
+def test_bitboard_legal_moves_are_cached_until_board_changes():
+    board = BitboardCheckersBoard.from_ascii(init_state)
+    moves = board.legal_moves(White())
+    assert board.legal_moves(White()) is moves
+    board.move(Move(start=(3, "C"), end=(4, "D")))
+    assert board.legal_moves(White()) is not moves
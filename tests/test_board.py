@@ -1,5 +1,6 @@
 import pytest
 
+from checkers.bitboard import BitboardCheckersBoard
 from checkers.board import CheckersBoard, Move
 from checkers.piece import Man, AccessibleField, InaccessibleField, Black, White
 
@@ -527,6 +528,16 @@ x- -
         Move(start=(1, "A"), end=(4, "D")),
         4,
     ),
+    (
+        """
+- - 
+ - -
+-x- 
+X- -
+""",
+        Move(start=(1, "A"), end=(3, "C")),
+        4,
+    ),
 ]
 
 
@@ -648,3 +659,110 @@ def test_converts_between_checkers_notation_and_board_object():
     new_board = CheckersBoard.from_checkers_notation(expected_dict)
     assert expected_dict == board.to_checkers_notation()
     assert str(new_board) == str(board)
+
+
+@pytest.mark.parametrize(
+    "given,move,then,dim",
+    jumpdata + man_flying_king_cases + flying_king_captures_opponents,
+)
+def test_unmake_move_restores_position(given, move, then, dim):
+    board = CheckersBoard.from_ascii(given, dim=dim)
+    record = board.make_move(move)
+    assert str(board) == str(CheckersBoard.from_ascii(then, dim=dim))
+    board.unmake_move(record)
+    assert str(board) == str(CheckersBoard.from_ascii(given, dim=dim))
+
+
+def test_undo_record_holds_captured_pieces_and_promotion():
+    board = CheckersBoard.from_ascii(jumpdata[0][0], dim=4)
+    record = board.make_move(jumpdata[0][1])
+    assert record.promoted
+    assert [position for position, _ in record.captured] == [(1, 2)]
+    assert all(type(piece) == Man for _, piece in record.captured)
+
+
+def test_legal_moves_apply_max_capture_rule_across_all_pieces():
+    board = CheckersBoard.from_ascii(lower_precedence_data[0][0], dim=4)
+    moves = board.legal_moves(White())
+    assert [(m.start, m.end, len(m.captured)) for m in moves] == [
+        ((2, "D"), (4, "B"), 1)
+    ]
+
+
+def test_legal_moves_are_cached_until_board_changes():
+    board = CheckersBoard.from_ascii(init_state)
+    moves = board.legal_moves(White())
+    assert len(moves) == 7
+    assert board.legal_moves(White()) is moves
+    board.move(Move(start=(3, "C"), end=(4, "D")))
+    assert board.legal_moves(White()) is not moves
+    assert len(board.legal_moves(Black())) == 7
+
+
+def test_max_capture_search_returns_every_longest_sequence():
+    board = CheckersBoard.from_ascii(flying_king_captures_opponents[3][0], dim=8)
+    board._board[3][0] = AccessibleField()
+    sequences = board._get_moves_with_max_capture(3, 0, color=White())
+    assert sorted(sequences) == [
+        ([(2, 1), (2, 3), (4, 3), (4, 1)], (3, 0)),
+        ([(4, 1), (4, 3), (2, 3), (2, 1)], (3, 0)),
+    ]
+
+
+def test_max_capture_search_keeps_already_captured_pieces():
+    board = CheckersBoard.from_ascii(flying_king_captures_opponents[3][0], dim=8)
+    sequences = board._get_moves_with_max_capture(
+        3, 0, color=White(), captured=[(2, 1)]
+    )
+    assert sequences == [([(2, 1), (4, 1), (4, 3), (2, 3)], (1, 2))]
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_apply_many_applies_whole_move_list(validate):
+    board = CheckersBoard.from_ascii(init_state)
+    moves = [
+        Move(start=(3, "C"), end=(4, "D")),
+        Move(start=(6, "B"), end=(5, "A")),
+        Move(start=(2, "D"), end=(3, "C")),
+        Move(start=(7, "C"), end=(6, "B")),
+    ]
+    assert board.apply_many(moves, validate=validate) is None
+    assert str(board) == board_after_multiple_moves
+
+
+def test_apply_many_reports_first_illegal_move():
+    board = CheckersBoard.from_ascii(init_state)
+    moves = [
+        Move(start=(3, "C"), end=(4, "D")),
+        Move(start=(4, "D"), end=(5, "E")),
+        Move(start=(6, "B"), end=(5, "A")),
+    ]
+    assert board.apply_many(moves) == 1
+    assert str(board) == board_moved_to_4D
+
+
+@pytest.mark.parametrize("board_class", [CheckersBoard, BitboardCheckersBoard])
+def test_move_returns_minimal_delta(board_class):
+    board = board_class.from_ascii(
+        """
+- - - - 
+ -o- - -
+-x- - - 
+ - - - -
+- - - - 
+ - - - -
+- - - - 
+ - - - -
+"""
+    )
+    before = board.to_checkers_notation()
+    delta = board.move(Move(start=(6, "B"), end=(8, "D")))
+    assert delta.to_dict() == {
+        "from": 9,
+        "to": 2,
+        "color": "white",
+        "captured": [6],
+        "promoted": True,
+    }
+    delta.apply(before)
+    assert before == board.to_checkers_notation()
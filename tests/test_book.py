@@ -0,0 +1,87 @@
+import io
+import random
+
+import pytest
+
+from checkers.board import CheckersBoard, Move
+from checkers.book import OpeningBook, build
+from checkers.pdn import iter_games
+from checkers.player import ComputerPlayer
+
+ARCHIVE = """[Event "1"]
+1. 22-18 11-15 2. 18x11 8x15 1-0
+
+[Event "2"]
+1. 22-18 11-15 2. 18x11 8x15 0-1
+
+[Event "3"]
+1. 22-18 10-14 1-0
+
+[Event "4"]
+1. 24-20 11-15 *
+"""
+
+
+@pytest.fixture
+def book(tmp_path):
+    path = str(tmp_path / "opening.book")
+    build(path, iter_games(io.StringIO(ARCHIVE)))
+    book = OpeningBook(path)
+    yield book
+    book.close()
+
+
+def test_book_ranks_moves_by_popularity(book):
+    moves = book.moves(CheckersBoard.from_ascii())
+    assert [(m.move.start, m.move.end, m.games, m.wins) for m in moves] == [
+        ((3, "C"), (4, "D"), 3, 2),
+        ((3, "G"), (4, "H"), 1, 0),
+    ]
+
+
+def test_book_follows_transpositions_by_hash(book):
+    board = CheckersBoard.from_ascii()
+    board.move(Move(start=(3, "C"), end=(4, "D")))
+    replies = book.moves(board)
+    assert [(m.move.start, m.move.end, m.games) for m in replies] == [
+        ((6, "F"), (5, "E"), 2),
+        ((6, "D"), (5, "C"), 1),
+    ]
+
+
+def test_book_returns_nothing_out_of_book(book):
+    board = CheckersBoard.from_ascii()
+    board.move(Move(start=(3, "A"), end=(4, "B")))
+    assert book.moves(board) == []
+    assert book.choose(board) is None
+
+
+def test_weighted_choice_only_picks_book_moves(book):
+    board = CheckersBoard.from_ascii()
+    rng = random.Random(0)
+    choices = {(m.start, m.end) for m in (book.choose(board, rng) for _ in range(50))}
+    assert choices == {((3, "C"), (4, "D")), ((3, "G"), (4, "H"))}
+
+
+def test_min_games_drops_rare_moves(tmp_path):
+    path = str(tmp_path / "opening.book")
+    build(path, iter_games(io.StringIO(ARCHIVE)), min_games=2)
+    with_book = OpeningBook(path)
+    assert len(with_book) == 4
+    with_book.close()
+
+
+def test_computer_player_plays_from_book(book):
+    player = ComputerPlayer("Bot", book=book, max_move_time=0)
+    move = player.choose_move(CheckersBoard.from_ascii())
+    assert (move.start, move.end) == ((3, "C"), (4, "D"))
+
+
+def test_book_rejects_games_of_another_size(tmp_path):
+    path = str(tmp_path / "opening.book")
+    with pytest.raises(ValueError):
+        build(path, iter_games(io.StringIO(ARCHIVE)), dim=10)
+    build(path, iter_games(io.StringIO(ARCHIVE)), dim=8)
+    book = OpeningBook(path)
+    assert book.dim == 8
+    book.close()
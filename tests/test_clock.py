@@ -0,0 +1,50 @@
+from checkers.clock import Clock
+
+
+def test_running_side_is_charged_for_elapsed_time(timer):
+    clock = Clock(("x", "o"), 60, timer=timer)
+    timer.now = 10
+    assert clock.remaining("x") == 50
+    assert clock.remaining("o") == 60
+    assert clock.press() == 50
+    timer.now = 15
+    assert clock.running == "o"
+    assert clock.remaining("o") == 55
+    assert clock.remaining("x") == 50
+
+
+def test_increment_is_added_after_each_move(timer):
+    clock = Clock(("x", "o"), 60, increment=2, timer=timer)
+    timer.now = 10
+    assert clock.press() == 52
+    timer.now = 11
+    assert clock.press(add_increment=False) == 59
+
+
+def test_delay_is_not_charged(timer):
+    clock = Clock(("x", "o"), 60, delay=3, timer=timer)
+    timer.now = 2
+    assert clock.press() == 60
+    timer.now = 7
+    assert clock.press() == 58
+
+
+def test_side_is_flagged_when_time_runs_out(timer):
+    clock = Clock(("x", "o"), 5, increment=10, timer=timer)
+    timer.now = 4
+    assert not clock.is_flagged()
+    timer.now = 6
+    assert clock.is_flagged()
+    assert clock.press() < 0
+
+
+def test_clock_state_round_trips_through_bytes(timer):
+    clock = Clock(("x", "o"), 60, increment=2, delay=1, timer=timer)
+    timer.now += 10
+    clock.press()
+    timer.now += 4
+    restored = Clock.from_bytes(clock.to_bytes(), ("x", "o"), timer=timer)
+    assert restored.running == "o"
+    assert restored.remaining("x") == clock.remaining("x")
+    assert restored.remaining("o") == clock.remaining("o")
+    assert (restored.increment, restored.delay) == (2, 1)
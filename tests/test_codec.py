@@ -0,0 +1,83 @@
+import pytest
+
+from checkers.bitboard import BitboardCheckersBoard
+from checkers.board import CheckersBoard, Move
+from checkers.codec import (
+    decode_game,
+    decode_moves,
+    encode_game,
+    encode_moves,
+    read_varint,
+    write_varint,
+)
+from checkers.game import Game
+from checkers.perft import king_heavy
+from checkers.piece import Black
+from checkers.player import Player
+
+
+@pytest.mark.parametrize("cls", [CheckersBoard, BitboardCheckersBoard])
+def test_position_round_trips_through_bytes(cls):
+    board = cls.from_ascii(king_heavy)
+    board.turn = Black()
+    data = board.to_bytes()
+    assert len(data) == 17
+    decoded = cls.from_bytes(data)
+    assert str(decoded) == str(board)
+    assert decoded.turn == board.turn
+    assert decoded.zobrist_hash == board.zobrist_hash
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_positions_round_trip_through_bytes(seed, random_playout):
+    board = CheckersBoard.from_ascii()
+    list(random_playout(seed, 60, board))
+    assert str(CheckersBoard.from_bytes(board.to_bytes())) == str(board)
+
+
+def test_from_bytes_rejects_malformed_positions():
+    with pytest.raises(ValueError):
+        CheckersBoard.from_bytes(b"\x00" * 16)
+    with pytest.raises(ValueError):
+        CheckersBoard.from_bytes(b"\xff" * 16 + b"\x00")
+
+
+@pytest.mark.parametrize("value", [0, 1, 127, 128, 300, 2**40])
+def test_varint_round_trip(value):
+    out = bytearray()
+    write_varint(value, out)
+    assert read_varint(bytes(out), 0) == (value, len(out))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_moves_round_trip_with_captures(seed, random_playout):
+    moves = list(random_playout(seed, 60))
+    decoded, offset = decode_moves(encode_moves(moves))
+    assert [(m.start, m.end, m.captured) for m in decoded] == [
+        (m.start, m.end, m.captured) for m in moves
+    ]
+
+
+def test_game_record_round_trip(random_playout):
+    board = CheckersBoard.from_ascii()
+    moves = list(random_playout(3, 60, board))
+    data = encode_game(CheckersBoard.from_ascii(), moves)
+    initial, decoded = decode_game(data)
+    initial.apply_many(decoded)
+    assert str(initial) == str(board)
+    assert len(data) < 20 + 4 * len(moves)
+
+
+def test_game_to_bytes_and_back():
+    game = Game(Player("Alice"), Player("Bob"))
+    game.move(Move(start=(3, "A"), end=(4, "B")))
+    game.move(Move(start=(6, "D"), end=(5, "C")))
+    restored = Game.from_bytes(game.to_bytes(), Player("Alice"), Player("Bob"))
+    assert restored.board() == game.board()
+    assert restored._turn.color == game._turn.color
+
+
+def test_game_from_bytes_rejects_illegal_moves():
+    data = encode_game(CheckersBoard.from_ascii(), [Move(start=(3, "A"), end=(5, "C"))])
+    with pytest.raises(ValueError):
+        Game.from_bytes(data, Player("Alice"), Player("Bob"))
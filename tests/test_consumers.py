@@ -0,0 +1,176 @@
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip("channels.testing")
+
+from channels.routing import URLRouter  # noqa: E402
+from channels.testing.websocket import WebsocketCommunicator  # noqa: E402
+
+from checkers.board import MoveDelta  # noqa: E402
+from games import rooms  # noqa: E402
+from games.routing import websocket_urlpatterns  # noqa: E402
+
+application = URLRouter(websocket_urlpatterns)
+
+
+def connect(game_id, color=None):
+    query = f"?color={color}" if color else ""
+    return WebsocketCommunicator(application, f"/ws/games/{game_id}/{query}")
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_connecting_sends_full_board_state():
+    async def scenario():
+        client = connect("state")
+        await client.connect()
+        state = await client.receive_json_from()
+        await client.disconnect()
+        return state
+
+    state = run(scenario())
+    assert state["type"] == "state"
+    assert state["turn"] == "white"
+    assert state["positions"]["21"] == "white"
+    assert state["positions"]["13"] is None
+
+
+def test_moves_are_broadcast_as_deltas():
+    async def scenario():
+        white, black = connect("delta", "white"), connect("delta", "black")
+        for client in (white, black):
+            await client.connect()
+            await client.receive_json_from()
+        await white.send_json_to({"type": "move", "start": [3, "C"], "end": [4, "D"]})
+        updates = [await c.receive_json_from() for c in (white, black)]
+        for client in (white, black):
+            await client.disconnect()
+        return updates
+
+    for update in run(scenario()):
+        assert update == {
+            "type": "delta",
+            "seq": 2,
+            "move": {
+                "from": 22,
+                "to": 18,
+                "color": "white",
+                "captured": [],
+                "promoted": False,
+            },
+            "turn": "black",
+            "winner": None,
+        }
+
+
+def test_deltas_carry_periodic_checksums_and_clients_can_resync():
+    moves = [
+        ([3, "C"], [4, "D"]),
+        ([6, "F"], [5, "E"]),
+        ([4, "D"], [6, "F"]),
+        ([7, "G"], [5, "E"]),
+    ]
+
+    async def scenario():
+        room = rooms.rooms["checksum"] = rooms.GameRoom(
+            "checksum", rooms.get_store(), checksum_interval=5
+        )
+        room.open()
+        white, black = connect("checksum", "white"), connect("checksum", "black")
+        await white.connect()
+        initial = await white.receive_json_from()
+        await black.connect()
+        await black.receive_json_from()
+        updates = []
+        for i, (start, end) in enumerate(moves):
+            mover = white if i % 2 == 0 else black
+            await mover.send_json_to({"type": "move", "start": start, "end": end})
+            updates.append(await white.receive_json_from())
+            await black.receive_json_from()
+        await black.send_json_to({"type": "sync"})
+        state = await black.receive_json_from()
+        for client in (white, black):
+            await client.disconnect()
+        return initial, updates, state
+
+    initial, updates, state = run(scenario())
+    assert [("checksum" in update) for update in updates] == [
+        False,
+        False,
+        False,
+        True,
+    ]
+    assert updates[2]["move"]["captured"] == [15]
+    positions = {int(square): piece for square, piece in initial["positions"].items()}
+    for update in updates:
+        move = update["move"]
+        MoveDelta(move["from"], move["to"], move["color"], move["captured"]).apply(
+            positions
+        )
+    assert updates[-1]["checksum"] == rooms.checksum(positions)
+    assert state["seq"] == 5
+    assert {int(k): v for k, v in state["positions"].items()} == positions
+
+
+def test_out_of_turn_and_illegal_moves_are_rejected():
+    async def scenario():
+        black = connect("errors", "black")
+        white = connect("errors", "white")
+        replies = []
+        for client in (black, white):
+            await client.connect()
+            await client.receive_json_from()
+        await black.send_json_to({"type": "move", "start": [6, "B"], "end": [5, "A"]})
+        replies.append(await black.receive_json_from())
+        await white.send_json_to({"type": "move", "start": [3, "C"], "end": [5, "C"]})
+        replies.append(await white.receive_json_from())
+        for client in (black, white):
+            await client.disconnect()
+        return replies
+
+    not_your_turn, illegal = run(scenario())
+    assert not_your_turn == {"type": "error", "message": "Not your turn"}
+    assert illegal["type"] == "error"
+    game, version = rooms.get_store().load("errors")
+    assert (game.turn.name, version) == ("white", 1)
+
+
+def test_concurrent_joins_wait_for_the_game_to_exist(monkeypatch):
+    class SlowStore(rooms.GameStore):
+        def create(self, *args, **kwargs):
+            time.sleep(0.05)
+            return super().create(*args, **kwargs)
+
+    monkeypatch.setattr(rooms, "_store", SlowStore())
+
+    async def scenario():
+        white, black = connect("race", "white"), connect("race", "black")
+        await asyncio.gather(white.connect(), black.connect())
+        states = [await c.receive_json_from() for c in (white, black)]
+        for client in (white, black):
+            await client.disconnect()
+        return states
+
+    assert [state["type"] for state in run(scenario())] == ["state", "state"]
+    assert "race" not in rooms.rooms
+
+
+def test_each_colour_can_be_claimed_by_one_socket():
+    async def scenario():
+        white, impostor = connect("seats", "white"), connect("seats", "white")
+        await white.connect()
+        await white.receive_json_from()
+        accepted, code = await impostor.connect()
+        await white.disconnect()
+        successor = connect("seats", "white")
+        reclaimed, _ = await successor.connect()
+        await successor.disconnect()
+        return accepted, code, reclaimed
+
+    accepted, code, reclaimed = run(scenario())
+    assert (accepted, code) == (False, 4003)
+    assert reclaimed
@@ -0,0 +1,34 @@
+from checkers.diagonals import diagonal_tables
+
+
+def test_tables_are_built_once_per_dimension():
+    assert diagonal_tables(8) is diagonal_tables(8)
+    assert diagonal_tables(8) is not diagonal_tables(4)
+
+
+def test_rays_stop_at_the_edge_of_the_board():
+    tables = diagonal_tables(4)
+    assert tables.rays[3][0] == ((), (), ((2, 1), (1, 2), (0, 3)), ())
+    assert tables.rays[1][2] == (((2, 3),), ((2, 1), (3, 0)), ((0, 3),), ((0, 1),))
+
+
+def test_jumps_pair_jumped_field_with_landing_field():
+    tables = diagonal_tables(4)
+    assert tables.jumps[3][0] == (((2, 1), (1, 2)),)
+    assert tables.jumps[0][1] == (((1, 2), (2, 3)),)
+
+
+def test_king_segments_list_landings_behind_each_field_of_a_ray():
+    tables = diagonal_tables(4)
+    assert tables.king_segments[3][0][2] == (
+        ((2, 1), ((1, 2), (0, 3))),
+        ((1, 2), ((0, 3),)),
+        ((0, 3), ()),
+    )
+
+
+def test_man_steps_go_forward_only():
+    tables = diagonal_tables(4)
+    assert tables.man_steps["x"][2][1] == ((1, 0), (1, 2))
+    assert tables.man_steps["o"][2][1] == ((3, 0), (3, 2))
+    assert tables.man_steps["x"][0][1] == ()
@@ -0,0 +1,156 @@
+import time
+
+from checkers.bitboard import BitboardCheckersBoard
+from checkers.board import CheckersBoard, Move
+from checkers.engine import SearchEngine, TranspositionTable, evaluate, WIN
+from checkers.game import Game
+from checkers.piece import Black
+from checkers.player import ComputerPlayer, Player
+
+
+def test_initial_position_is_balanced():
+    assert evaluate(BitboardCheckersBoard.from_ascii()) == 0
+
+
+def test_evaluation_is_from_side_to_move_perspective():
+    board = BitboardCheckersBoard.from_ascii(
+        """
+- - 
+ - -
+- -x
+ - -
+""",
+        dim=4,
+    )
+    assert evaluate(board) > 0
+    board.turn = Black()
+    assert evaluate(board) < 0
+
+
+def test_engine_finds_winning_capture():
+    board = CheckersBoard.from_ascii(
+        """
+- - -
+ - - 
+-o-o-
+ - -x
+- - -
+""",
+        dim=5,
+    )
+    result = SearchEngine().search(board, time_budget=1, max_depth=4)
+    assert result.move == Move(start=(2, "E"), end=(2, "A"))
+
+
+def test_engine_scores_forced_win():
+    board = CheckersBoard.from_ascii(
+        """
+- - 
+ -o-
+- - 
+X- -
+""",
+        dim=4,
+    )
+    result = SearchEngine().search(board, time_budget=1, max_depth=4)
+    assert result.move == Move(start=(1, "A"), end=(4, "D"))
+    assert result.score >= WIN - 10
+
+
+def test_engine_avoids_giving_away_a_piece():
+    board = CheckersBoard.from_ascii(
+        """
+- - - - 
+ - - - -
+- - - - 
+ - - -o-
+- - - - 
+ - -x- -
+- - - - 
+ - - - -
+"""
+    )
+    result = SearchEngine().search(board, time_budget=1, max_depth=3)
+    assert result.move == Move(start=(3, "E"), end=(4, "D"))
+
+
+def test_search_does_not_modify_the_board():
+    board = CheckersBoard.from_ascii()
+    before = str(board), board.zobrist_hash
+    SearchEngine().search(board, time_budget=1, max_depth=3)
+    assert (str(board), board.zobrist_hash) == before
+
+
+def test_search_respects_time_budget():
+    start = time.monotonic()
+    result = SearchEngine().search(CheckersBoard.from_ascii(), time_budget=0.05)
+    assert time.monotonic() - start < 1
+    assert result.move in CheckersBoard.from_ascii().legal_moves(
+        CheckersBoard.from_ascii().turn
+    )
+
+
+def test_transposition_table_size_is_bounded():
+    table = TranspositionTable(size=1000)
+    assert len(table) == 1024
+    for key in range(5000):
+        table.put(key, depth=1, score=key, flag=0, move=None)
+    assert table.get(4999) == (1, 4999, 0, None)
+    assert table.get(3) is None
+
+
+def test_mate_scores_are_stored_relative_to_the_node():
+    engine = SearchEngine()
+    board = BitboardCheckersBoard.from_ascii(
+        """
+- - 
+ -o-
+- - 
+X- -
+""",
+        dim=4,
+    )
+    score = engine._negamax(board, 4, -WIN - 1, WIN + 1, 3, set())
+    depth, stored, flag, move = engine.table.get(board.zobrist_hash)
+    assert score >= WIN - 10
+    assert stored == score + 3
+    assert engine._negamax(board, 4, -WIN - 1, WIN + 1, 7, set()) == score - 4
+
+
+def test_repetitions_on_the_path_are_not_stored():
+    engine = SearchEngine()
+    board = BitboardCheckersBoard.from_ascii(
+        """
+- - 
+ - -
+- -o
+X- -
+""",
+        dim=4,
+    )
+    path = set()
+    for move in board.legal_moves(board.turn):
+        record = board.make_move(move)
+        path.add(board.zobrist_hash)
+        board.unmake_move(record)
+    assert engine._negamax(board, 1, -WIN - 1, WIN + 1, 1, path) == 0
+    assert engine.table.get(board.zobrist_hash) is None
+
+
+def test_computer_players_can_play_a_game():
+    white = ComputerPlayer("Bot 1", max_depth=2, max_move_time=0.5)
+    black = ComputerPlayer("Bot 2", max_depth=1, max_move_time=0.5)
+    game = Game(white, black, playing_time=100)
+    winner = None
+    for _ in range(20):
+        winner = game.play_computer_move()
+        if winner:
+            break
+    assert len(game._moves) > 0
+
+
+def test_time_budget_follows_remaining_time():
+    bot = ComputerPlayer("Bot", max_move_time=10, moves_to_go=20)
+    assert bot.time_budget() == 10
+    Game(bot, Player("Alice"), playing_time=1)
+    assert bot.time_budget() == 3
@@ -267,3 +267,79 @@ def test_player_can_not_undo_move_if_the_game_ended(board, dim, moves, expected)
 
     with pytest.raises(ValueError):
         g.undo()
+
+
+def test_game_can_replay_a_move_list():
+    player_1 = Player("Alice")
+    player_2 = Player("Bob")
+    g = Game(player_1, player_2)
+    moves = [
+        Move(start=(3, "C"), end=(4, "D")),
+        Move(start=(6, "B"), end=(5, "A")),
+        Move(start=(2, "D"), end=(3, "C")),
+    ]
+
+    assert g.replay(moves) is None
+
+    assert g._moves == moves
+    with pytest.raises(ValueError):
+        g.move(Move(start=(3, "A"), end=(4, "B")))
+    g.undo()
+    g.undo()
+    g.move(Move(start=(6, "B"), end=(5, "A")))
+
+
+def test_replay_stops_at_first_illegal_move():
+    player_1 = Player("Alice")
+    player_2 = Player("Bob")
+    g = Game(player_1, player_2)
+    moves = [
+        Move(start=(3, "C"), end=(4, "D")),
+        Move(start=(3, "A"), end=(4, "B")),
+    ]
+
+    assert g.replay(moves) == 1
+
+    assert len(g._moves) == 1
+    g.move(Move(start=(6, "B"), end=(5, "A")))
+
+
+@pytest.mark.parametrize("board,dim,move", player_1_win_data)
+def test_replay_detects_winning_move(board, dim, move):
+    player_1 = Player("Alice")
+    player_2 = Player("Bob")
+    board = CheckersBoard.from_ascii(board, dim=dim)
+    g = Game(player_1, player_2, board=board)
+
+    assert g.replay([move]) is None
+
+    assert g.move(Move(start=(1, "A"), end=(2, "B"))).player is player_1
+
+
+def test_increment_extends_remaining_time():
+    player_1 = Player("Alice")
+    player_2 = Player("Bob")
+    g = Game(player_1, player_2, playing_time=1, increment=5)
+
+    g.move(Move(start=(3, "A"), end=(4, "B")))
+
+    assert 1 * SECS < player_1.remaining_time <= 1 * SECS + 5
+
+
+def test_game_state_round_trips_with_clock_and_players():
+    game = Game(Player("Alice"), Player("Bob"), increment=2)
+    game.move(Move(start=(3, "A"), end=(4, "B")))
+    restored = Game.from_state(game.to_state())
+    assert restored.board() == game.board()
+    assert restored.turn == game.turn
+    assert [p.name for p in restored._players] == ["Alice", "Bob"]
+    assert restored._clock.to_bytes() == game._clock.to_bytes()
+
+
+def test_game_state_keeps_win_on_time(timer):
+    game = Game(Player("Alice"), Player("Bob"), playing_time=1, timer=timer)
+    timer.now += 2 * SECS
+    assert game.move(Move(start=(3, "A"), end=(4, "B"))).player.name == "Bob"
+    restored = Game.from_state(game.to_state(), timer=timer)
+    assert restored.winner.name == "Bob"
+    assert restored.moves == []
@@ -0,0 +1,63 @@
+import pytest
+
+from checkers import instrumentation
+from checkers.board import CheckersBoard, Move
+from checkers.game import Game
+from checkers.player import Player
+
+CAPTURE_CHAIN = """
+- - - - 
+ - - - -
+- -o- - 
+ - - - -
+- -o- - 
+ -x- - -
+- - - - 
+ - - - -
+"""
+
+
+@pytest.fixture
+def metrics():
+    metrics = instrumentation.enable()
+    yield metrics
+    instrumentation.disable()
+
+
+def test_disabled_instrumentation_leaves_methods_untouched():
+    original = CheckersBoard.__dict__["_possible_moves"]
+    instrumentation.enable()
+    assert CheckersBoard.__dict__["_possible_moves"] is not original
+    instrumentation.disable()
+    assert CheckersBoard.__dict__["_possible_moves"] is original
+    assert instrumentation.get_metrics() is None
+
+
+def test_counts_and_times_hot_path(metrics):
+    game = Game(Player("white"), Player("black"))
+    game.move(Move((3, "C"), (4, "D")))
+    snapshot = metrics.snapshot()
+    assert snapshot["calls"]["Game.move"] == 1
+    assert snapshot["calls"]["CheckersBoard.make_move"] == 1
+    assert snapshot["calls"]["CheckersBoard._generate_legal_moves"] >= 1
+    assert snapshot["calls"]["CheckersBoard._possible_moves"] >= 12
+    assert all(seconds >= 0 for seconds in snapshot["seconds"].values())
+
+
+def test_tracks_capture_recursion(metrics):
+    board = CheckersBoard.from_ascii(CAPTURE_CHAIN)
+    moves = board.legal_moves(board.turn)
+    assert [len(m.captured) for m in moves] == [2]
+    snapshot = metrics.snapshot()
+    assert snapshot["calls"]["CheckersBoard._get_moves_with_max_capture"] == 1
+    assert snapshot["capture_max_depth"] == 3
+    assert snapshot["capture_nodes"] >= 3
+
+
+def test_exports_prometheus_text(metrics):
+    CheckersBoard.from_ascii().legal_moves(CheckersBoard.from_ascii().turn)
+    text = metrics.to_prometheus()
+    assert 'checkers_calls_total{function="CheckersBoard._possible_moves"} 12' in text
+    assert "# TYPE checkers_capture_max_depth gauge" in text
+    metrics.reset()
+    assert metrics.snapshot()["calls"] == {}
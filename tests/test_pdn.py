@@ -0,0 +1,167 @@
+import io
+
+import pytest
+
+from checkers.board import CheckersBoard, Move
+from checkers.game import Game
+from checkers.pdn import (
+    INVALID_SETUP,
+    PDNGame,
+    board_from_fen,
+    board_to_fen,
+    format_game,
+    format_move,
+    iter_games,
+    parse_move,
+    validate_games,
+    write_games,
+)
+from checkers.perft import king_heavy
+from checkers.piece import Black
+from checkers.player import Player
+
+PDN = """[Event "Club"]
+[White "Alice"]
+[Black "Bob"]
+
+1. 22-18 {a comment
+spanning lines} 11-15 (1... 10-14 2. 18-15) 2. 18x11 8x15 1-0
+
+[Event "Short"]
+
+1. 24-20 *
+"""
+
+
+AMBIGUOUS_CAPTURE = """
+- - - - 
+ -X- - -
+- -o-o- 
+ - - - -
+- - - - 
+ -o-o- -
+- - -o- 
+ - - - -
+"""
+
+
+def test_parses_tags_moves_and_results():
+    first, second = iter_games(io.StringIO(PDN))
+    assert first.tags == {"Event": "Club", "White": "Alice", "Black": "Bob"}
+    assert [(m.start, m.end) for m in first.moves] == [
+        ((3, "C"), (4, "D")),
+        ((6, "F"), (5, "E")),
+        ((4, "D"), (6, "F")),
+        ((7, "G"), (5, "E")),
+    ]
+    assert first.result == "1-0"
+    assert second.tags == {"Event": "Short"}
+    assert second.result == "*"
+
+
+def test_parser_streams_games_lazily():
+    def lines():
+        yield from io.StringIO(PDN)
+        raise AssertionError("read past the first games")
+
+    games = iter_games(lines())
+    assert next(games).tags["Event"] == "Club"
+    assert next(games).tags["Event"] == "Short"
+
+
+def test_multi_jump_keeps_the_capture_path():
+    move = parse_move("9x18x27")
+    assert (move.start, move.end) == (parse_move("9-27").start, (2, "F"))
+    assert move.path == [(6, "B"), (4, "D"), (2, "F")]
+
+
+def test_capture_path_selects_between_equal_endpoints():
+    board = CheckersBoard.from_ascii(AMBIGUOUS_CAPTURE)
+    moves = board.legal_moves(board.turn)
+    assert len({format_move(move) for move in moves}) == len(moves)
+    for move in moves:
+        parsed = parse_move(format_move(move))
+        restored = CheckersBoard.from_ascii(AMBIGUOUS_CAPTURE)
+        record = restored.make_move(parsed)
+        assert record.move.captured == move.captured
+
+
+def test_game_without_result_ends_at_next_tag_section():
+    text = '[Event "a"]\n1. 22-18 11-15\n[Event "b"]\n1. 22-18 *\n'
+    first, second = iter_games(io.StringIO(text))
+    assert (first.tags["Event"], len(first.moves)) == ("a", 2)
+    assert (second.tags["Event"], len(second.moves)) == ("b", 1)
+
+
+def test_parser_accepts_attached_move_numbers_and_tag_lines():
+    text = '[Event "x"] [Round "2"]\n1.22-18 11-15 2.18x11 8x15 1-0\n'
+    (game,) = iter_games(io.StringIO(text))
+    assert game.tags == {"Event": "x", "Round": "2"}
+    assert len(game.moves) == 4
+
+
+def test_parser_skips_malformed_games():
+    text = '[Event "bad"]\n1. 22-40 11-15 1-0\n[Event "good"]\n1. 22-18 *\n'
+    (game,) = iter_games(io.StringIO(text))
+    assert game.tags["Event"] == "good"
+
+
+def test_invalid_move_raises_value_error():
+    with pytest.raises(ValueError):
+        parse_move("22-40")
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_random_games_round_trip(seed, random_playout):
+    game = PDNGame({"Event": "Random"}, list(random_playout(seed, 40)), "*")
+    stream = io.StringIO()
+    write_games([game, game], stream)
+    parsed = list(iter_games(io.StringIO(stream.getvalue())))
+    assert len(parsed) == 2
+    assert parsed[0].moves == game.moves
+    assert [result for _, result in validate_games(parsed)] == [None, None]
+
+
+def test_fen_round_trip():
+    board = CheckersBoard.from_ascii(king_heavy)
+    board.turn = Black()
+    restored = board_from_fen(board_to_fen(board))
+    assert str(restored) == str(board)
+    assert restored.turn == board.turn
+
+
+def test_from_game_records_setup_position():
+    game = Game(
+        Player("Alice"), Player("Bob"), board=CheckersBoard.from_ascii(king_heavy)
+    )
+    game.move(Move(start=(6, "B"), end=(5, "C")))
+    text = format_game(PDNGame.from_game(game, {"Event": "Casual"}))
+    (parsed,) = iter_games(io.StringIO(text))
+    assert "FEN" in parsed.tags
+    assert str(parsed.board()) == str(CheckersBoard.from_ascii(king_heavy))
+
+
+def test_validation_reports_first_illegal_move():
+    game = PDNGame(moves=[parse_move("22-18"), parse_move("18-14")])
+    assert list(validate_games([game])) == [(game, 1)]
+
+
+def test_validation_in_worker_processes(random_playout):
+    games = [PDNGame(moves=list(random_playout(seed, 40))) for seed in range(4)]
+    games.append(PDNGame(moves=[parse_move("22-13")]))
+    results = [result for _, result in validate_games(games, processes=2, batch=3)]
+    assert results == [None, None, None, None, 0]
+
+
+def test_parser_skips_games_with_invalid_setup():
+    text = '[FEN "W:W33:B1"]\n1. 22-18 *\n[Event "good"]\n1. 22-18 *\n'
+    (game,) = iter_games(io.StringIO(text))
+    assert game.tags == {"Event": "good"}
+    for fen in ("W:W33:B1", "W:Wx:B1", "W:WQ5:B1"):
+        with pytest.raises(ValueError):
+            board_from_fen(fen)
+    bad = PDNGame({"FEN": "W:W33:B1"}, [parse_move("22-18")])
+    assert [result for _, result in validate_games([bad, game])] == [
+        INVALID_SETUP,
+        None,
+    ]
@@ -0,0 +1,22 @@
+import pytest
+
+from checkers.bitboard import BitboardCheckersBoard
+from checkers.board import CheckersBoard
+from checkers.perft import perft, divide, POSITIONS, REFERENCE_NODE_COUNTS
+
+
+@pytest.mark.parametrize("board_cls", [CheckersBoard, BitboardCheckersBoard])
+@pytest.mark.parametrize("position", POSITIONS)
+def test_perft_matches_reference_node_counts(board_cls, position):
+    board = board_cls.from_ascii(POSITIONS[position])
+    before = str(board), board.zobrist_hash
+    for depth, expected in enumerate(REFERENCE_NODE_COUNTS[position][:4], start=1):
+        assert perft(board, depth) == expected
+    assert (str(board), board.zobrist_hash) == before
+
+
+def test_divide_sums_up_to_perft():
+    board = BitboardCheckersBoard.from_ascii(POSITIONS["midgame"])
+    counts = divide(board, 3)
+    assert len(counts) == REFERENCE_NODE_COUNTS["midgame"][0]
+    assert sum(counts.values()) == REFERENCE_NODE_COUNTS["midgame"][2]
@@ -0,0 +1,103 @@
+import pytest
+
+pytest.importorskip("django")
+
+from django.core.management import call_command  # noqa: E402
+
+from checkers.board import Move  # noqa: E402
+from checkers.game import Game  # noqa: E402
+from checkers.player import Player  # noqa: E402
+from games.models import GameRecord, MoveRecord  # noqa: E402
+from games.persistence import WriteBehindQueue  # noqa: E402
+
+
+@pytest.fixture(scope="module", autouse=True)
+def database():
+    call_command("migrate", "games", verbosity=0)
+
+
+@pytest.fixture
+def recorder():
+    GameRecord.objects.all().delete()
+    recorder = WriteBehindQueue(batch_size=3, flush_interval=0.05)
+    yield recorder
+    recorder.close()
+
+
+def finished_game(white="Alice", black="Bob"):
+    game = Game(Player(white), Player(black))
+    for start, end in [
+        ((3, "C"), (4, "D")),
+        ((6, "F"), (5, "E")),
+        ((4, "D"), (6, "F")),
+    ]:
+        game.move(Move(start=start, end=end))
+    return game
+
+
+def test_submitted_games_are_written_in_bulk(recorder):
+    for i in range(7):
+        recorder.submit(finished_game(white=f"Alice {i}"))
+    recorder.flush()
+    assert GameRecord.objects.count() == 7
+    assert MoveRecord.objects.count() == 21
+    stored = GameRecord.objects.get(white="Alice 3")
+    assert (stored.black, stored.result, stored.plies) == ("Bob", "1/2-1/2", 3)
+    assert [(m.ply, m.start, m.end, m.captures) for m in stored.moves.all()] == [
+        (0, 22, 18, 0),
+        (1, 11, 15, 0),
+        (2, 18, 11, 1),
+    ]
+    restored = Game.from_bytes(bytes(stored.record), Player("a"), Player("b"))
+    assert restored.board() == finished_game().board()
+
+
+def test_winner_is_recorded_as_result(recorder):
+    game = finished_game()
+    game._winner = game.players[0]
+    recorder.submit(game)
+    recorder.flush()
+    assert GameRecord.objects.get().result == "1-0"
+
+
+def test_close_drains_pending_games():
+    GameRecord.objects.all().delete()
+    recorder = WriteBehindQueue(batch_size=100, flush_interval=60)
+    recorder.submit(finished_game())
+    recorder.close()
+    assert GameRecord.objects.count() == 1
+
+
+class FlakyQueue(WriteBehindQueue):
+    failures = 2
+
+    def _write(self, batch):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("database unavailable")
+        super()._write(batch)
+
+
+def test_failed_batches_are_retried():
+    GameRecord.objects.all().delete()
+    recorder = FlakyQueue(flush_interval=0.01, retry_delay=0.01)
+    recorder.submit(finished_game())
+    recorder.close()
+    assert recorder.failures == 0
+    assert GameRecord.objects.count() == 1
+
+
+def test_rooms_record_wins_on_time(monkeypatch, timer):
+    from games import rooms
+    from games.store import GameStore
+
+    GameRecord.objects.all().delete()
+    recorder = WriteBehindQueue(flush_interval=0.01)
+    monkeypatch.setattr(rooms, "get_recorder", lambda: recorder)
+    room = rooms.GameRoom("timeout", GameStore(timer=timer))
+    room.open()
+    timer.now += 11 * 60
+    update = room.apply([3, "C"], [4, "D"], "white")
+    recorder.close()
+    assert (update["move"], update["winner"]) == (None, "black")
+    assert GameRecord.objects.get().result == "0-1"
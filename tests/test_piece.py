@@ -0,0 +1,58 @@
+import pickle
+
+import pytest
+
+from checkers.board import CheckersBoard
+from checkers.piece import (
+    AccessibleField,
+    Black,
+    FlyingKing,
+    Man,
+    White,
+    char_to_piece,
+    WHITE,
+    BLACK,
+    ACCESSIBLE_FIELD,
+)
+
+
+def test_fields_and_colors_are_interned():
+    assert AccessibleField() is ACCESSIBLE_FIELD
+    assert White() is WHITE
+    assert Black() is BLACK
+    assert WHITE != BLACK
+
+
+def test_pieces_are_shared_per_kind_and_color():
+    assert Man(White()) is Man(WHITE) is char_to_piece["x"]
+    assert FlyingKing(BLACK) is char_to_piece["O"]
+    assert Man(WHITE) is not FlyingKing(WHITE)
+    assert Man(WHITE) is not Man(BLACK)
+
+
+def test_pieces_are_immutable_and_slotted():
+    piece = Man(WHITE)
+    with pytest.raises(AttributeError):
+        piece.color = BLACK
+    assert not hasattr(piece, "__dict__")
+    assert not hasattr(ACCESSIBLE_FIELD, "__dict__")
+
+
+def test_pickling_preserves_identity():
+    for obj in (Man(WHITE), FlyingKing(BLACK), WHITE, ACCESSIBLE_FIELD):
+        assert pickle.loads(pickle.dumps(obj)) is obj
+
+
+def test_board_shares_piece_instances():
+    board = CheckersBoard.from_ascii("""
+-o-o-o-o
+o-o-o-o-
+-o-o-o-o
+ - - - -
+- - - - 
+x-x-x-x-
+-x-x-x-x
+x-x-x-x-
+""")
+    assert board[1, "A"] is board[3, "C"] is Man(WHITE)
+    assert board[4, "B"] is ACCESSIBLE_FIELD
@@ -0,0 +1,103 @@
+import pytest
+
+from checkers.board import CheckersBoard, Move
+from checkers.codec import encode_game
+from checkers.positionindex import PositionIndex, build
+
+OPENINGS = {
+    1: [((3, "G"), (4, "H")), ((6, "B"), (5, "A")), ((3, "C"), (4, "D"))],
+    2: [((3, "C"), (4, "D")), ((6, "B"), (5, "A")), ((3, "G"), (4, "H"))],
+    3: [((3, "C"), (4, "D")), ((6, "F"), (5, "E"))],
+    4: [((3, "C"), (4, "D")), ((6, "B"), (5, "A")), ((4, "D"), (5, "C"))],
+}
+
+SHUFFLE = """
+-O- - - 
+ - - - -
+- - - - 
+ - - - -
+- - - - 
+ - - - -
+- - - - 
+X- - - -
+"""
+
+
+def record(moves):
+    return encode_game(
+        CheckersBoard.from_ascii(), [Move(start, end) for start, end in moves]
+    )
+
+
+def position(moves):
+    board = CheckersBoard.from_ascii()
+    for start, end in moves:
+        board.move(Move(start, end))
+    return board
+
+
+@pytest.fixture(params=[1 << 20, 3])
+def index(tmp_path, request):
+    path = str(tmp_path / "games.index")
+    games = ((game_id, record(moves)) for game_id, moves in OPENINGS.items())
+    assert build(path, games, chunk_size=request.param) == 15
+    with PositionIndex(path) as index:
+        yield index
+
+
+def test_index_finds_games_reaching_a_position(index):
+    assert sorted(index.games(CheckersBoard.from_ascii())) == [1, 2, 3, 4]
+    assert sorted(index.games(position(OPENINGS[3][:2]))) == [3]
+    assert len(index.games(CheckersBoard.from_ascii(), limit=2)) == 2
+
+
+def test_index_follows_transpositions(index):
+    assert sorted(index.games(position(OPENINGS[1]))) == [1, 2]
+    assert sorted(index.occurrences(position(OPENINGS[1]))) == [(1, 3), (2, 3)]
+
+
+def test_index_counts_next_moves(index):
+    moves = index.next_moves(CheckersBoard.from_ascii())
+    assert [(m.move.start, m.move.end, m.games) for m in moves] == [
+        ((3, "C"), (4, "D"), 3),
+        ((3, "G"), (4, "H"), 1),
+    ]
+    assert index.next_moves(position(OPENINGS[1])) == []
+
+
+def test_index_misses_unknown_positions(index):
+    board = position([((3, "A"), (4, "B"))])
+    assert index.games(board) == []
+    assert index.next_moves(board) == []
+
+
+def test_repeated_positions_count_each_game_once(tmp_path):
+    board = CheckersBoard.from_ascii(SHUFFLE)
+    shuffle = [
+        Move((1, "A"), (2, "B")),
+        Move((8, "B"), (7, "A")),
+        Move((2, "B"), (1, "A")),
+        Move((7, "A"), (8, "B")),
+        Move((1, "A"), (2, "B")),
+    ]
+    path = str(tmp_path / "games.index")
+    build(path, [(7, encode_game(board, shuffle))])
+    with PositionIndex(path) as index:
+        assert index.games(board) == [7]
+        assert sorted(index.occurrences(board)) == [(7, 0), (7, 4)]
+        (move,) = index.next_moves(board)
+        assert (move.move.start, move.move.end, move.games) == ((1, "A"), (2, "B"), 1)
+
+
+def test_limited_lookups_stop_reading_early(index):
+    read = []
+    get_all = index._occurrences.get_all
+
+    def counting(key):
+        for record in get_all(key):
+            read.append(record)
+            yield record
+
+    index._occurrences.get_all = counting
+    assert len(index.games(CheckersBoard.from_ascii(), limit=2)) == 2
+    assert len(read) == 2
@@ -0,0 +1,33 @@
+import io
+
+from checkers.codec import read_records, write_record
+from checkers.game import Game
+from checkers.player import Player
+from checkers.selfplay import play_game, run
+
+OPTIONS = dict(max_depth=1, move_time=5.0, max_plies=40)
+
+
+def test_records_are_length_prefixed():
+    stream = io.BytesIO()
+    for data in (b"", b"a", b"x" * 300):
+        write_record(stream, data)
+    stream.seek(0)
+    assert list(read_records(stream)) == [b"", b"a", b"x" * 300]
+
+
+def test_self_play_is_reproducible_per_seed():
+    assert play_game(7, **OPTIONS) == play_game(7, **OPTIONS)
+    assert play_game(7, **OPTIONS) != play_game(8, **OPTIONS)
+
+
+def test_self_play_records_replay_as_games():
+    record, result = play_game(3, **OPTIONS)
+    game = Game.from_bytes(record, Player("white"), Player("black"))
+    assert 0 < len(game._moves) <= OPTIONS["max_plies"]
+    assert result in ("1-0", "0-1", "1/2-1/2")
+
+
+def test_parallel_run_matches_serial_games():
+    records = list(run(3, workers=2, seed=10, **OPTIONS))
+    assert records == [play_game(seed, **OPTIONS) for seed in range(10, 13)]
@@ -0,0 +1,124 @@
+import pytest
+
+pytest.importorskip("redis")
+
+from checkers.board import Move  # noqa: E402
+from games.store import ConflictError, GameStore, InMemoryBackend  # noqa: E402
+
+
+def test_created_game_round_trips_through_store(timer):
+    store = GameStore(timer=timer)
+    store.create("g1", "Alice", "Bob", playing_time=1, increment=2)
+    game, version = store.load("g1")
+    assert version == 1
+    assert game.turn.name == "white"
+    assert [player.name for player in game._players] == ["Alice", "Bob"]
+    with pytest.raises(ConflictError):
+        store.create("g1", "Carol", "Dave")
+    with pytest.raises(KeyError):
+        store.load("missing")
+
+
+def test_moves_and_clock_are_persisted_between_workers(timer):
+    backend = InMemoryBackend()
+    first, second = GameStore(backend, timer=timer), GameStore(backend, timer=timer)
+    first.create("g1", "Alice", "Bob", playing_time=1, increment=2)
+    timer.now += 10
+    first.move("g1", Move(start=(3, "C"), end=(4, "D")))
+    timer.now += 5
+    game, version = second.move("g1", Move(start=(6, "F"), end=(5, "E")))
+    assert version == 3
+    assert len(game.moves) == 2
+    assert game._clock.remaining("x") == pytest.approx(60 - 10 + 2)
+    assert game._clock.remaining("o") == pytest.approx(60 - 5 + 2)
+    timer.now += 3
+    game, _ = first.load("g1")
+    assert game._clock.remaining("x") == pytest.approx(60 - 10 + 2 - 3)
+
+
+def test_stale_writes_are_rejected():
+    backend = InMemoryBackend()
+    store = GameStore(backend)
+    store.create("g1", "Alice", "Bob")
+    game, version = store.load("g1")
+    stale, _ = store.load("g1")
+    game.move(Move(start=(3, "C"), end=(4, "D")))
+    assert backend.compare_and_set("game:g1", game.to_state(), version)
+    stale.move(Move(start=(3, "A"), end=(4, "B")))
+    assert not backend.compare_and_set("game:g1", stale.to_state(), version)
+
+
+def test_update_retries_on_conflict_then_gives_up():
+    backend = InMemoryBackend()
+    store = GameStore(backend, retries=3)
+    store.create("g1", "Alice", "Bob")
+    attempts = []
+
+    def interfere(game):
+        attempts.append(game)
+        state, version = backend.get("game:g1")
+        backend.compare_and_set("game:g1", state, version)
+
+    with pytest.raises(ConflictError):
+        store.update("g1", interfere)
+    assert len(attempts) == 3
+
+    conflicts = []
+
+    def interfere_once(game):
+        if not conflicts:
+            conflicts.append(game)
+            interfere(game)
+        game.move(Move(start=(3, "C"), end=(4, "D")))
+
+    game, version = store.update("g1", interfere_once)
+    assert version == 6
+    assert len(game.moves) == 1
+
+
+def test_illegal_moves_leave_stored_state_untouched():
+    store = GameStore()
+    store.create("g1", "Alice", "Bob")
+    with pytest.raises(TypeError):
+        store.move("g1", Move(start=(4, "B"), end=(5, "C")))
+    assert store.load("g1")[1] == 1
+
+
+def test_win_on_time_survives_reload(timer):
+    store = GameStore(timer=timer)
+    store.create("g1", "Alice", "Bob", playing_time=1)
+    timer.now += 61
+    store.move("g1", Move(start=(3, "C"), end=(4, "D")))
+    game, version = store.load("g1")
+    assert game.winner.name == "Bob"
+    assert version == 2
+
+
+def test_keys_expire_sooner_once_a_game_is_decided(timer):
+    store = GameStore(
+        InMemoryBackend(timer=timer), timer=timer, ttl=100, finished_ttl=10
+    )
+    store.create("idle", "Alice", "Bob")
+    store.create("g1", "Alice", "Bob", playing_time=1)
+    timer.now += 61
+    store.move("g1", Move(start=(3, "C"), end=(4, "D")))
+    timer.now += 10
+    with pytest.raises(KeyError):
+        store.load("g1")
+    store.load("idle")
+    timer.now += 30
+    with pytest.raises(KeyError):
+        store.load("idle")
+
+
+def test_loading_does_not_replay_the_game(monkeypatch):
+    store = GameStore()
+    store.create("g1", "Alice", "Bob")
+    store.move("g1", Move(start=(3, "C"), end=(4, "D")))
+    monkeypatch.setattr(
+        "checkers.board.Board.apply_many", lambda *args, **kwargs: 1 / 0
+    )
+    game, _ = store.load("g1")
+    assert game.turn.name == "black"
+    assert len(game.moves) == 1
+    assert game.to_checkers_notation()[18] == "white"
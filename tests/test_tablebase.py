@@ -0,0 +1,123 @@
+import random
+
+import pytest
+
+from checkers.bitboard import BitboardCheckersBoard
+from checkers.engine import SearchEngine, WIN
+from checkers.mmaptable import MmapTable
+from checkers.tablebase import DRAW, LOSS, WIN as TB_WIN, Tablebase, build, positions
+
+
+@pytest.fixture(scope="module")
+def tablebase(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("tb") / "dim4.tb")
+    build(path, dim=4, max_pieces=3)
+    tablebase = Tablebase(path)
+    yield tablebase
+    tablebase.close()
+
+
+def test_mmap_table_looks_up_sorted_records(tmp_path):
+    path = str(tmp_path / "table")
+    MmapTable.write(path, b"TEST", "H", [(5, 50), (1, 10), (5, 51), (3, 30)])
+    with MmapTable(path, b"TEST", "H") as table:
+        assert len(table) == 4
+        assert table.get(3) == (30,)
+        assert table.get(4) is None
+        assert sorted(table.get_all(5)) == [(50,), (51,)]
+        assert [record[0] for record in table] == [1, 3, 5, 5]
+    with pytest.raises(ValueError):
+        MmapTable(path, b"NOPE", "H")
+
+
+def test_mmap_table_merges_sorted_chunks(tmp_path):
+    path = str(tmp_path / "table")
+    records = [(key % 7, key) for key in range(50)]
+    assert MmapTable.write_external(path, b"TEST", "H", records, chunk_size=8) == 50
+    with MmapTable(path, b"TEST", "H") as table:
+        assert [record[0] for record in table] == sorted(key % 7 for key in range(50))
+        assert sorted(table.get_all(3)) == [(key,) for key in range(3, 50, 7)]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["table"]
+
+
+def test_tablebase_records_dimensions(tablebase):
+    assert (tablebase.dim, tablebase.max_pieces) == (4, 3)
+    assert len(tablebase) == sum(1 for _ in positions(4, 3))
+
+
+def test_side_without_moves_has_lost(tablebase):
+    board = BitboardCheckersBoard.from_ascii(
+        """
+- - 
+ -o-
+-o- 
+x- -
+""",
+        dim=4,
+    )
+    entry = tablebase.probe(board)
+    assert (entry.result, entry.distance) == (LOSS, 0)
+
+
+def test_immediate_capture_is_a_win_in_one(tablebase):
+    board = BitboardCheckersBoard.from_ascii(
+        """
+- - 
+ - -
+-o- 
+x- -
+""",
+        dim=4,
+    )
+    entry = tablebase.probe(board)
+    assert (entry.result, entry.distance) == (TB_WIN, 1)
+
+
+def test_distances_are_consistent_with_successors(tablebase):
+    boards = list(positions(4, 3))
+    for board in random.Random(0).sample(boards, 200):
+        entry = tablebase.probe(board)
+        children = []
+        for move in board.legal_moves(board.turn):
+            record = board.make_move(move)
+            children.append(tablebase.probe(board))
+            board.unmake_move(record)
+        if entry.result == TB_WIN:
+            assert any(
+                c.result == LOSS and c.distance == entry.distance - 1 for c in children
+            )
+        elif entry.result == LOSS:
+            assert all(c.result == TB_WIN for c in children)
+            assert max((c.distance for c in children), default=-1) == (
+                entry.distance - 1
+            )
+        else:
+            assert entry.result == DRAW
+            assert not any(c.result == LOSS for c in children)
+
+
+def test_probe_skips_positions_with_too_many_pieces(tablebase):
+    board = BitboardCheckersBoard.from_ascii(
+        """
+-o-o
+ - -
+- - 
+x-x-
+""",
+        dim=4,
+    )
+    assert tablebase.probe(board) is None
+
+
+def test_engine_uses_tablebase_scores(tablebase):
+    board = BitboardCheckersBoard.from_ascii(
+        """
+- - 
+ - -
+-o- 
+x- -
+""",
+        dim=4,
+    )
+    result = SearchEngine(tablebase=tablebase).search(board, 5, max_depth=3)
+    assert result.score >= WIN - 10
@@ -0,0 +1,62 @@
+import pytest
+
+from checkers.bitboard import BitboardCheckersBoard
+from checkers.board import CheckersBoard, Move
+from checkers.piece import Black, White
+from checkers.zobrist import zobrist_keys
+
+
+def full_hash(board):
+    fresh = type(board).from_ascii(str(board), dim=board.dim)
+    fresh.turn = board.turn
+    return fresh.zobrist_hash
+
+
+def test_keys_are_reproducible():
+    assert zobrist_keys(8).pieces["x"][1] == zobrist_keys(8).pieces["x"][1]
+    assert zobrist_keys(8).black_to_move != zobrist_keys(4).black_to_move
+
+
+@pytest.mark.parametrize("board_cls", [CheckersBoard, BitboardCheckersBoard])
+def test_transpositions_have_the_same_hash(board_cls):
+    first = board_cls.from_ascii()
+    second = board_cls.from_ascii()
+    for move in [
+        Move(start=(3, "A"), end=(4, "B")),
+        Move(start=(6, "B"), end=(5, "A")),
+        Move(start=(3, "C"), end=(4, "D")),
+    ]:
+        first.move(move)
+    for move in [
+        Move(start=(3, "C"), end=(4, "D")),
+        Move(start=(6, "B"), end=(5, "A")),
+        Move(start=(3, "A"), end=(4, "B")),
+    ]:
+        second.move(move)
+    assert first.zobrist_hash == second.zobrist_hash
+    assert first.zobrist_hash != board_cls.from_ascii().zobrist_hash
+
+
+@pytest.mark.parametrize("board_cls", [CheckersBoard, BitboardCheckersBoard])
+def test_side_to_move_changes_hash(board_cls):
+    board = board_cls.from_ascii()
+    white_to_move = board.zobrist_hash
+    board.turn = Black()
+    assert board.zobrist_hash != white_to_move
+    board.turn = White()
+    assert board.zobrist_hash == white_to_move
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_incremental_hash_matches_full_hash(seed, random_playout):
+    board = CheckersBoard.from_ascii()
+    bitboard = BitboardCheckersBoard.from_ascii()
+    records = []
+    for move in random_playout(seed, 100):
+        records.append((board.zobrist_hash, board.make_move(move)))
+        bitboard.make_move(move)
+        assert board.zobrist_hash == full_hash(board)
+        assert bitboard.zobrist_hash == board.zobrist_hash
+    for zobrist_hash, record in reversed(records):
+        board.unmake_move(record)
+        assert board.zobrist_hash == zobrist_hash